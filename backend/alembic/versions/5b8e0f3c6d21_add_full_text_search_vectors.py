@@ -0,0 +1,81 @@
+"""add full text search vectors
+
+Revision ID: 5b8e0f3c6d21
+Revises: a41c7e2d9b10
+Create Date: 2026-01-17 15:03:27.540912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e0f3c6d21'
+down_revision: Union[str, None] = 'a41c7e2d9b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('wishlists', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.add_column('wishlist_items', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_wishlists_search_vector',
+            'wishlists',
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_wishlist_items_search_vector',
+            'wishlist_items',
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_wishlist_items_search_vector',
+            table_name='wishlist_items',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_wishlists_search_vector',
+            table_name='wishlists',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.drop_column('wishlist_items', 'search_vector')
+    op.drop_column('wishlists', 'search_vector')
@@ -0,0 +1,84 @@
+"""add composite and partial indexes
+
+Revision ID: a41c7e2d9b10
+Revises: 3ef3fbab27c7
+Create Date: 2026-01-10 09:12:44.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41c7e2d9b10'
+down_revision: Union[str, None] = '3ef3fbab27c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_wishlists_owner_id_visibility_updated_at',
+            'wishlists',
+            ['owner_id', 'visibility', 'updated_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_wishlist_items_wishlist_id_priority_created_at',
+            'wishlist_items',
+            ['wishlist_id', 'priority', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_wishlist_item_comments_wishlist_item_id_created_at',
+            'wishlist_item_comments',
+            ['wishlist_item_id', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_public_wishlist_shares_expires_at',
+            'public_wishlist_shares',
+            ['expires_at'],
+            unique=False,
+            postgresql_where=sa.text('expires_at IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_public_wishlist_shares_expires_at',
+            table_name='public_wishlist_shares',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_wishlist_item_comments_wishlist_item_id_created_at',
+            table_name='wishlist_item_comments',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_wishlist_items_wishlist_id_priority_created_at',
+            table_name='wishlist_items',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_wishlists_owner_id_visibility_updated_at',
+            table_name='wishlists',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,50 @@
+"""add trigram indexes to user profiles
+
+Revision ID: c7d2a9e41f58
+Revises: 5b8e0f3c6d21
+Create Date: 2026-01-24 11:46:09.302517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2a9e41f58'
+down_revision: Union[str, None] = '5b8e0f3c6d21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_TRIGRAM_COLUMNS = ('username', 'first_name', 'last_name')
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    with op.get_context().autocommit_block():
+        for column in _TRIGRAM_COLUMNS:
+            op.create_index(
+                f'ix_user_profiles_{column}_trgm',
+                'user_profiles',
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in reversed(_TRIGRAM_COLUMNS):
+            op.drop_index(
+                f'ix_user_profiles_{column}_trgm',
+                table_name='user_profiles',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    # pg_trgm is left installed; other objects may depend on it.
@@ -0,0 +1,78 @@
+"""add wishlist counters
+
+Revision ID: e19b4d7a3c62
+Revises: c7d2a9e41f58
+Create Date: 2026-02-02 10:21:55.871346
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e19b4d7a3c62'
+down_revision: Union[str, None] = 'c7d2a9e41f58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('wishlists', sa.Column('item_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('wishlists', sa.Column('received_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('wishlists', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('wishlists', sa.Column('last_activity_at', sa.DateTime(timezone=True), nullable=True))
+
+    op.execute(
+        """
+        UPDATE wishlists w
+        SET item_count = coalesce(i.item_count, 0),
+            received_count = coalesce(i.received_count, 0),
+            comment_count = coalesce(c.comment_count, 0),
+            last_activity_at = greatest(w.updated_at, i.last_item_at, c.last_comment_at)
+        FROM wishlists base
+        LEFT JOIN (
+            SELECT wishlist_id,
+                   count(*) AS item_count,
+                   count(*) FILTER (WHERE is_received) AS received_count,
+                   max(updated_at) AS last_item_at
+            FROM wishlist_items
+            GROUP BY wishlist_id
+        ) i ON i.wishlist_id = base.id
+        LEFT JOIN (
+            SELECT it.wishlist_id,
+                   count(*) AS comment_count,
+                   max(cm.created_at) AS last_comment_at
+            FROM wishlist_item_comments cm
+            JOIN wishlist_items it ON it.id = cm.wishlist_item_id
+            GROUP BY it.wishlist_id
+        ) c ON c.wishlist_id = base.id
+        WHERE w.id = base.id
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_wishlists_owner_id_last_activity_at',
+            'wishlists',
+            ['owner_id', sa.text('last_activity_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_wishlists_owner_id_last_activity_at',
+            table_name='wishlists',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.drop_column('wishlists', 'last_activity_at')
+    op.drop_column('wishlists', 'comment_count')
+    op.drop_column('wishlists', 'received_count')
+    op.drop_column('wishlists', 'item_count')
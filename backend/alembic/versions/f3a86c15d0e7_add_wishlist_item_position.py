@@ -0,0 +1,81 @@
+"""add wishlist item position
+
+Revision ID: f3a86c15d0e7
+Revises: e19b4d7a3c62
+Create Date: 2026-02-09 17:38:12.604731
+
+"""
+from itertools import groupby
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a86c15d0e7'
+down_revision: Union[str, None] = 'e19b4d7a3c62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of the rank key generator as of this revision, so the seeded
+# keys never change with application code
+_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_BASE = len(_DIGITS)
+
+
+def _spread_keys(count: int) -> list[str]:
+    width = 1
+    while _BASE**width <= count:
+        width += 1
+    step = _BASE**width // (count + 1)
+
+    keys = []
+    for i in range(1, count + 1):
+        value = step * i
+        chars = []
+        for _ in range(width):
+            value, remainder = divmod(value, _BASE)
+            chars.append(_DIGITS[remainder])
+        keys.append("".join(reversed(chars)).rstrip(_DIGITS[0]))
+    return keys
+
+
+def upgrade() -> None:
+    op.add_column('wishlist_items', sa.Column('position', sa.String(length=64, collation='C'), nullable=True))
+
+    # Seed positions from the previous implicit order: priority first, then age
+    if not op.get_context().as_sql:
+        conn = op.get_bind()
+        rows = conn.execute(sa.text(
+            "SELECT id, wishlist_id FROM wishlist_items "
+            "ORDER BY wishlist_id, priority NULLS LAST, created_at, id"
+        )).all()
+        update = sa.text("UPDATE wishlist_items SET position = :position WHERE id = :id")
+        for _, group in groupby(rows, key=lambda row: row.wishlist_id):
+            ids = [row.id for row in group]
+            params = [{"id": item_id, "position": key} for item_id, key in zip(ids, _spread_keys(len(ids)))]
+            conn.execute(update, params)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_wishlist_items_wishlist_id_position',
+            'wishlist_items',
+            ['wishlist_id', 'position'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_wishlist_items_wishlist_id_position',
+            table_name='wishlist_items',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.drop_column('wishlist_items', 'position')
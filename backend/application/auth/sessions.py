@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID, uuid4
+
+from backend.application.common.interfaces import AuthToken, TokenProfileClaims, TokenRevocationList, TokenService
+from backend.domain.users.entities import RefreshToken, User, UserId, UserProfile
+from backend.domain.users.repositories import UnitOfWork as UsersUnitOfWork
+
+
+async def issue_session_tokens(
+    uow: UsersUnitOfWork,
+    token_service: TokenService,
+    user_id: UserId,
+    profile: Optional[UserProfile],
+    session_id: Optional[UUID] = None,
+) -> AuthToken:
+    """Mint an access token plus the next refresh token of ``session_id``.
+
+    A new session is started when ``session_id`` is None. The caller commits.
+    """
+    session_id = session_id or uuid4()
+    refresh = token_service.issue_refresh_token()
+    await uow.refresh_tokens.add(
+        RefreshToken(
+            id=uuid4(),
+            user_id=user_id,
+            session_id=session_id,
+            token_hash=refresh.token_hash,
+            expires_at=refresh.expires_at,
+        )
+    )
+    access = token_service.create_access_token(
+        user_id,
+        profile=TokenProfileClaims.of(profile) if profile is not None else None,
+        session_id=session_id,
+    )
+    return AuthToken(
+        access_token=access.access_token,
+        expires_at=access.expires_at,
+        refresh_token=refresh.token,
+        refresh_expires_at=refresh.expires_at,
+    )
+
+
+# Tabs sharing one stored refresh token, or a retry whose response was lost,
+# present a token moments after it was rotated; that is not a leak
+REFRESH_REUSE_GRACE_SECONDS = 10.0
+
+
+class RefreshTokenSuperseded(ValueError):
+    """The token was rotated moments ago; retry with the newest stored one."""
+
+
+@dataclass(slots=True)
+class RefreshSessionCommand:
+    refresh_token: str
+
+
+@dataclass(slots=True)
+class RefreshSessionResult:
+    user: User
+    token: AuthToken
+
+
+class RefreshSessionUseCase:
+    def __init__(
+        self,
+        uow: UsersUnitOfWork,
+        token_service: TokenService,
+        revocations: TokenRevocationList,
+    ) -> None:
+        self._uow = uow
+        self._token_service = token_service
+        self._revocations = revocations
+
+    async def execute(self, cmd: RefreshSessionCommand) -> RefreshSessionResult:
+        token_hash = self._token_service.hash_refresh_token(cmd.refresh_token)
+        async with self._uow as uow:
+            stored = await uow.refresh_tokens.get_by_hash(token_hash, for_update=True)
+            if stored is None:
+                raise ValueError("Invalid refresh token")
+
+            if stored.is_revoked:
+                recently = stored.revoked_within(datetime.now(timezone.utc), REFRESH_REUSE_GRACE_SECONDS)
+                if recently and await uow.refresh_tokens.has_active_token(stored.session_id):
+                    raise RefreshTokenSuperseded("Refresh token was already rotated")
+                # A rotated-out token came back: assume it leaked and end the whole session
+                await uow.refresh_tokens.revoke_session(stored.session_id)
+                await uow.commit()
+                await self._revocations.revoke_sessions([stored.session_id])
+                raise ValueError("Invalid refresh token")
+
+            if stored.is_expired(datetime.now(timezone.utc)):
+                raise ValueError("Refresh token expired")
+
+            user = await uow.users.get_by_id(stored.user_id)
+            if user is None or not user.is_active:
+                raise ValueError("Invalid refresh token")
+
+            stored.revoke()
+            await uow.refresh_tokens.update(stored)
+            profile = await uow.profiles.get_by_user_id(user.id)
+            token = await issue_session_tokens(uow, self._token_service, user.id, profile, stored.session_id)
+            await uow.commit()
+
+        return RefreshSessionResult(user=user, token=token)
+
+
+@dataclass(slots=True)
+class LogoutCommand:
+    refresh_token: str
+
+
+class LogoutUseCase:
+    def __init__(
+        self,
+        uow: UsersUnitOfWork,
+        token_service: TokenService,
+        revocations: TokenRevocationList,
+    ) -> None:
+        self._uow = uow
+        self._token_service = token_service
+        self._revocations = revocations
+
+    async def execute(self, cmd: LogoutCommand) -> None:
+        token_hash = self._token_service.hash_refresh_token(cmd.refresh_token)
+        async with self._uow as uow:
+            stored = await uow.refresh_tokens.get_by_hash(token_hash)
+            if stored is None:
+                return
+            await uow.refresh_tokens.revoke_session(stored.session_id)
+            await uow.commit()
+
+        await self._revocations.revoke_sessions([stored.session_id])
+
+
+@dataclass(slots=True)
+class DeactivateUserCommand:
+    user_id: UserId
+
+
+@dataclass(slots=True)
+class DeactivateUserResult:
+    user: User
+    revoked_sessions: int
+
+
+class DeactivateUserUseCase:
+    def __init__(self, uow: UsersUnitOfWork, revocations: TokenRevocationList) -> None:
+        self._uow = uow
+        self._revocations = revocations
+
+    async def execute(self, cmd: DeactivateUserCommand) -> DeactivateUserResult:
+        async with self._uow as uow:
+            user = await uow.users.get_by_id(cmd.user_id)
+            if user is None:
+                raise ValueError("User not found")
+
+            user.deactivate()
+            await uow.users.update(user)
+            session_ids = await uow.refresh_tokens.revoke_all_for_user(user.id)
+            await uow.commit()
+
+        # Refresh is already refused; this cuts off access tokens still in flight
+        await self._revocations.revoke_sessions(session_ids)
+        return DeactivateUserResult(user=user, revoked_sessions=len(session_ids))
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import secrets
 from dataclasses import dataclass
 from typing import Optional
 
+from backend.application.auth.sessions import issue_session_tokens
 from backend.application.common.interfaces import AuthToken, TokenService
-from backend.domain.users.entities import User, UserId, UserProfile
+from backend.domain.users.entities import UNUSABLE_PASSWORD_PREFIX, User, UserId, UserProfile
 from backend.domain.users.repositories import UnitOfWork as UsersUnitOfWork
-from backend.infrastructure.services.security import BcryptPasswordHasher
 
 
 @dataclass(slots=True)
@@ -42,41 +41,40 @@ class SsoLoginUseCase:
         if identity.email_verified is not True:
             raise ValueError("Email not verified")
 
-        password_hasher = BcryptPasswordHasher()
+        first_name: Optional[str] = None
+        last_name: Optional[str] = None
+        if identity.name:
+            parts = [p for p in identity.name.split(" ") if p]
+            if parts:
+                first_name = parts[0]
+                last_name = " ".join(parts[1:]) if len(parts) > 1 else None
 
         async with self._uow as uow:
-            user = await uow.users.get_by_email(identity.email)
-            if user is None:
-                user = User(
+            user = await uow.users.get_or_add_by_email(
+                User(
                     id=UserId.new(),
                     email=identity.email,
-                    password_hash=password_hasher.hash(secrets.token_urlsafe(32)),
+                    # SSO-only account: nothing to hash, and password login stays impossible
+                    password_hash=UNUSABLE_PASSWORD_PREFIX,
                 )
-                await uow.users.add(user)
-
-            profile = await uow.profiles.get_by_user_id(user.id)
-            first_name: Optional[str] = None
-            last_name: Optional[str] = None
-            if identity.name:
-                parts = [p for p in identity.name.split(" ") if p]
-                if parts:
-                    first_name = parts[0]
-                    last_name = " ".join(parts[1:]) if len(parts) > 1 else None
-
-            if profile is None:
-                profile = UserProfile(
+            )
+            if not user.is_active:
+                raise ValueError("Account disabled")
+
+            # Username is only seeded on first login; the provider's name and
+            # picture refresh the profile every time
+            profile = await uow.profiles.upsert(
+                UserProfile(
                     user_id=user.id,
                     username=(identity.email.split("@")[0] if "@" in identity.email else identity.email) or None,
                     first_name=first_name,
                     last_name=last_name,
                     photo_url=identity.picture_url,
-                )
-                await uow.profiles.add(profile)
-            else:
-                profile.update_profile(first_name=first_name, last_name=last_name, photo_url=identity.picture_url)
-                await uow.profiles.update(profile)
+                ),
+                update_fields=("first_name", "last_name", "photo_url"),
+            )
 
+            token = await issue_session_tokens(uow, self._token_service, user.id, profile)
             await uow.commit()
 
-        token = self._token_service.create_access_token(user.id)
         return SsoLoginResult(user=user, token=token)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
+from backend.application.auth.sessions import issue_session_tokens
 from backend.application.common.interfaces import AuthToken, PasswordHasher, TokenService
 from backend.domain.users.entities import User, UserId
 from backend.domain.users.repositories import UnitOfWork as UsersUnitOfWork
@@ -29,15 +30,14 @@ class SignUpUseCase:
         self._password_hasher = password_hasher
 
     async def execute(self, cmd: SignUpCommand) -> SignUpResult:
+        # Hashing before touching the database keeps taken and free emails
+        # indistinguishable by timing; the insert itself settles races
+        password_hash = await self._password_hasher.hash(cmd.password)
+        user = User(id=UserId.new(), email=cmd.email, password_hash=password_hash)
+
         async with self._uow as uow:
-            existing = await uow.users.get_by_email(cmd.email)
-            if existing is not None:
+            if not await uow.users.add_if_email_free(user):
                 raise ValueError("Email is already in use")
-
-            password_hash = self._password_hasher.hash(cmd.password)
-            user = User(id=UserId.new(), email=cmd.email, password_hash=password_hash)
-
-            await uow.users.add(user)
             await uow.commit()
 
         return SignUpResult(user=user)
@@ -69,11 +69,19 @@ class LoginUseCase:
     async def execute(self, cmd: LoginCommand) -> LoginResult:
         async with self._uow as uow:
             user: Optional[User] = await uow.users.get_by_email(cmd.email)
-            if user is None:
+            if user is None or not user.is_active or not user.has_usable_password:
                 raise ValueError("Invalid credentials")
 
-            if not self._password_hasher.verify(cmd.password, user.password_hash):
+            if not await self._password_hasher.verify(cmd.password, user.password_hash):
                 raise ValueError("Invalid credentials")
 
-        token = self._token_service.create_access_token(user.id)
+            # Upgrade hashes made at a lower cost while the plaintext is at hand
+            if self._password_hasher.needs_rehash(user.password_hash):
+                user.change_password_hash(await self._password_hasher.hash(cmd.password))
+                await uow.users.update(user)
+
+            profile = await uow.profiles.get_by_user_id(user.id)
+            token = await issue_session_tokens(uow, self._token_service, user.id, profile)
+            await uow.commit()
+
         return LoginResult(user=user, token=token)
@@ -3,16 +3,20 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Protocol
+from typing import Iterable, Optional, Protocol
+from uuid import UUID
 
-from backend.domain.users.entities import UserId
+from backend.domain.users.entities import UserId, UserProfile
 
 
 class PasswordHasher(Protocol):
-    def hash(self, raw_password: str) -> str:
+    async def hash(self, raw_password: str) -> str:
         ...
 
-    def verify(self, raw_password: str, password_hash: str) -> bool:
+    async def verify(self, raw_password: str, password_hash: str) -> bool:
+        ...
+
+    def needs_rehash(self, password_hash: str) -> bool:
         ...
 
 
@@ -20,10 +24,46 @@ class PasswordHasher(Protocol):
 class AuthToken:
     access_token: str
     expires_at: datetime
+    refresh_token: Optional[str] = None
+    refresh_expires_at: Optional[datetime] = None
+
+
+@dataclass(frozen=True, slots=True)
+class IssuedRefreshToken:
+    token: str
+    token_hash: str
+    expires_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class TokenProfileClaims:
+    name: Optional[str] = None
+    photo_url: Optional[str] = None
+
+    @classmethod
+    def of(cls, profile: UserProfile) -> "TokenProfileClaims":
+        return cls(name=profile.name or None, photo_url=profile.photo_url)
 
 
 class TokenService(Protocol):
-    def create_access_token(self, user_id: UserId, expires_delta: timedelta | None = None) -> AuthToken:
+    def create_access_token(
+        self,
+        user_id: UserId,
+        expires_delta: timedelta | None = None,
+        profile: TokenProfileClaims | None = None,
+        session_id: UUID | None = None,
+    ) -> AuthToken:
+        ...
+
+    def issue_refresh_token(self) -> IssuedRefreshToken:
+        ...
+
+    def hash_refresh_token(self, token: str) -> str:
+        ...
+
+
+class TokenRevocationList(Protocol):
+    async def revoke_sessions(self, session_ids: Iterable[UUID]) -> None:
         ...
 
 
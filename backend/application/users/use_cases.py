@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Optional
+from typing import List, Optional
+from uuid import UUID
 
+from backend.application.common.interfaces import AuthToken, TokenProfileClaims, TokenService
 from backend.domain.users.entities import UserId, UserProfile
 from backend.domain.users.repositories import UnitOfWork as UsersUnitOfWork
 
@@ -36,16 +38,20 @@ class UpsertProfileCommand:
     last_name: Optional[str] = None
     birthday: Optional[date] = None
     photo_url: Optional[str] = None
+    # Session of the caller's access token, carried into the re-issued one
+    session_id: Optional[UUID] = None
 
 
 @dataclass(slots=True)
 class UpsertProfileResult:
     profile: UserProfile
+    token: Optional[AuthToken] = None
 
 
 class UpsertProfileUseCase:
-    def __init__(self, uow: UsersUnitOfWork) -> None:
+    def __init__(self, uow: UsersUnitOfWork, token_service: Optional[TokenService] = None) -> None:
         self._uow = uow
+        self._token_service = token_service
 
     async def execute(self, cmd: UpsertProfileCommand) -> UpsertProfileResult:
         async with self._uow as uow:
@@ -72,4 +78,42 @@ class UpsertProfileUseCase:
 
             await uow.commit()
 
-        return UpsertProfileResult(profile=profile)
+        # Re-issue the access token so its embedded profile claims stay current
+        token: Optional[AuthToken] = None
+        if self._token_service is not None:
+            token = self._token_service.create_access_token(
+                cmd.user_id, profile=TokenProfileClaims.of(profile), session_id=cmd.session_id
+            )
+        return UpsertProfileResult(profile=profile, token=token)
+
+
+@dataclass(slots=True)
+class SearchPeopleQuery:
+    text: str
+    limit: int = 10
+    timeout_ms: Optional[int] = None
+
+
+@dataclass(slots=True)
+class SearchPeopleResult:
+    profiles: List[UserProfile]
+    timed_out: bool = False
+
+
+class SearchPeopleUseCase:
+    def __init__(self, uow: UsersUnitOfWork) -> None:
+        self._uow = uow
+
+    async def execute(self, query: SearchPeopleQuery) -> SearchPeopleResult:
+        text = query.text.strip()
+        if not text:
+            raise ValueError("Search text cannot be empty")
+
+        try:
+            async with self._uow as uow:
+                profiles = await uow.profiles.search(text, limit=query.limit, timeout_ms=query.timeout_ms)
+        except TimeoutError:
+            # Autocomplete prefers an empty answer now over a complete one too late
+            return SearchPeopleResult(profiles=[], timed_out=True)
+
+        return SearchPeopleResult(profiles=profiles)
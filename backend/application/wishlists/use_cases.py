@@ -1,18 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, List, Optional, Union
 
 from backend.domain.users.entities import UserId
 from backend.domain.wishlists.entities import (
     PublicShareToken,
     PublicWishlistShare,
     Wishlist,
+    WishlistFields,
     WishlistId,
     WishlistItem,
+    WishlistItemComment,
     WishlistItemId,
+    WishlistSearchHit,
+    WishlistSearchScope,
     WishlistVisibility,
 )
+from backend.domain.wishlists.ranking import rank_between, spaced_key, spread_keys
 from backend.domain.wishlists.repositories import UnitOfWork as WishlistsUnitOfWork
 
 
@@ -106,6 +111,9 @@ class DeleteWishlistUseCase:
 @dataclass(slots=True)
 class ListUserWishlistsQuery:
     owner_id: UserId
+    include_items: bool = True
+    order_by_activity: bool = False
+    fields: Optional[WishlistFields] = None
 
 
 @dataclass(slots=True)
@@ -119,7 +127,12 @@ class ListUserWishlistsUseCase:
 
     async def execute(self, query: ListUserWishlistsQuery) -> ListUserWishlistsResult:
         async with self._uow as uow:
-            wishlists = await uow.wishlists.list_by_owner(query.owner_id)
+            wishlists = await uow.wishlists.list_by_owner(
+                query.owner_id,
+                include_items=query.include_items,
+                order_by_activity=query.order_by_activity,
+                fields=query.fields,
+            )
         return ListUserWishlistsResult(wishlists=wishlists)
 
 
@@ -127,6 +140,7 @@ class ListUserWishlistsUseCase:
 class GetWishlistQuery:
     wishlist_id: WishlistId
     owner_id: UserId
+    fields: Optional[WishlistFields] = None
 
 
 @dataclass(slots=True)
@@ -140,13 +154,50 @@ class GetWishlistUseCase:
 
     async def execute(self, query: GetWishlistQuery) -> GetWishlistResult:
         async with self._uow as uow:
-            wishlist = await uow.wishlists.get_by_id(query.wishlist_id)
+            wishlist = await uow.wishlists.get_by_id(query.wishlist_id, fields=query.fields)
             if wishlist is None or wishlist.owner_id != query.owner_id:
                 raise ValueError("Wishlist not found")
 
         return GetWishlistResult(wishlist=wishlist)
 
 
+@dataclass(slots=True)
+class SearchWishlistsQuery:
+    requester_id: UserId
+    text: str
+    scope: WishlistSearchScope = WishlistSearchScope.MINE
+    limit: int = 20
+    offset: int = 0
+
+
+@dataclass(slots=True)
+class SearchWishlistsResult:
+    hits: List[WishlistSearchHit]
+    has_more: bool
+
+
+class SearchWishlistsUseCase:
+    def __init__(self, uow: WishlistsUnitOfWork) -> None:
+        self._uow = uow
+
+    async def execute(self, query: SearchWishlistsQuery) -> SearchWishlistsResult:
+        text = query.text.strip()
+        if not text:
+            raise ValueError("Search text cannot be empty")
+
+        async with self._uow as uow:
+            # One extra row tells us whether another page exists without a COUNT(*)
+            hits = await uow.wishlists.search(
+                text,
+                scope=query.scope,
+                requester_id=query.requester_id,
+                limit=query.limit + 1,
+                offset=query.offset,
+            )
+
+        return SearchWishlistsResult(hits=hits[: query.limit], has_more=len(hits) > query.limit)
+
+
 # Wishlist items
 
 
@@ -172,7 +223,8 @@ class AddWishlistItemUseCase:
 
     async def execute(self, cmd: AddWishlistItemCommand) -> AddWishlistItemResult:
         async with self._uow as uow:
-            wishlist = await uow.wishlists.get_by_id(cmd.wishlist_id)
+            # The new key follows the last one; a rebalance must not rewrite them meanwhile
+            wishlist = await uow.wishlists.get_by_id(cmd.wishlist_id, for_update=True)
             if wishlist is None:
                 raise ValueError("Wishlist not found")
 
@@ -190,6 +242,7 @@ class AddWishlistItemUseCase:
 
             await uow.items.add(item)
             await uow.wishlists.update(wishlist)
+            await uow.wishlists.adjust_counters(wishlist.id, items=1, received=int(item.is_received))
             await uow.commit()
 
         return AddWishlistItemResult(item=item)
@@ -225,6 +278,7 @@ class UpdateWishlistItemUseCase:
             if wishlist is None:
                 raise ValueError("Wishlist not found")
 
+            was_received = item.is_received
             item.update(
                 title=cmd.title,
                 description=cmd.description,
@@ -236,6 +290,9 @@ class UpdateWishlistItemUseCase:
 
             await uow.items.update(item)
             await uow.wishlists.update(wishlist)
+            await uow.wishlists.adjust_counters(
+                wishlist.id, received=int(item.is_received) - int(was_received)
+            )
             await uow.commit()
 
         return UpdateWishlistItemResult(item=item)
@@ -260,11 +317,101 @@ class DeleteWishlistItemUseCase:
             if wishlist is not None:
                 wishlist.remove_item(item.id)
                 await uow.wishlists.update(wishlist)
+                await uow.wishlists.adjust_counters(wishlist.id, items=-1, received=-int(item.is_received))
 
             await uow.items.delete(item.id)
             await uow.commit()
 
 
+# Keys longer than this mean one gap has been split many times; respread the list
+REBALANCE_KEY_LENGTH = 16
+
+
+@dataclass(slots=True)
+class MoveWishlistItemCommand:
+    item_id: WishlistItemId
+    owner_id: UserId
+    after_item_id: Optional[WishlistItemId] = None
+    before_item_id: Optional[WishlistItemId] = None
+
+
+@dataclass(slots=True)
+class MoveWishlistItemResult:
+    item: WishlistItem
+    needs_rebalance: bool
+
+
+class MoveWishlistItemUseCase:
+    def __init__(self, uow: WishlistsUnitOfWork) -> None:
+        self._uow = uow
+
+    async def execute(self, cmd: MoveWishlistItemCommand) -> MoveWishlistItemResult:
+        if cmd.after_item_id is None and cmd.before_item_id is None:
+            raise ValueError("A neighbouring item is required")
+
+        async with self._uow as uow:
+            item = await uow.items.get_by_id(cmd.item_id)
+            if item is None:
+                raise ValueError("Item not found")
+
+            # Only the owner is needed; skip the other columns and the items. The
+            # row lock serializes moves with each other and with rebalancing,
+            # so neighbour keys cannot change between reading and writing
+            owner_only = WishlistFields(wishlist=frozenset(), items=frozenset())
+            wishlist = await uow.wishlists.get_by_id(item.wishlist_id, fields=owner_only, for_update=True)
+            if wishlist is None or wishlist.owner_id != cmd.owner_id:
+                raise ValueError("Item not found")
+
+            lower = await self._neighbour_position(uow, item, cmd.after_item_id)
+            upper = await self._neighbour_position(uow, item, cmd.before_item_id)
+            if cmd.before_item_id is None:
+                upper = await uow.items.position_after(item.wishlist_id, lower, exclude_id=item.id)
+            if cmd.after_item_id is None:
+                lower = await uow.items.position_before(item.wishlist_id, upper, exclude_id=item.id)
+
+            if lower is not None and upper is not None and lower >= upper:
+                raise ValueError("Invalid move target")
+
+            item.position = rank_between(lower, upper)
+            await uow.items.set_position(item.id, item.position)
+            await uow.commit()
+
+        return MoveWishlistItemResult(item=item, needs_rebalance=len(item.position) > REBALANCE_KEY_LENGTH)
+
+    @staticmethod
+    async def _neighbour_position(
+        uow: WishlistsUnitOfWork, item: WishlistItem, neighbour_id: Optional[WishlistItemId]
+    ) -> Optional[str]:
+        if neighbour_id is None:
+            return None
+        neighbour = await uow.items.get_by_id(neighbour_id)
+        if neighbour is None or neighbour.wishlist_id != item.wishlist_id or neighbour.id == item.id:
+            raise ValueError("Item not found")
+        return neighbour.position
+
+
+@dataclass(slots=True)
+class RebalanceWishlistItemsCommand:
+    wishlist_id: WishlistId
+
+
+class RebalanceWishlistItemsUseCase:
+    def __init__(self, uow: WishlistsUnitOfWork) -> None:
+        self._uow = uow
+
+    async def execute(self, cmd: RebalanceWishlistItemsCommand) -> None:
+        async with self._uow as uow:
+            # Same lock as moves and appends, so none of them interleave with the rewrite
+            owner_only = WishlistFields(wishlist=frozenset(), items=frozenset())
+            if await uow.wishlists.get_by_id(cmd.wishlist_id, fields=owner_only, for_update=True) is None:
+                return
+            items = await uow.items.list_by_wishlist(cmd.wishlist_id)
+            keys = spread_keys(len(items))
+            changed = [(item.id, key) for item, key in zip(items, keys) if item.position != key]
+            await uow.items.set_positions(changed)
+            await uow.commit()
+
+
 # Public sharing / viewing / claiming
 
 
@@ -310,6 +457,7 @@ class CreatePublicShareUseCase:
 @dataclass(slots=True)
 class GetPublicWishlistQuery:
     token: str
+    fields: Optional[WishlistFields] = None
 
 
 @dataclass(slots=True)
@@ -328,7 +476,7 @@ class GetPublicWishlistUseCase:
             if share is None or not share.is_active():
                 return GetPublicWishlistResult(wishlist=None, share=None)
 
-            wishlist = await uow.wishlists.get_by_id(share.wishlist_id)
+            wishlist = await uow.wishlists.get_by_id(share.wishlist_id, fields=query.fields)
         return GetPublicWishlistResult(wishlist=wishlist, share=share)
 
 
@@ -374,6 +522,7 @@ class ClaimWishlistUseCase:
                     description=item.description,
                     link=item.link,
                     priority=item.priority,
+                    position=item.position,
                 )
                 cloned.add_item(cloned_item)
                 await uow.items.add(cloned_item)
@@ -382,3 +531,255 @@ class ClaimWishlistUseCase:
             await uow.commit()
 
         return ClaimWishlistResult(wishlist=cloned)
+
+
+@dataclass(slots=True)
+class ExportWishlistsQuery:
+    owner_id: UserId
+    include_comments: bool = True
+    batch_size: int = 500
+
+
+ExportRecord = Union[Wishlist, WishlistItem, WishlistItemComment]
+
+
+class ExportWishlistsUseCase:
+    """Streams an account's data: wishlists (without items), then items
+    grouped by wishlist, then comments, so memory does not grow with it."""
+
+    def __init__(self, uow: WishlistsUnitOfWork) -> None:
+        self._uow = uow
+
+    async def execute(self, query: ExportWishlistsQuery) -> AsyncIterator[ExportRecord]:
+        async with self._uow as uow:
+            async for wishlist in uow.wishlists.stream_by_owner(query.owner_id, batch_size=query.batch_size):
+                yield wishlist
+            async for item in uow.items.stream_by_owner(query.owner_id, batch_size=query.batch_size):
+                yield item
+            if query.include_comments:
+                async for comment in uow.comments.stream_by_wishlist_owner(
+                    query.owner_id, batch_size=query.batch_size
+                ):
+                    yield comment
+
+
+# Bulk import
+
+
+@dataclass(slots=True)
+class ImportRow:
+    """One decoded input row. Values are passed through as read and
+    validated by ImportWishlistsUseCase; ``error`` carries decoder failures."""
+
+    line: int
+    wishlist_key: str
+    wishlist_name: Any = None
+    wishlist_description: Any = None
+    wishlist_visibility: Any = None
+    has_item: bool = True
+    title: Any = None
+    description: Any = None
+    link: Any = None
+    priority: Any = None
+    is_received: Any = None
+    received_note: Any = None
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ImportWishlistsCommand:
+    owner_id: UserId
+    rows: AsyncIterator[ImportRow]
+    max_rows: int = 100_000
+    # 11 bind parameters per item row; asyncpg allows 32767 per statement
+    batch_size: int = 1000
+    # Text fields can be up to a MiB each, so batches are capped by size too
+    batch_chars: int = 8 * 1024 * 1024
+    max_errors: int = 100
+
+
+@dataclass(frozen=True, slots=True)
+class ImportRowError:
+    line: int
+    message: str
+
+
+@dataclass(slots=True)
+class ImportWishlistsResult:
+    wishlists_created: int = 0
+    items_created: int = 0
+    rows_failed: int = 0
+    errors: List[ImportRowError] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _ImportedWishlist:
+    id: WishlistId
+    items: int = 0
+    received: int = 0
+
+
+def _import_text(value: Any, label: str, max_length: Optional[int] = None) -> Optional[str]:
+    if value is None or value == "":
+        return None
+    if not isinstance(value, str):
+        raise ValueError(f"{label} must be text")
+    if max_length is not None and len(value) > max_length:
+        raise ValueError(f"{label} is longer than {max_length} characters")
+    return value
+
+
+def _import_row_chars(row: ImportRow) -> int:
+    values = (
+        row.wishlist_name,
+        row.wishlist_description,
+        row.title,
+        row.description,
+        row.link,
+        row.received_note,
+    )
+    return sum(len(value) for value in values if isinstance(value, str))
+
+
+def _import_priority(value: Any) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    try:
+        if isinstance(value, bool):
+            raise ValueError
+        priority = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("Priority must be a positive integer") from None
+    if priority < 1:
+        raise ValueError("Priority must be a positive integer")
+    return priority
+
+
+def _import_flag(value: Any) -> bool:
+    if value is None or value == "":
+        return False
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ("true", "1", "yes"):
+        return True
+    if isinstance(value, str) and value.strip().lower() in ("false", "0", "no"):
+        return False
+    raise ValueError("is_received must be true or false")
+
+
+class ImportWishlistsUseCase:
+    """Creates wishlists and items from a stream of rows in one transaction.
+
+    Rows are validated a batch at a time (``batch_size`` rows or
+    ``batch_chars`` of text, whichever comes first) and written with one
+    multi-row INSERT per table per batch; invalid rows are skipped and reported by
+    line. Only the current batch and one small record per wishlist are held,
+    and counters are settled once per wishlist at the end.
+    """
+
+    def __init__(self, uow: WishlistsUnitOfWork) -> None:
+        self._uow = uow
+
+    async def execute(self, cmd: ImportWishlistsCommand) -> ImportWishlistsResult:
+        result = ImportWishlistsResult()
+        wishlists: dict[str, _ImportedWishlist] = {}
+        batch: List[ImportRow] = []
+        batch_chars = count = 0
+
+        async with self._uow as uow:
+            async for row in cmd.rows:
+                count += 1
+                if count > cmd.max_rows:
+                    raise ValueError(f"Imports are limited to {cmd.max_rows} rows")
+                batch.append(row)
+                batch_chars += _import_row_chars(row)
+                if len(batch) >= cmd.batch_size or batch_chars >= cmd.batch_chars:
+                    await self._write_batch(uow, cmd, batch, wishlists, result)
+                    batch, batch_chars = [], 0
+            await self._write_batch(uow, cmd, batch, wishlists, result)
+
+            for imported in wishlists.values():
+                if imported.items:
+                    await uow.wishlists.adjust_counters(
+                        imported.id, items=imported.items, received=imported.received
+                    )
+            await uow.commit()
+
+        return result
+
+    async def _write_batch(
+        self,
+        uow: WishlistsUnitOfWork,
+        cmd: ImportWishlistsCommand,
+        batch: List[ImportRow],
+        wishlists: dict[str, _ImportedWishlist],
+        result: ImportWishlistsResult,
+    ) -> None:
+        new_wishlists: List[Wishlist] = []
+        items: List[WishlistItem] = []
+
+        for row in batch:
+            try:
+                if row.error is not None:
+                    raise ValueError(row.error)
+                imported = wishlists.get(row.wishlist_key)
+                wishlist = None if imported is not None else self._new_wishlist(cmd.owner_id, row)
+                wishlist_id = imported.id if imported is not None else wishlist.id
+                item = self._new_item(wishlist_id, row) if row.has_item else None
+            except ValueError as e:
+                result.rows_failed += 1
+                if len(result.errors) < cmd.max_errors:
+                    result.errors.append(ImportRowError(line=row.line, message=str(e)))
+                continue
+
+            if wishlist is not None:
+                imported = wishlists[row.wishlist_key] = _ImportedWishlist(id=wishlist.id)
+                new_wishlists.append(wishlist)
+            if item is not None:
+                imported.items += 1
+                imported.received += int(item.is_received)
+                # Keys spread over the space for the largest possible import
+                # stay short and leave room for later moves
+                item.position = spaced_key(imported.items, cmd.max_rows)
+                items.append(item)
+
+        # Wishlists first: items reference them
+        await uow.wishlists.add_many(new_wishlists)
+        await uow.items.add_many(items)
+        result.wishlists_created += len(new_wishlists)
+        result.items_created += len(items)
+
+    @staticmethod
+    def _new_wishlist(owner_id: UserId, row: ImportRow) -> Wishlist:
+        if row.wishlist_name is None:
+            raise ValueError("Unknown wishlist")
+        name = _import_text(row.wishlist_name, "Wishlist name", 255)
+        if name is None or not name.strip():
+            raise ValueError("Wishlist name cannot be empty")
+        try:
+            visibility = WishlistVisibility(row.wishlist_visibility or WishlistVisibility.PRIVATE)
+        except ValueError:
+            raise ValueError(f"Invalid visibility: {row.wishlist_visibility}") from None
+        return Wishlist(
+            id=WishlistId.new(),
+            owner_id=owner_id,
+            name=name,
+            description=_import_text(row.wishlist_description, "Wishlist description"),
+            visibility=visibility,
+        )
+
+    @staticmethod
+    def _new_item(wishlist_id: WishlistId, row: ImportRow) -> WishlistItem:
+        title = _import_text(row.title, "Title", 255)
+        if title is None or not title.strip():
+            raise ValueError("Title cannot be empty")
+        return WishlistItem(
+            id=WishlistItemId.new(),
+            wishlist_id=wishlist_id,
+            title=title,
+            description=_import_text(row.description, "Description"),
+            link=_import_text(row.link, "Link", 1024),
+            priority=_import_priority(row.priority),
+            is_received=_import_flag(row.is_received),
+            received_note=_import_text(row.received_note, "Received note"),
+        )
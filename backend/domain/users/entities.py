@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from typing import Optional
 from uuid import UUID, uuid4
 
 
+# Stored instead of a hash for accounts that can only sign in through SSO.
+# "!" never appears in a bcrypt hash, so no password can ever match it.
+UNUSABLE_PASSWORD_PREFIX = "!"
+
+
 @dataclass(frozen=True, slots=True)
 class UserId:
     value: UUID
@@ -34,6 +39,10 @@ class User:
             self.is_active = False
             self.updated_at = datetime.utcnow()
 
+    @property
+    def has_usable_password(self) -> bool:
+        return bool(self.password_hash) and not self.password_hash.startswith(UNUSABLE_PASSWORD_PREFIX)
+
     def change_password_hash(self, new_hash: str) -> None:
         if not new_hash:
             raise ValueError("Password hash cannot be empty")
@@ -93,3 +102,34 @@ class UserProfile:
 
         if changed:
             self.updated_at = datetime.utcnow()
+
+
+@dataclass(slots=True)
+class RefreshToken:
+    """One link in a rotating chain of refresh tokens.
+
+    Every token minted from the same sign-in shares ``session_id``; only the
+    SHA-256 of the token itself is kept.
+    """
+
+    id: UUID
+    user_id: UserId
+    session_id: UUID
+    token_hash: str
+    expires_at: datetime
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    revoked_at: Optional[datetime] = None
+
+    @property
+    def is_revoked(self) -> bool:
+        return self.revoked_at is not None
+
+    def is_expired(self, now: datetime) -> bool:
+        return now >= self.expires_at
+
+    def revoked_within(self, now: datetime, seconds: float) -> bool:
+        return self.revoked_at is not None and (now - self.revoked_at).total_seconds() <= seconds
+
+    def revoke(self) -> None:
+        if self.revoked_at is None:
+            self.revoked_at = datetime.now(timezone.utc)
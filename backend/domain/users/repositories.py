@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional, Protocol
+from typing import List, Optional, Protocol, Sequence
+from uuid import UUID
 
-from .entities import User, UserId, UserProfile
+from .entities import RefreshToken, User, UserId, UserProfile
 
 
 class UserRepository(Protocol):
@@ -16,6 +17,12 @@ class UserRepository(Protocol):
     async def add(self, user: User) -> None:
         ...
 
+    async def add_if_email_free(self, user: User) -> bool:
+        ...
+
+    async def get_or_add_by_email(self, user: User) -> User:
+        ...
+
     async def update(self, user: User) -> None:
         ...
 
@@ -24,16 +31,43 @@ class UserProfileRepository(Protocol):
     async def get_by_user_id(self, user_id: UserId) -> Optional[UserProfile]:
         ...
 
+    async def search(self, text: str, limit: int, timeout_ms: Optional[int] = None) -> List[UserProfile]:
+        ...
+
     async def add(self, profile: UserProfile) -> None:
         ...
 
+    async def upsert(self, profile: UserProfile, update_fields: Sequence[str] = ()) -> UserProfile:
+        ...
+
     async def update(self, profile: UserProfile) -> None:
         ...
 
 
+class RefreshTokenRepository(Protocol):
+    async def get_by_hash(self, token_hash: str, for_update: bool = False) -> Optional[RefreshToken]:
+        ...
+
+    async def add(self, token: RefreshToken) -> None:
+        ...
+
+    async def update(self, token: RefreshToken) -> None:
+        ...
+
+    async def has_active_token(self, session_id: UUID) -> bool:
+        ...
+
+    async def revoke_session(self, session_id: UUID) -> None:
+        ...
+
+    async def revoke_all_for_user(self, user_id: UserId) -> List[UUID]:
+        ...
+
+
 class UnitOfWork(ABC):
     users: UserRepository
     profiles: UserProfileRepository
+    refresh_tokens: RefreshTokenRepository
 
     @abstractmethod
     async def __aenter__(self) -> "UnitOfWork":
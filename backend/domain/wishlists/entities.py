@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 from uuid import UUID, uuid4
 
 from backend.domain.users.entities import UserId
+from backend.domain.wishlists.ranking import rank_after
 
 
 @dataclass(frozen=True, slots=True)
@@ -41,6 +42,11 @@ class WishlistVisibility(str, Enum):
     PUBLIC = "public"
 
 
+class WishlistSearchScope(str, Enum):
+    MINE = "mine"
+    PUBLIC = "public"
+
+
 @dataclass(slots=True)
 class WishlistItem:
     id: WishlistItemId
@@ -51,6 +57,7 @@ class WishlistItem:
     priority: Optional[int] = None
     is_received: bool = False
     received_note: Optional[str] = None
+    position: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
@@ -126,6 +133,11 @@ class Wishlist:
     items: List[WishlistItem] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+    # Denormalized counters; persisted incrementally by the repository
+    item_count: int = 0
+    received_count: int = 0
+    comment_count: int = 0
+    last_activity_at: Optional[datetime] = None
 
     def rename(self, name: str) -> None:
         if not name.strip():
@@ -148,14 +160,26 @@ class Wishlist:
         self.updated_at = datetime.utcnow()
 
     def add_item(self, item: WishlistItem) -> None:
+        if item.position is None:
+            last = max((i.position for i in self.items if i.position), default=None)
+            item.position = rank_after(last)
         self.items.append(item)
+        self.item_count += 1
+        if item.is_received:
+            self.received_count += 1
         self.updated_at = datetime.utcnow()
+        self.last_activity_at = self.updated_at
 
     def remove_item(self, item_id: WishlistItemId) -> None:
-        before = len(self.items)
+        removed = self.get_item(item_id)
+        if removed is None:
+            return
         self.items = [i for i in self.items if i.id != item_id]
-        if len(self.items) != before:
-            self.updated_at = datetime.utcnow()
+        self.item_count = max(0, self.item_count - 1)
+        if removed.is_received:
+            self.received_count = max(0, self.received_count - 1)
+        self.updated_at = datetime.utcnow()
+        self.last_activity_at = self.updated_at
 
     def get_item(self, item_id: WishlistItemId) -> Optional[WishlistItem]:
         for item in self.items:
@@ -182,3 +206,28 @@ class PublicWishlistShare:
         if self.expires_at is not None and now > self.expires_at:
             return False
         return True
+
+
+@dataclass(frozen=True, slots=True)
+class WishlistSearchHit:
+    wishlist_id: WishlistId
+    owner_id: UserId
+    title: str
+    rank: float
+    item_id: Optional[WishlistItemId] = None
+
+
+@dataclass(frozen=True, slots=True)
+class WishlistFields:
+    """Attributes a read actually needs, so the rest need not be loaded.
+
+    ``None`` means every attribute. For ``items`` an empty set means the items
+    are not needed at all. Identifiers and the owner are always loaded.
+    """
+
+    wishlist: Optional[FrozenSet[str]] = None
+    items: Optional[FrozenSet[str]] = None
+
+    @property
+    def include_items(self) -> bool:
+        return self.items is None or bool(self.items)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+
+# Rank keys are base-62 fractions written without the leading "0." and
+# without trailing zeros, so plain byte-wise string comparison (COLLATE "C"
+# in Postgres) orders them numerically. A key strictly between any two keys
+# always exists, which lets an item move with a single-row update.
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+
+def _digit(char: str) -> int:
+    value = DIGITS.find(char)
+    if value < 0:
+        raise ValueError(f"Invalid rank key character: {char!r}")
+    return value
+
+
+def _midpoint(lower: str, upper: Optional[str]) -> str:
+    if upper is not None:
+        # Carry over the common prefix, padding lower with zeros
+        n = 0
+        while n < len(upper) and (lower[n] if n < len(lower) else DIGITS[0]) == upper[n]:
+            n += 1
+        if n > 0:
+            return upper[:n] + _midpoint(lower[n:], upper[n:])
+
+    lower_digit = _digit(lower[0]) if lower else 0
+    upper_digit = _digit(upper[0]) if upper is not None else BASE
+    if upper_digit - lower_digit > 1:
+        return DIGITS[(lower_digit + upper_digit + 1) // 2]
+
+    # Adjacent digits: keep upper's first digit if that already sits above lower
+    if upper is not None and len(upper) > 1:
+        return upper[:1]
+    return DIGITS[lower_digit] + _midpoint(lower[1:], None)
+
+
+def rank_between(lower: Optional[str], upper: Optional[str]) -> str:
+    """Return a key sorting strictly after ``lower`` and before ``upper``.
+
+    ``None`` stands for the start (lower) or the end (upper) of the list.
+    """
+    lower = lower or ""
+    if lower.endswith(DIGITS[0]) or (upper is not None and (not upper or upper.endswith(DIGITS[0]))):
+        raise ValueError("Rank keys cannot be empty or end with a zero digit")
+    if upper is not None and lower >= upper:
+        raise ValueError("Lower rank key must sort before upper rank key")
+    return _midpoint(lower, upper)
+
+
+# Appends step by one unit in the last digit of a key padded to a multiple of
+# this width. Halving the gap to the end of the key space instead would add a
+# character every few appends; stepping allows about 10^5 appends per width.
+APPEND_KEY_WIDTH = 3
+
+
+def rank_after(lower: Optional[str]) -> str:
+    """Return a key for appending after ``lower``, the current last key."""
+    if lower is None:
+        return rank_between(None, None)
+    if not lower or lower.endswith(DIGITS[0]):
+        raise ValueError("Rank keys cannot be empty or end with a zero digit")
+
+    # Whole steps of the width, so stripping trailing zeros never narrows it
+    width = -(-len(lower) // APPEND_KEY_WIDTH) * APPEND_KEY_WIDTH
+    digits = [_digit(char) for char in lower.ljust(width, DIGITS[0])]
+    for index in range(len(digits) - 1, -1, -1):
+        if digits[index] < BASE - 1:
+            digits[index] += 1
+            return "".join(DIGITS[d] for d in digits[: index + 1])
+        digits[index] = 0
+    # Every digit was the largest one: continue at a wider step
+    return lower + DIGITS[0] * (APPEND_KEY_WIDTH - 1) + DIGITS[1]
+
+
+def spread_keys(count: int) -> List[str]:
+    """Return ``count`` ascending keys spaced evenly over the key space."""
+    return [spaced_key(i, count) for i in range(1, count + 1)]
+
+
+def spaced_key(index: int, count: int) -> str:
+    """Return the ``index``-th (1-based) of ``count`` evenly spaced keys.
+
+    Lets a caller that only knows an upper bound on ``count`` hand out keys
+    one at a time, without building the whole list.
+    """
+    if not 1 <= index <= count:
+        raise ValueError("Key index must be between 1 and count")
+
+    width = 1
+    while BASE**width <= count:
+        width += 1
+    value = BASE**width // (count + 1) * index
+
+    chars = []
+    for _ in range(width):
+        value, remainder = divmod(value, BASE)
+        chars.append(DIGITS[remainder])
+    return "".join(reversed(chars)).rstrip(DIGITS[0])
@@ -1,37 +1,75 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Protocol
+from typing import AsyncIterator, List, Optional, Protocol, Tuple
 
 from .entities import (
     PublicShareToken,
     PublicWishlistShare,
     Wishlist,
+    WishlistFields,
     WishlistId,
     WishlistItem,
     WishlistItemComment,
     WishlistItemCommentId,
     WishlistItemId,
+    WishlistSearchHit,
+    WishlistSearchScope,
 )
 from backend.domain.users.entities import UserId
 
 
 class WishlistRepository(Protocol):
-    async def get_by_id(self, wishlist_id: WishlistId) -> Optional[Wishlist]:
+    async def get_by_id(
+        self, wishlist_id: WishlistId, fields: Optional[WishlistFields] = None, for_update: bool = False
+    ) -> Optional[Wishlist]:
+        """With ``for_update``, lock the wishlist row until the unit of work ends."""
         ...
 
-    async def list_by_owner(self, owner_id: UserId) -> List[Wishlist]:
+    async def list_by_owner(
+        self,
+        owner_id: UserId,
+        include_items: bool = True,
+        order_by_activity: bool = False,
+        fields: Optional[WishlistFields] = None,
+    ) -> List[Wishlist]:
+        ...
+
+    def stream_by_owner(self, owner_id: UserId, batch_size: int = 500) -> AsyncIterator[Wishlist]:
+        """Yield the owner's wishlists without items, fetched batch by batch."""
+        ...
+
+    async def search(
+        self,
+        text: str,
+        scope: WishlistSearchScope,
+        requester_id: UserId,
+        limit: int,
+        offset: int = 0,
+    ) -> List[WishlistSearchHit]:
         ...
 
     async def add(self, wishlist: Wishlist) -> None:
         ...
 
+    async def add_many(self, wishlists: List[Wishlist]) -> None:
+        ...
+
     async def update(self, wishlist: Wishlist) -> None:
         ...
 
     async def delete(self, wishlist_id: WishlistId) -> None:
         ...
 
+    async def adjust_counters(
+        self,
+        wishlist_id: WishlistId,
+        items: int = 0,
+        received: int = 0,
+        comments: int = 0,
+    ) -> None:
+        ...
+
 
 class WishlistItemRepository(Protocol):
     async def get_by_id(self, item_id: WishlistItemId) -> Optional[WishlistItem]:
@@ -40,9 +78,32 @@ class WishlistItemRepository(Protocol):
     async def list_by_wishlist(self, wishlist_id: WishlistId) -> List[WishlistItem]:
         ...
 
+    def stream_by_owner(self, owner_id: UserId, batch_size: int = 500) -> AsyncIterator[WishlistItem]:
+        """Yield every item of the owner's wishlists, grouped by wishlist in position order."""
+        ...
+
+    async def position_after(
+        self, wishlist_id: WishlistId, position: Optional[str], exclude_id: WishlistItemId
+    ) -> Optional[str]:
+        ...
+
+    async def position_before(
+        self, wishlist_id: WishlistId, position: Optional[str], exclude_id: WishlistItemId
+    ) -> Optional[str]:
+        ...
+
+    async def set_position(self, item_id: WishlistItemId, position: str) -> None:
+        ...
+
+    async def set_positions(self, positions: List[Tuple[WishlistItemId, str]]) -> None:
+        ...
+
     async def add(self, item: WishlistItem) -> None:
         ...
 
+    async def add_many(self, items: List[WishlistItem]) -> None:
+        ...
+
     async def update(self, item: WishlistItem) -> None:
         ...
 
@@ -57,6 +118,10 @@ class WishlistItemCommentRepository(Protocol):
     async def list_by_item_ids(self, item_ids: List[WishlistItemId]) -> List[WishlistItemComment]:
         ...
 
+    def stream_by_wishlist_owner(self, owner_id: UserId, batch_size: int = 500) -> AsyncIterator[WishlistItemComment]:
+        """Yield every comment on items of the owner's wishlists."""
+        ...
+
     async def add(self, comment: WishlistItemComment) -> None:
         ...
 
@@ -7,6 +7,12 @@ APP_ENV="${APP_ENV:-development}"
 # Run database migrations before starting the app
 alembic upgrade head
 
+# Turn a bcrypt target time into one cost shared by every worker
+if [ -z "$PASSWORD_HASH_ROUNDS" ] && [ -n "$PASSWORD_HASH_TARGET_MS" ]; then
+  PASSWORD_HASH_ROUNDS="$(python -m backend.scripts.benchmark_password_hashing --target-ms "$PASSWORD_HASH_TARGET_MS" --print-rounds)"
+  export PASSWORD_HASH_ROUNDS
+fi
+
 if [ "$APP_ENV" = "production" ]; then
   exec uvicorn backend.presentation.app:app --host 0.0.0.0 --port 8000
 else
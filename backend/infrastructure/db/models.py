@@ -4,14 +4,19 @@ from datetime import date, datetime
 from typing import Optional
 from uuid import UUID as UUID_TYPE, uuid4
 
-from sqlalchemy import Boolean, Date, DateTime, Enum, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Computed, Date, DateTime, Enum, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .session import Base
 from backend.domain.wishlists.entities import WishlistVisibility
 
 
+# Text search configuration used by the generated tsvector columns and the
+# queries matching against them; "simple" keeps it language-agnostic.
+SEARCH_CONFIG = "simple"
+
+
 class UserModel(Base):
     __tablename__ = "users"
 
@@ -28,6 +33,15 @@ class UserModel(Base):
 
 class UserProfileModel(Base):
     __tablename__ = "user_profiles"
+    __table_args__ = tuple(
+        Index(
+            f"ix_user_profiles_{column}_trgm",
+            column,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+        for column in ("username", "first_name", "last_name")
+    )
 
     user_id: Mapped[UUID_TYPE] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
     username: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
@@ -41,8 +55,27 @@ class UserProfileModel(Base):
     user: Mapped[UserModel] = relationship(back_populates="profile")
 
 
+class RefreshTokenModel(Base):
+    __tablename__ = "refresh_tokens"
+
+    id: Mapped[UUID_TYPE] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id: Mapped[UUID_TYPE] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    session_id: Mapped[UUID_TYPE] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
+    token_hash: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
 class WishlistModel(Base):
     __tablename__ = "wishlists"
+    __table_args__ = (
+        Index("ix_wishlists_owner_id_visibility_updated_at", "owner_id", "visibility", "updated_at"),
+        Index("ix_wishlists_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_wishlists_owner_id_last_activity_at", "owner_id", text("last_activity_at DESC")),
+    )
 
     id: Mapped[UUID_TYPE] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     owner_id: Mapped[UUID_TYPE] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
@@ -53,6 +86,19 @@ class WishlistModel(Base):
     )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    item_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    received_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    comment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_activity_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     owner: Mapped[UserModel] = relationship(back_populates="wishlists")
     items: Mapped[list["WishlistItemModel"]] = relationship(back_populates="wishlist", cascade="all, delete-orphan")
@@ -63,6 +109,11 @@ class WishlistModel(Base):
 
 class WishlistItemModel(Base):
     __tablename__ = "wishlist_items"
+    __table_args__ = (
+        Index("ix_wishlist_items_wishlist_id_priority_created_at", "wishlist_id", "priority", "created_at"),
+        Index("ix_wishlist_items_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_wishlist_items_wishlist_id_position", "wishlist_id", "position"),
+    )
 
     id: Mapped[UUID_TYPE] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     wishlist_id: Mapped[UUID_TYPE] = mapped_column(UUID(as_uuid=True), ForeignKey("wishlists.id"), nullable=False, index=True)
@@ -72,14 +123,28 @@ class WishlistItemModel(Base):
     priority: Mapped[int | None] = mapped_column(Integer, nullable=True)
     is_received: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     received_note: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Byte-wise collation so Postgres orders rank keys the same way Python does
+    position: Mapped[str | None] = mapped_column(String(64, collation="C"), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     wishlist: Mapped[WishlistModel] = relationship(back_populates="items")
 
 
 class WishlistItemCommentModel(Base):
     __tablename__ = "wishlist_item_comments"
+    __table_args__ = (
+        Index("ix_wishlist_item_comments_wishlist_item_id_created_at", "wishlist_item_id", "created_at"),
+    )
 
     id: Mapped[UUID_TYPE] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     wishlist_item_id: Mapped[UUID_TYPE] = mapped_column(
@@ -99,6 +164,13 @@ class WishlistItemCommentModel(Base):
 
 class PublicWishlistShareModel(Base):
     __tablename__ = "public_wishlist_shares"
+    __table_args__ = (
+        Index(
+            "ix_public_wishlist_shares_expires_at",
+            "expires_at",
+            postgresql_where=text("expires_at IS NOT NULL"),
+        ),
+    )
 
     wishlist_id: Mapped[UUID_TYPE] = mapped_column(
         UUID(as_uuid=True), ForeignKey("wishlists.id"), primary_key=True
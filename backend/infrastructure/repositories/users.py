@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional, Sequence
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import case, exists, func, or_, select, text as sql_text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.domain.users.entities import User, UserId, UserProfile
-from backend.domain.users.repositories import UnitOfWork as UsersUnitOfWork, UserProfileRepository, UserRepository
-from backend.infrastructure.db.models import UserModel, UserProfileModel
+from backend.domain.users.entities import RefreshToken, User, UserId, UserProfile
+from backend.domain.users.repositories import (
+    RefreshTokenRepository,
+    UnitOfWork as UsersUnitOfWork,
+    UserProfileRepository,
+    UserRepository,
+)
+from backend.infrastructure.db.models import RefreshTokenModel, UserModel, UserProfileModel
 
 
 def _user_from_model(model: UserModel) -> User:
@@ -58,6 +66,25 @@ def _profile_to_model(profile: UserProfile, model: Optional[UserProfileModel] =
     return model
 
 
+def _refresh_token_from_model(model: RefreshTokenModel) -> RefreshToken:
+    return RefreshToken(
+        id=model.id,
+        user_id=UserId(value=model.user_id),
+        session_id=model.session_id,
+        token_hash=model.token_hash,
+        expires_at=model.expires_at,
+        created_at=model.created_at,
+        revoked_at=model.revoked_at,
+    )
+
+
+_QUERY_CANCELED = "57014"
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 class SqlAlchemyUserRepository(UserRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -78,6 +105,32 @@ class SqlAlchemyUserRepository(UserRepository):
         model = _user_to_model(user)
         self._session.add(model)
 
+    def _insert(self, user: User):
+        return pg_insert(UserModel).values(
+            id=user.id.value,
+            email=user.email,
+            password_hash=user.password_hash,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+    async def add_if_email_free(self, user: User) -> bool:
+        stmt = self._insert(user).on_conflict_do_nothing(index_elements=[UserModel.email]).returning(UserModel.id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def get_or_add_by_email(self, user: User) -> User:
+        # The no-op DO UPDATE makes RETURNING yield the existing row as well,
+        # so concurrent first logins for one email converge in one statement
+        stmt = self._insert(user)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserModel.email],
+            set_={"email": stmt.excluded.email},
+        ).returning(UserModel)
+        result = await self._session.scalars(stmt, execution_options={"populate_existing": True})
+        return _user_from_model(result.one())
+
     async def update(self, user: User) -> None:
         stmt = select(UserModel).where(UserModel.id == user.id.value)
         result = await self._session.execute(stmt)
@@ -98,10 +151,66 @@ class SqlAlchemyUserProfileRepository(UserProfileRepository):
         model = result.scalar_one_or_none()
         return _profile_from_model(model) if model else None
 
+    async def search(self, text: str, limit: int, timeout_ms: Optional[int] = None) -> List[UserProfile]:
+        columns = (UserProfileModel.username, UserProfileModel.first_name, UserProfileModel.last_name)
+        prefix = f"{_escape_like(text)}%"
+        is_prefix = or_(*(c.ilike(prefix) for c in columns))
+
+        # Both ILIKE and the % similarity operator are served by the gin_trgm_ops indexes
+        stmt = (
+            select(UserProfileModel)
+            .where(or_(is_prefix, *(c.op("%")(text) for c in columns)))
+            .order_by(
+                case((is_prefix, 0), else_=1),
+                func.greatest(*(func.similarity(c, text) for c in columns)).desc(),
+                UserProfileModel.username,
+            )
+            .limit(limit)
+        )
+
+        if timeout_ms is not None:
+            await self._session.execute(sql_text(f"SET LOCAL statement_timeout = {int(timeout_ms)}"))
+        try:
+            result = await self._session.execute(stmt)
+        except DBAPIError as e:
+            if getattr(e.orig, "sqlstate", None) == _QUERY_CANCELED:
+                raise TimeoutError("Profile search exceeded its latency budget") from e
+            raise
+        return [_profile_from_model(m) for m in result.scalars().all()]
+
     async def add(self, profile: UserProfile) -> None:
         model = _profile_to_model(profile)
         self._session.add(model)
 
+    async def upsert(self, profile: UserProfile, update_fields: Sequence[str] = ()) -> UserProfile:
+        stmt = pg_insert(UserProfileModel).values(
+            user_id=profile.user_id.value,
+            username=profile.username,
+            first_name=profile.first_name,
+            last_name=profile.last_name,
+            birthday=profile.birthday,
+            photo_url=profile.photo_url,
+            created_at=profile.created_at,
+            updated_at=profile.updated_at,
+        )
+        table = UserProfileModel.__table__
+        excluded = stmt.excluded
+
+        # Same rules as UserProfile.update_profile: None leaves a field alone,
+        # and updated_at only moves when something actually changed
+        set_: dict = {field: func.coalesce(excluded[field], table.c[field]) for field in update_fields}
+        if update_fields:
+            changed = or_(
+                *(excluded[field].is_not(None) & excluded[field].is_distinct_from(table.c[field]) for field in update_fields)
+            )
+            set_["updated_at"] = case((changed, excluded.updated_at), else_=table.c.updated_at)
+        else:
+            set_["user_id"] = excluded.user_id
+
+        stmt = stmt.on_conflict_do_update(index_elements=[UserProfileModel.user_id], set_=set_).returning(UserProfileModel)
+        result = await self._session.scalars(stmt, execution_options={"populate_existing": True})
+        return _profile_from_model(result.one())
+
     async def update(self, profile: UserProfile) -> None:
         stmt = select(UserProfileModel).where(UserProfileModel.user_id == profile.user_id.value)
         result = await self._session.execute(stmt)
@@ -112,11 +221,79 @@ class SqlAlchemyUserProfileRepository(UserProfileRepository):
         _profile_to_model(profile, model)
 
 
+class SqlAlchemyRefreshTokenRepository(RefreshTokenRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_by_hash(self, token_hash: str, for_update: bool = False) -> Optional[RefreshToken]:
+        stmt = select(RefreshTokenModel).where(RefreshTokenModel.token_hash == token_hash)
+        if for_update:
+            # Serializes concurrent rotations of the same token
+            stmt = stmt.with_for_update()
+        result = await self._session.execute(stmt)
+        model = result.scalar_one_or_none()
+        return _refresh_token_from_model(model) if model else None
+
+    async def add(self, token: RefreshToken) -> None:
+        self._session.add(
+            RefreshTokenModel(
+                id=token.id,
+                user_id=token.user_id.value,
+                session_id=token.session_id,
+                token_hash=token.token_hash,
+                expires_at=token.expires_at,
+                created_at=token.created_at,
+                revoked_at=token.revoked_at,
+            )
+        )
+
+    async def update(self, token: RefreshToken) -> None:
+        stmt = (
+            update(RefreshTokenModel)
+            .where(RefreshTokenModel.id == token.id)
+            .values(revoked_at=token.revoked_at)
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(stmt)
+
+    async def has_active_token(self, session_id: UUID) -> bool:
+        stmt = select(
+            exists().where(
+                RefreshTokenModel.session_id == session_id,
+                RefreshTokenModel.revoked_at.is_(None),
+                RefreshTokenModel.expires_at > func.now(),
+            )
+        )
+        result = await self._session.execute(stmt)
+        return bool(result.scalar())
+
+    async def revoke_session(self, session_id: UUID) -> None:
+        stmt = (
+            update(RefreshTokenModel)
+            .where(RefreshTokenModel.session_id == session_id, RefreshTokenModel.revoked_at.is_(None))
+            .values(revoked_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(stmt)
+
+    async def revoke_all_for_user(self, user_id: UserId) -> List[UUID]:
+        stmt = (
+            update(RefreshTokenModel)
+            .where(RefreshTokenModel.user_id == user_id.value, RefreshTokenModel.revoked_at.is_(None))
+            .values(revoked_at=func.now())
+            .returning(RefreshTokenModel.session_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return list(set(result.scalars().all()))
+
+
 class SqlAlchemyUsersUnitOfWork(UsersUnitOfWork):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
         self.users = SqlAlchemyUserRepository(session)
         self.profiles = SqlAlchemyUserProfileRepository(session)
+        self.refresh_tokens = SqlAlchemyRefreshTokenRepository(session)
 
     async def __aenter__(self) -> "SqlAlchemyUsersUnitOfWork":
         return self
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, AsyncIterator, FrozenSet, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, insert, literal_column, null, select, union_all, update
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import load_only
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.domain.users.entities import UserId
@@ -10,11 +13,14 @@ from backend.domain.wishlists.entities import (
     PublicShareToken,
     PublicWishlistShare,
     Wishlist,
+    WishlistFields,
     WishlistId,
     WishlistItem,
     WishlistItemComment,
     WishlistItemCommentId,
     WishlistItemId,
+    WishlistSearchHit,
+    WishlistSearchScope,
     WishlistVisibility,
 )
 from backend.domain.wishlists.repositories import (
@@ -25,6 +31,7 @@ from backend.domain.wishlists.repositories import (
     WishlistRepository,
 )
 from backend.infrastructure.db.models import (
+    SEARCH_CONFIG,
     PublicWishlistShareModel,
     WishlistItemCommentModel,
     WishlistItemModel,
@@ -32,39 +39,64 @@ from backend.infrastructure.db.models import (
 )
 
 
+_WISHLIST_ATTRS = (
+    "name",
+    "description",
+    "visibility",
+    "created_at",
+    "updated_at",
+    "item_count",
+    "received_count",
+    "comment_count",
+    "last_activity_at",
+)
+_ITEM_ATTRS = (
+    "title",
+    "description",
+    "link",
+    "priority",
+    "is_received",
+    "received_note",
+    "position",
+    "created_at",
+    "updated_at",
+)
+
+
+def _loaded(model, names: tuple[str, ...]) -> dict[str, Any]:
+    # Columns deferred by a sparse read keep the entity defaults; touching them
+    # would trigger a lazy load, which an async session cannot do
+    unloaded = sa_inspect(model).unloaded
+    return {name: getattr(model, name) for name in names if name not in unloaded}
+
+
+def _load_only(model_cls, keys: tuple, names: Optional[FrozenSet[str]]):
+    # Same attribute names on the entity, the response and the model
+    return load_only(*keys, *(getattr(model_cls, name) for name in sorted(names)))
+
+
 def _wishlist_from_model(model: WishlistModel, items: Optional[list[WishlistItemModel]] = None) -> Wishlist:
     wishlist = Wishlist(
         id=WishlistId(value=model.id),
         owner_id=UserId(value=model.owner_id),
-        name=model.name,
-        description=model.description,
-        visibility=model.visibility,
-        created_at=model.created_at,
-        updated_at=model.updated_at,
+        **{"name": "", **_loaded(model, _WISHLIST_ATTRS)},
     )
 
     if items is not None:
-        wishlist.items = [
-            WishlistItem(
-                id=WishlistItemId(value=i.id),
-                wishlist_id=WishlistId(value=i.wishlist_id),
-                title=i.title,
-                description=i.description,
-                link=i.link,
-                priority=i.priority,
-                is_received=i.is_received,
-                received_note=i.received_note,
-                created_at=i.created_at,
-                updated_at=i.updated_at,
-            )
-            for i in items
-        ]
+        wishlist.items = [_item_from_model(i) for i in items]
     return wishlist
 
 
 def _wishlist_to_model(wishlist: Wishlist, model: Optional[WishlistModel] = None) -> WishlistModel:
     if model is None:
-        model = WishlistModel(id=wishlist.id.value)
+        # Counters are only written on insert; afterwards adjust_counters() owns them
+        model = WishlistModel(
+            id=wishlist.id.value,
+            item_count=wishlist.item_count,
+            received_count=wishlist.received_count,
+            comment_count=wishlist.comment_count,
+            last_activity_at=wishlist.last_activity_at or wishlist.created_at,
+        )
     model.owner_id = wishlist.owner_id.value
     model.name = wishlist.name
     model.description = wishlist.description
@@ -74,18 +106,14 @@ def _wishlist_to_model(wishlist: Wishlist, model: Optional[WishlistModel] = None
     return model
 
 
+_ITEM_ORDER = (WishlistItemModel.position, WishlistItemModel.created_at)
+
+
 def _item_from_model(model: WishlistItemModel) -> WishlistItem:
     return WishlistItem(
         id=WishlistItemId(value=model.id),
         wishlist_id=WishlistId(value=model.wishlist_id),
-        title=model.title,
-        description=model.description,
-        link=model.link,
-        priority=model.priority,
-        is_received=model.is_received,
-        received_note=model.received_note,
-        created_at=model.created_at,
-        updated_at=model.updated_at,
+        **{"title": "", **_loaded(model, _ITEM_ATTRS)},
     )
 
 
@@ -98,6 +126,7 @@ def _item_to_model(item: WishlistItem, model: Optional[WishlistItemModel] = None
     model.priority = item.priority
     model.is_received = item.is_received
     model.received_note = item.received_note
+    model.position = item.position
     model.created_at = item.created_at
     model.updated_at = item.updated_at
     return model
@@ -150,34 +179,151 @@ class SqlAlchemyWishlistRepository(WishlistRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def get_by_id(self, wishlist_id: WishlistId) -> Optional[Wishlist]:
-        stmt = select(WishlistModel).where(WishlistModel.id == wishlist_id.value)
+    def _wishlists_stmt(self, fields: Optional[WishlistFields]):
+        stmt = select(WishlistModel)
+        if fields is not None and fields.wishlist is not None:
+            stmt = stmt.options(_load_only(WishlistModel, (WishlistModel.id, WishlistModel.owner_id), fields.wishlist))
+        return stmt
+
+    def _items_stmt(self, wishlist_id, fields: Optional[WishlistFields]):
+        stmt = select(WishlistItemModel).where(WishlistItemModel.wishlist_id == wishlist_id).order_by(*_ITEM_ORDER)
+        if fields is not None and fields.items is not None:
+            stmt = stmt.options(
+                _load_only(WishlistItemModel, (WishlistItemModel.id, WishlistItemModel.wishlist_id), fields.items)
+            )
+        return stmt
+
+    async def get_by_id(
+        self, wishlist_id: WishlistId, fields: Optional[WishlistFields] = None, for_update: bool = False
+    ) -> Optional[Wishlist]:
+        stmt = self._wishlists_stmt(fields).where(WishlistModel.id == wishlist_id.value)
+        if for_update:
+            stmt = stmt.with_for_update()
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
         if model is None:
             return None
+        if fields is not None and not fields.include_items:
+            return _wishlist_from_model(model)
         # Load items for aggregate
-        items_stmt = select(WishlistItemModel).where(WishlistItemModel.wishlist_id == model.id)
-        items_result = await self._session.execute(items_stmt)
+        items_result = await self._session.execute(self._items_stmt(model.id, fields))
         items = list(items_result.scalars().all())
         return _wishlist_from_model(model, items)
 
-    async def list_by_owner(self, owner_id: UserId) -> List[Wishlist]:
-        stmt = select(WishlistModel).where(WishlistModel.owner_id == owner_id.value)
+    async def list_by_owner(
+        self,
+        owner_id: UserId,
+        include_items: bool = True,
+        order_by_activity: bool = False,
+        fields: Optional[WishlistFields] = None,
+    ) -> List[Wishlist]:
+        stmt = self._wishlists_stmt(fields).where(WishlistModel.owner_id == owner_id.value)
+        if order_by_activity:
+            stmt = stmt.order_by(WishlistModel.last_activity_at.desc().nulls_last(), WishlistModel.created_at.desc())
+        else:
+            stmt = stmt.order_by(WishlistModel.created_at)
         result = await self._session.execute(stmt)
         models = result.scalars().all()
+        if not include_items or (fields is not None and not fields.include_items):
+            return [_wishlist_from_model(model) for model in models]
+
         wishlists: list[Wishlist] = []
         for model in models:
-            items_stmt = select(WishlistItemModel).where(WishlistItemModel.wishlist_id == model.id)
-            items_result = await self._session.execute(items_stmt)
+            items_result = await self._session.execute(self._items_stmt(model.id, fields))
             items = list(items_result.scalars().all())
             wishlists.append(_wishlist_from_model(model, items))
         return wishlists
 
+    async def stream_by_owner(self, owner_id: UserId, batch_size: int = 500) -> AsyncIterator[Wishlist]:
+        stmt = (
+            select(WishlistModel)
+            .where(WishlistModel.owner_id == owner_id.value)
+            .order_by(WishlistModel.created_at)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream_scalars(stmt)
+        async for model in result:
+            yield _wishlist_from_model(model)
+
+    async def search(
+        self,
+        text: str,
+        scope: WishlistSearchScope,
+        requester_id: UserId,
+        limit: int,
+        offset: int = 0,
+    ) -> List[WishlistSearchHit]:
+        query = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), text)
+        if scope == WishlistSearchScope.MINE:
+            in_scope = WishlistModel.owner_id == requester_id.value
+        else:
+            in_scope = WishlistModel.visibility == WishlistVisibility.PUBLIC
+
+        wishlist_hits = select(
+            WishlistModel.id.label("wishlist_id"),
+            WishlistModel.owner_id.label("owner_id"),
+            null().cast(UUID(as_uuid=True)).label("item_id"),
+            WishlistModel.name.label("title"),
+            func.ts_rank(WishlistModel.search_vector, query).label("rank"),
+        ).where(in_scope, WishlistModel.search_vector.op("@@")(query))
+
+        item_hits = (
+            select(
+                WishlistItemModel.wishlist_id,
+                WishlistModel.owner_id,
+                WishlistItemModel.id,
+                WishlistItemModel.title,
+                func.ts_rank(WishlistItemModel.search_vector, query),
+            )
+            .join(WishlistModel, WishlistModel.id == WishlistItemModel.wishlist_id)
+            .where(in_scope, WishlistItemModel.search_vector.op("@@")(query))
+        )
+
+        hits = union_all(wishlist_hits, item_hits).subquery()
+        stmt = (
+            select(hits)
+            .order_by(hits.c.rank.desc(), hits.c.wishlist_id, hits.c.item_id.nulls_first())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            WishlistSearchHit(
+                wishlist_id=WishlistId(value=row.wishlist_id),
+                owner_id=UserId(value=row.owner_id),
+                title=row.title,
+                rank=float(row.rank),
+                item_id=WishlistItemId(value=row.item_id) if row.item_id else None,
+            )
+            for row in result
+        ]
+
     async def add(self, wishlist: Wishlist) -> None:
         model = _wishlist_to_model(wishlist)
         self._session.add(model)
 
+    async def add_many(self, wishlists: List[Wishlist]) -> None:
+        if not wishlists:
+            return
+        # One multi-row INSERT on the table, bypassing unit-of-work bookkeeping
+        rows = [
+            {
+                "id": wishlist.id.value,
+                "owner_id": wishlist.owner_id.value,
+                "name": wishlist.name,
+                "description": wishlist.description,
+                "visibility": wishlist.visibility,
+                "created_at": wishlist.created_at,
+                "updated_at": wishlist.updated_at,
+                "item_count": wishlist.item_count,
+                "received_count": wishlist.received_count,
+                "comment_count": wishlist.comment_count,
+                "last_activity_at": wishlist.last_activity_at or wishlist.created_at,
+            }
+            for wishlist in wishlists
+        ]
+        await self._session.execute(insert(WishlistModel.__table__).values(rows))
+
     async def update(self, wishlist: Wishlist) -> None:
         stmt = select(WishlistModel).where(WishlistModel.id == wishlist.id.value)
         result = await self._session.execute(stmt)
@@ -195,6 +341,28 @@ class SqlAlchemyWishlistRepository(WishlistRepository):
             await self._session.delete(model)
 
 
+    async def adjust_counters(
+        self,
+        wishlist_id: WishlistId,
+        items: int = 0,
+        received: int = 0,
+        comments: int = 0,
+    ) -> None:
+        # Relative UPDATE so concurrent writers never overwrite each other's deltas
+        stmt = (
+            update(WishlistModel)
+            .where(WishlistModel.id == wishlist_id.value)
+            .values(
+                item_count=WishlistModel.item_count + items,
+                received_count=WishlistModel.received_count + received,
+                comment_count=WishlistModel.comment_count + comments,
+                last_activity_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(stmt)
+
+
 class SqlAlchemyWishlistItemCommentRepository(WishlistItemCommentRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -213,6 +381,21 @@ class SqlAlchemyWishlistItemCommentRepository(WishlistItemCommentRepository):
         result = await self._session.execute(stmt)
         return [_comment_from_model(m) for m in result.scalars().all()]
 
+    async def stream_by_wishlist_owner(
+        self, owner_id: UserId, batch_size: int = 500
+    ) -> AsyncIterator[WishlistItemComment]:
+        stmt = (
+            select(WishlistItemCommentModel)
+            .join(WishlistItemModel, WishlistItemModel.id == WishlistItemCommentModel.wishlist_item_id)
+            .join(WishlistModel, WishlistModel.id == WishlistItemModel.wishlist_id)
+            .where(WishlistModel.owner_id == owner_id.value)
+            .order_by(WishlistItemCommentModel.wishlist_item_id, WishlistItemCommentModel.created_at)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream_scalars(stmt)
+        async for model in result:
+            yield _comment_from_model(model)
+
     async def add(self, comment: WishlistItemComment) -> None:
         model = _comment_to_model(comment)
         self._session.add(model)
@@ -236,17 +419,98 @@ class SqlAlchemyWishlistItemRepository(WishlistItemRepository):
         return _item_from_model(model) if model else None
 
     async def list_by_wishlist(self, wishlist_id: WishlistId) -> List[WishlistItem]:
-        stmt = select(WishlistItemModel).where(WishlistItemModel.wishlist_id == wishlist_id.value)
+        stmt = (
+            select(WishlistItemModel)
+            .where(WishlistItemModel.wishlist_id == wishlist_id.value)
+            .order_by(*_ITEM_ORDER)
+        )
         result = await self._session.execute(stmt)
         return [
             _item_from_model(model)
             for model in result.scalars().all()
         ]
 
+    async def stream_by_owner(self, owner_id: UserId, batch_size: int = 500) -> AsyncIterator[WishlistItem]:
+        # yield_per runs a server-side cursor; the identity map only holds weak
+        # references, so rows already yielded can be collected
+        stmt = (
+            select(WishlistItemModel)
+            .join(WishlistModel, WishlistModel.id == WishlistItemModel.wishlist_id)
+            .where(WishlistModel.owner_id == owner_id.value)
+            .order_by(WishlistModel.created_at, WishlistModel.id, *_ITEM_ORDER)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream_scalars(stmt)
+        async for model in result:
+            yield _item_from_model(model)
+
+    async def position_after(
+        self, wishlist_id: WishlistId, position: Optional[str], exclude_id: WishlistItemId
+    ) -> Optional[str]:
+        stmt = select(func.min(WishlistItemModel.position)).where(
+            WishlistItemModel.wishlist_id == wishlist_id.value,
+            WishlistItemModel.id != exclude_id.value,
+        )
+        if position is not None:
+            stmt = stmt.where(WishlistItemModel.position > position)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def position_before(
+        self, wishlist_id: WishlistId, position: Optional[str], exclude_id: WishlistItemId
+    ) -> Optional[str]:
+        stmt = select(func.max(WishlistItemModel.position)).where(
+            WishlistItemModel.wishlist_id == wishlist_id.value,
+            WishlistItemModel.id != exclude_id.value,
+        )
+        if position is not None:
+            stmt = stmt.where(WishlistItemModel.position < position)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def set_position(self, item_id: WishlistItemId, position: str) -> None:
+        stmt = (
+            update(WishlistItemModel)
+            .where(WishlistItemModel.id == item_id.value)
+            .values(position=position)
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(stmt)
+
+    async def set_positions(self, positions: List[Tuple[WishlistItemId, str]]) -> None:
+        if not positions:
+            return
+        table = WishlistItemModel.__table__
+        stmt = update(table).where(table.c.id == bindparam("b_id")).values(position=bindparam("b_position"))
+        await self._session.execute(
+            stmt, [{"b_id": item_id.value, "b_position": position} for item_id, position in positions]
+        )
+
     async def add(self, item: WishlistItem) -> None:
         model = _item_to_model(item)
         self._session.add(model)
 
+    async def add_many(self, items: List[WishlistItem]) -> None:
+        if not items:
+            return
+        rows = [
+            {
+                "id": item.id.value,
+                "wishlist_id": item.wishlist_id.value,
+                "title": item.title,
+                "description": item.description,
+                "link": item.link,
+                "priority": item.priority,
+                "is_received": item.is_received,
+                "received_note": item.received_note,
+                "position": item.position,
+                "created_at": item.created_at,
+                "updated_at": item.updated_at,
+            }
+            for item in items
+        ]
+        await self._session.execute(insert(WishlistItemModel.__table__).values(rows))
+
     async def update(self, item: WishlistItem) -> None:
         stmt = select(WishlistItemModel).where(WishlistItemModel.id == item.id.value)
         result = await self._session.execute(stmt)
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable
+
+
+# In-process registry of stats providers, read by the internal metrics route.
+# Providers are called on demand, so registering one costs nothing per request.
+
+_providers: dict[str, Callable[[], Any]] = {}
+
+
+def register_metrics(name: str, provider: Callable[[], Any]) -> None:
+    _providers[name] = provider
+
+
+def collect_metrics() -> dict[str, Any]:
+    snapshot: dict[str, Any] = {}
+    for name, provider in _providers.items():
+        value = provider()
+        snapshot[name] = asdict(value) if is_dataclass(value) else value
+    return snapshot
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitDecision:
+    allowed: bool
+    remaining: int
+    retry_after: int
+
+
+class RateLimiter(Protocol):
+    async def hit(self, key: str, limit: int, window_seconds: int, cost: int = 1) -> RateLimitDecision:
+        ...
+
+
+def gcra(
+    tat: Optional[float], now: float, limit: int, window_seconds: int, cost: int = 1
+) -> tuple[RateLimitDecision, Optional[float]]:
+    """Decide one hit against a stored theoretical arrival time (TAT).
+
+    Same rule as the Redis script. Returns the decision and the TAT to store,
+    which is None when the hit is denied and the stored value stays as is.
+    """
+    period = float(window_seconds)
+    interval = period / limit
+    tat = now if tat is None or tat < now else tat
+    new_tat = tat + cost * interval
+    allow_at = new_tat - period
+    if allow_at > now:
+        remaining = math.floor((period - (tat - now)) / interval)
+        return RateLimitDecision(False, max(0, remaining), math.ceil(allow_at - now)), None
+    remaining = math.floor((period - (new_tat - now)) / interval)
+    return RateLimitDecision(True, max(0, remaining), 0), new_tat
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from backend.infrastructure.services.rate_limiting.base import RateLimitDecision, RateLimiter
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True, slots=True)
+class CircuitBreakerStats:
+    state: str
+    consecutive_failures: int
+    failures: int
+    timeouts: int
+    trips: int
+    fallback_hits: int
+
+
+class CircuitBreakerRateLimiter(RateLimiter):
+    """Bounds the latency of a remote limiter and fails over to a local one.
+
+    Each call to ``primary`` gets ``timeout`` seconds. After
+    ``failure_threshold`` consecutive failures the circuit opens and every hit
+    goes to ``fallback`` for ``reset_seconds``; then a single probe is let
+    through (half-open) and its outcome closes or re-opens the circuit. An
+    outage thus costs limit accuracy, never request latency beyond one timeout.
+    """
+
+    def __init__(
+        self,
+        primary: RateLimiter,
+        fallback: RateLimiter,
+        timeout: float,
+        failure_threshold: int = 5,
+        reset_seconds: float = 10.0,
+    ) -> None:
+        self._primary = primary
+        self._fallback = fallback
+        self._timeout = timeout
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_seconds = reset_seconds
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._consecutive_failures = 0
+        self._failures = 0
+        self._timeouts = 0
+        self._trips = 0
+        self._fallback_hits = 0
+
+    async def hit(self, key: str, limit: int, window_seconds: int, cost: int = 1) -> RateLimitDecision:
+        probe = False
+        if self._state != CLOSED:
+            if self._probing or time.monotonic() - self._opened_at < self._reset_seconds:
+                return await self._fall_back(key, limit, window_seconds, cost)
+            self._state = HALF_OPEN
+            self._probing = probe = True
+
+        try:
+            decision = await asyncio.wait_for(
+                self._primary.hit(key=key, limit=limit, window_seconds=window_seconds, cost=cost),
+                timeout=self._timeout,
+            )
+        except Exception as exc:
+            self._record_failure(timed_out=isinstance(exc, asyncio.TimeoutError))
+            return await self._fall_back(key, limit, window_seconds, cost)
+        finally:
+            if probe:
+                self._probing = False
+
+        self._consecutive_failures = 0
+        self._state = CLOSED
+        return decision
+
+    async def _fall_back(self, key: str, limit: int, window_seconds: int, cost: int) -> RateLimitDecision:
+        self._fallback_hits += 1
+        return await self._fallback.hit(key=key, limit=limit, window_seconds=window_seconds, cost=cost)
+
+    def _record_failure(self, timed_out: bool) -> None:
+        self._failures += 1
+        self._timeouts += timed_out
+        self._consecutive_failures += 1
+        if self._state == HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+            if self._state != OPEN:
+                self._trips += 1
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+
+    def stats(self) -> CircuitBreakerStats:
+        return CircuitBreakerStats(
+            state=self._state,
+            consecutive_failures=self._consecutive_failures,
+            failures=self._failures,
+            timeouts=self._timeouts,
+            trips=self._trips,
+            fallback_hits=self._fallback_hits,
+        )
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from backend.infrastructure.services.rate_limiting.base import RateLimitDecision, RateLimiter
+
+
+@dataclass(slots=True)
+class _Lease:
+    tokens: int
+    expires_at: float
+    # Backend's remaining budget when the lease was taken; sizes the next one
+    remaining: int
+    denied_until: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class LeasedRateLimiterStats:
+    keys: int
+    local_grants: int
+    local_denials: int
+    backend_calls: int
+    lease_fraction: float
+
+
+class LeasedRateLimiter(RateLimiter):
+    """Grants hits from small budgets leased in batches from a shared limiter.
+
+    A lease takes up to ``lease_fraction * limit`` tokens from the backend in
+    one call and is spent locally until it runs out or the window passes, so
+    a client well under its limit costs one backend call per batch, not per
+    hit. Clients close to their limit get single-token leases, i.e. exact
+    per-request checks, and a backend denial is remembered until its
+    retry-after so hammering clients stay local too.
+
+    Tokens are deducted when leased, so each worker can be off by at most one
+    lease: tokens a worker still holds are unavailable to the others, and
+    tokens spent late in a lease's window count against its start. Either
+    way a global limit holds within ``workers * lease_fraction * limit``.
+    """
+
+    def __init__(self, backend: RateLimiter, lease_fraction: float, max_keys: int) -> None:
+        if not 0 < lease_fraction <= 1:
+            raise ValueError("lease_fraction must be in (0, 1]")
+        self._backend = backend
+        self._lease_fraction = lease_fraction
+        self._max_keys = max_keys
+        self._leases: OrderedDict[str, _Lease] = OrderedDict()
+        self._local_grants = 0
+        self._local_denials = 0
+        self._backend_calls = 0
+
+    async def hit(self, key: str, limit: int, window_seconds: int, cost: int = 1) -> RateLimitDecision:
+        now = time.monotonic()
+        lease = self._leases.get(key)
+        if lease is not None:
+            self._leases.move_to_end(key)
+            if now < lease.denied_until:
+                self._local_denials += 1
+                return RateLimitDecision(False, 0, math.ceil(lease.denied_until - now))
+            if now < lease.expires_at and lease.tokens >= cost:
+                lease.tokens -= cost
+                self._local_grants += 1
+                return RateLimitDecision(True, lease.remaining + lease.tokens, 0)
+
+        batch = max(1, int(limit * self._lease_fraction))
+        if lease is not None:
+            # Near the limit, lease at most half of what is left so the last
+            # tokens are not stranded in one worker
+            batch = max(1, min(batch, lease.remaining // 2))
+        size = max(batch, cost)
+
+        decision = await self._call(key, limit, window_seconds, size)
+        if not decision.allowed and size > cost:
+            # Not enough left for a batch; fall back to an exact check
+            size = cost
+            decision = await self._call(key, limit, window_seconds, size)
+
+        now = time.monotonic()
+        if decision.allowed:
+            lease = _Lease(
+                tokens=size - cost,
+                expires_at=now + window_seconds,
+                remaining=decision.remaining,
+            )
+        else:
+            lease = _Lease(tokens=0, expires_at=now, remaining=0, denied_until=now + decision.retry_after)
+        self._leases[key] = lease
+        self._leases.move_to_end(key)
+        while len(self._leases) > self._max_keys:
+            self._leases.popitem(last=False)
+
+        if not decision.allowed:
+            return decision
+        return RateLimitDecision(True, decision.remaining + lease.tokens, 0)
+
+    async def _call(self, key: str, limit: int, window_seconds: int, cost: int) -> RateLimitDecision:
+        self._backend_calls += 1
+        return await self._backend.hit(key=key, limit=limit, window_seconds=window_seconds, cost=cost)
+
+    def stats(self) -> LeasedRateLimiterStats:
+        return LeasedRateLimiterStats(
+            keys=len(self._leases),
+            local_grants=self._local_grants,
+            local_denials=self._local_denials,
+            backend_calls=self._backend_calls,
+            lease_fraction=self._lease_fraction,
+        )
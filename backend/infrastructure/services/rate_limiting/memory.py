@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import heapq
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from backend.infrastructure.services.rate_limiting.base import RateLimitDecision, RateLimiter, gcra
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryRateLimiterStats:
+    keys: int
+    max_keys: int
+    expired: int
+    evictions: int
+    sweeps: int
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """Per-process GCRA limiter with a hard cap on tracked keys.
+
+    Each key holds only its theoretical arrival time (TAT), which is also the
+    moment the key stops mattering. An expiry-ordered heap lets a periodic
+    sweep drop idle keys, and past ``max_keys`` the least recently used ones
+    are shed, so memory stays flat however many distinct clients show up.
+    """
+
+    def __init__(self, max_keys: int, sweep_interval: float = 1.0) -> None:
+        if max_keys < 1:
+            raise ValueError("max_keys must be at least 1")
+        self._max_keys = max_keys
+        self._sweep_interval = sweep_interval
+        self._tats: OrderedDict[str, float] = OrderedDict()
+        # (tat, key) pushed on every update; stale pairs are skipped on pop
+        self._expiry: list[tuple[float, str]] = []
+        self._next_sweep = 0.0
+        self._expired = 0
+        self._evictions = 0
+        self._sweeps = 0
+
+    async def hit(self, key: str, limit: int, window_seconds: int, cost: int = 1) -> RateLimitDecision:
+        # No awaits below, so the read-modify-write is atomic on the event loop
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+        decision, new_tat = gcra(self._tats.get(key), now, limit, window_seconds, cost)
+        if new_tat is None:
+            return decision
+
+        self._tats[key] = new_tat
+        self._tats.move_to_end(key)
+        heapq.heappush(self._expiry, (new_tat, key))
+        while len(self._tats) > self._max_keys:
+            self._tats.popitem(last=False)
+            self._evictions += 1
+        return decision
+
+    def _sweep(self, now: float) -> None:
+        self._next_sweep = now + self._sweep_interval
+        self._sweeps += 1
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            tat, key = heapq.heappop(expiry)
+            if self._tats.get(key) == tat:
+                del self._tats[key]
+                self._expired += 1
+        # Stale pairs from repeat hits and LRU shedding would otherwise let the
+        # heap outgrow the key cap
+        if len(expiry) > 2 * len(self._tats) + 1024:
+            self._expiry = [(tat, key) for key, tat in self._tats.items()]
+            heapq.heapify(self._expiry)
+
+    def stats(self) -> MemoryRateLimiterStats:
+        return MemoryRateLimiterStats(
+            keys=len(self._tats),
+            max_keys=self._max_keys,
+            expired=self._expired,
+            evictions=self._evictions,
+            sweeps=self._sweeps,
+        )
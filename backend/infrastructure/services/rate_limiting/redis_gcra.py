@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from backend.infrastructure.services.rate_limiting.base import RateLimitDecision, RateLimiter
+
+
+# GCRA (generic cell rate algorithm): each key stores only its "theoretical
+# arrival time" (TAT). A request of weight `cost` pushes the TAT forward by
+# cost * window / limit and is allowed while the TAT stays within one window
+# of now. That is a true sliding limit -- no 2x burst at window edges -- with
+# O(1) state, and the script reads the clock, decides and writes the new TAT
+# (with its TTL) atomically in a single round trip.
+GCRA_SCRIPT = """
+local period = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local interval = period / limit
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + tonumber(t[2]) / 1000
+
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+  tat = now
+end
+
+local new_tat = tat + cost * interval
+local allow_at = new_tat - period
+if allow_at > now then
+  return {0, math.floor((period - (tat - now)) / interval), math.ceil(allow_at - now)}
+end
+
+redis.call('SET', KEYS[1], string.format('%.3f', new_tat), 'PX', math.ceil(new_tat - now))
+return {1, math.floor((period - (new_tat - now)) / interval), 0}
+"""
+
+
+class RedisGcraRateLimiter(RateLimiter):
+    def __init__(self, client: Any) -> None:
+        # register_script sends EVALSHA and only re-loads the body on NOSCRIPT
+        self._script = client.register_script(GCRA_SCRIPT)
+
+    async def hit(self, key: str, limit: int, window_seconds: int, cost: int = 1) -> RateLimitDecision:
+        allowed, remaining, retry_after_ms = await self._script(keys=[key], args=[window_seconds * 1000, limit, cost])
+        return RateLimitDecision(
+            allowed=bool(allowed),
+            remaining=max(0, int(remaining)),
+            retry_after=math.ceil(int(retry_after_ms) / 1000),
+        )
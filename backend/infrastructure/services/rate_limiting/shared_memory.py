@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import time
+from dataclasses import dataclass
+
+from backend.infrastructure.services.rate_limiting.base import RateLimitDecision, RateLimiter, gcra
+
+try:
+    import fcntl
+except Exception:  # pragma: no cover
+    fcntl = None
+
+
+_MAGIC = b"NIWRL001"
+_HEADER = struct.Struct("<8sQ")
+_HEADER_BYTES = 64
+# Slot: 64-bit key hash (0 = empty) and the key's TAT as wall-clock seconds
+_SLOT = struct.Struct("<Qd")
+_BUCKET_SLOTS = 8
+_BUCKET = struct.Struct("<" + "Qd" * _BUCKET_SLOTS)
+_BUCKET_BYTES = _BUCKET.size
+
+
+@dataclass(frozen=True, slots=True)
+class SharedMemoryRateLimiterStats:
+    path: str
+    slots: int
+    live_keys: int
+    evictions: int
+
+
+class SharedMemoryRateLimiter(RateLimiter):
+    """GCRA limiter whose state lives in a memory-mapped file shared by all
+    workers on the host.
+
+    The file is a fixed-size hash table of 8-slot buckets. A hit locks only its
+    bucket's byte range (``fcntl.lockf``) for the read-modify-write, so workers
+    contend per bucket rather than on one global lock. Expired slots are reused
+    in place and a full bucket overwrites the slot closest to expiry, so the
+    file never grows.
+    """
+
+    def __init__(self, path: str, slots: int) -> None:
+        if fcntl is None:
+            raise RuntimeError("fcntl is not available on this platform")
+        buckets = max(1, slots // _BUCKET_SLOTS)
+        self._path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self._buckets = self._attach(buckets)
+            self._mm = mmap.mmap(self._fd, _HEADER_BYTES + self._buckets * _BUCKET_BYTES)
+        except BaseException:
+            os.close(self._fd)
+            raise
+        self._evictions = 0
+
+    def _attach(self, buckets: int) -> int:
+        # The first worker sizes and stamps the file; the rest adopt its layout
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, _HEADER_BYTES, 0)
+        try:
+            magic, existing = _HEADER.unpack(os.pread(self._fd, _HEADER.size, 0).ljust(_HEADER.size, b"\0"))
+            size = os.fstat(self._fd).st_size
+            if magic == _MAGIC and existing and size >= _HEADER_BYTES + existing * _BUCKET_BYTES:
+                return existing
+            os.ftruncate(self._fd, 0)
+            os.ftruncate(self._fd, _HEADER_BYTES + buckets * _BUCKET_BYTES)
+            os.pwrite(self._fd, _HEADER.pack(_MAGIC, buckets), 0)
+            return buckets
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, _HEADER_BYTES, 0)
+
+    async def hit(self, key: str, limit: int, window_seconds: int, cost: int = 1) -> RateLimitDecision:
+        digest = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+        key_hash = digest | 1
+        offset = _HEADER_BYTES + (digest >> 1) % self._buckets * _BUCKET_BYTES
+
+        # Wall clock rather than monotonic: the TATs are compared across processes
+        now = time.time()
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, _BUCKET_BYTES, offset)
+        try:
+            bucket = _BUCKET.unpack_from(self._mm, offset)
+            slot = None
+            stored = None
+            victim, victim_tat = 0, float("inf")
+            for index in range(_BUCKET_SLOTS):
+                slot_hash, slot_tat = bucket[2 * index], bucket[2 * index + 1]
+                if slot_hash == key_hash:
+                    slot, stored = index, slot_tat
+                    break
+                if slot_tat < victim_tat:
+                    victim, victim_tat = index, slot_tat
+
+            decision, new_tat = gcra(stored, now, limit, window_seconds, cost)
+            if new_tat is not None:
+                if slot is None:
+                    slot = victim
+                    if bucket[2 * victim] and victim_tat > now:
+                        self._evictions += 1
+                _SLOT.pack_into(self._mm, offset + slot * _SLOT.size, key_hash, new_tat)
+            return decision
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, _BUCKET_BYTES, offset)
+
+    def stats(self) -> SharedMemoryRateLimiterStats:
+        now = time.time()
+        live = sum(
+            1
+            for slot_hash, slot_tat in _SLOT.iter_unpack(self._mm[_HEADER_BYTES:])
+            if slot_hash and slot_tat > now
+        )
+        return SharedMemoryRateLimiterStats(
+            path=self._path,
+            slots=self._buckets * _BUCKET_SLOTS,
+            live_keys=live,
+            evictions=self._evictions,
+        )
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Iterable
+from uuid import UUID
+
+from backend.application.common.interfaces import TokenRevocationList
+
+try:
+    import redis.asyncio as redis
+except Exception:  # pragma: no cover
+    redis = None
+
+
+_MASK64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over UUID keys.
+
+    Session ids are random UUIDs, so their own bits serve as the two base
+    hashes for double hashing; a lookup is a handful of integer ops and bit
+    tests with no digest to compute.
+    """
+
+    def __init__(self, size_bits: int, hashes: int) -> None:
+        if size_bits < 8 or size_bits & (size_bits - 1):
+            raise ValueError("size_bits must be a power of two of at least 8")
+        self._mask = size_bits - 1
+        self._hashes = hashes
+        self._bits = bytearray(size_bits // 8)
+
+    def add(self, key: UUID) -> None:
+        value = key.int
+        h1, h2 = value & _MASK64, (value >> 64) | 1
+        for i in range(self._hashes):
+            bit = (h1 + i * h2) & self._mask
+            self._bits[bit >> 3] |= 1 << (bit & 7)
+
+    def might_contain(self, key: UUID) -> bool:
+        value = key.int
+        h1, h2 = value & _MASK64, (value >> 64) | 1
+        for i in range(self._hashes):
+            bit = (h1 + i * h2) & self._mask
+            if not self._bits[bit >> 3] & (1 << (bit & 7)):
+                return False
+        return True
+
+
+@dataclass(frozen=True, slots=True)
+class RevocationStats:
+    revoked: int
+    checks: int
+    filter_hits: int
+    confirmed: int
+    syncs: int
+    sync_errors: int
+
+
+class SessionRevocationList(TokenRevocationList):
+    """Denylist of session ids whose access tokens must stop working.
+
+    Entries only need to outlive the longest access token, so the list stays
+    small. Checks run against a per-process Bloom filter and fall through to
+    the exact map only on a filter hit. With Redis configured, revocations
+    are shared through a sorted set (score = expiry) that every process pulls
+    every ``sync_interval`` from a background task (``run_sync_loop``), so
+    requests never wait on Redis or on a filter rebuild.
+    """
+
+    _REDIS_KEY = "auth:revoked_sessions"
+
+    def __init__(
+        self,
+        ttl_seconds: int,
+        redis_url: str | None = None,
+        sync_interval: float = 5.0,
+        sync_timeout: float = 1.0,
+        filter_bits: int = 1 << 16,
+        hashes: int = 4,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._sync_interval = sync_interval
+        self._sync_timeout = sync_timeout
+        self._filter_bits = filter_bits
+        self._hashes = hashes
+        self._revoked: dict[UUID, float] = {}
+        self._filter = BloomFilter(filter_bits, hashes)
+        self._client = None
+        if redis is not None and redis_url:
+            self._client = redis.from_url(
+                redis_url,
+                decode_responses=True,
+                socket_timeout=sync_timeout,
+                socket_connect_timeout=sync_timeout,
+            )
+        self._checks = 0
+        self._filter_hits = 0
+        self._confirmed = 0
+        self._syncs = 0
+        self._sync_errors = 0
+
+    def is_revoked(self, session_id: UUID) -> bool:
+        self._checks += 1
+        if not self._filter.might_contain(session_id):
+            return False
+        self._filter_hits += 1
+        expires_at = self._revoked.get(session_id)
+        if expires_at is None or expires_at <= time.time():
+            return False
+        self._confirmed += 1
+        return True
+
+    async def revoke_sessions(self, session_ids: Iterable[UUID]) -> None:
+        expires_at = time.time() + self._ttl_seconds
+        entries = {session_id: expires_at for session_id in session_ids}
+        if not entries:
+            return
+        for session_id in entries:
+            self._revoked[session_id] = expires_at
+            self._filter.add(session_id)
+
+        if self._client is not None:
+            pipe = self._client.pipeline()
+            pipe.zadd(self._REDIS_KEY, {str(session_id): score for session_id, score in entries.items()})
+            pipe.zremrangebyscore(self._REDIS_KEY, "-inf", time.time())
+            try:
+                await pipe.execute()
+            except redis.RedisError:
+                # Still enforced here; other processes miss it until their tokens expire
+                self._sync_errors += 1
+
+    async def run_sync_loop(self) -> None:
+        while True:
+            try:
+                await self.sync()
+            except Exception:
+                # A bad entry must not stop revocations from syncing for good
+                self._sync_errors += 1
+            await asyncio.sleep(self._sync_interval)
+
+    async def sync(self) -> None:
+        now = time.time()
+        rows: list[tuple[str, float]] = []
+        if self._client is not None:
+            try:
+                rows = await asyncio.wait_for(
+                    self._client.zrangebyscore(self._REDIS_KEY, now, "+inf", withscores=True),
+                    timeout=self._sync_timeout,
+                )
+            except (redis.RedisError, asyncio.TimeoutError):
+                # Keep serving the last known list; access tokens are short-lived anyway
+                self._sync_errors += 1
+
+        revoked = {sid: exp for sid, exp in self._revoked.items() if exp > now}
+        revoked.update((UUID(member), float(score)) for member, score in rows)
+
+        # Bloom filters cannot forget, so expired entries go by rebuilding
+        fresh = BloomFilter(self._filter_bits, self._hashes)
+        for session_id in revoked:
+            fresh.add(session_id)
+        self._revoked = revoked
+        self._filter = fresh
+        self._syncs += 1
+
+    def stats(self) -> RevocationStats:
+        return RevocationStats(
+            revoked=len(self._revoked),
+            checks=self._checks,
+            filter_hits=self._filter_hits,
+            confirmed=self._confirmed,
+            syncs=self._syncs,
+            sync_errors=self._sync_errors,
+        )
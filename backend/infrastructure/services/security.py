@@ -1,25 +1,127 @@
 from __future__ import annotations
 
+import hashlib
+import math
+import os
+import secrets
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
+from uuid import UUID
 
 import bcrypt
 import jwt
 
-from backend.application.common.interfaces import AuthToken, PasswordHasher, TokenService
-from backend.domain.users.entities import UserId
+from backend.application.common.interfaces import (
+    AuthToken,
+    IssuedRefreshToken,
+    PasswordHasher,
+    TokenProfileClaims,
+    TokenService,
+)
+from backend.domain.users.entities import UNUSABLE_PASSWORD_PREFIX, UserId
+from backend.infrastructure.services.metrics import register_metrics
+from backend.infrastructure.services.worker_pool import BoundedWorkerPool
+
+
+_hashing_pool: BoundedWorkerPool | None = None
+
+
+def get_hashing_pool() -> BoundedWorkerPool:
+    # bcrypt releases the GIL, so a few threads give real parallelism while the
+    # cap keeps a login burst from starving the rest of the worker
+    global _hashing_pool
+    if _hashing_pool is None:
+        workers = int(os.getenv("PASSWORD_HASH_WORKERS", "0")) or min(4, os.cpu_count() or 1)
+        _hashing_pool = BoundedWorkerPool(
+            max_workers=workers,
+            thread_name_prefix="bcrypt",
+            max_queued=int(os.getenv("PASSWORD_HASH_MAX_QUEUED", "64")),
+        )
+        register_metrics("password_hashing", _hashing_pool.stats)
+    return _hashing_pool
+
+
+DEFAULT_BCRYPT_ROUNDS = 12
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+
+
+def time_bcrypt_hash(rounds: int, samples: int = 1) -> float:
+    """Return the mean wall time of one bcrypt hash at ``rounds``, in ms."""
+    salt = bcrypt.gensalt(rounds=rounds)
+    started = time.perf_counter()
+    for _ in range(samples):
+        bcrypt.hashpw(b"calibration-password", salt)
+    return (time.perf_counter() - started) * 1000 / samples
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    min_rounds: int = MIN_BCRYPT_ROUNDS,
+    max_rounds: int = MAX_BCRYPT_ROUNDS,
+) -> int:
+    # Each extra round doubles the work, so one measurement at the floor is
+    # enough to extrapolate the highest cost that still fits the target
+    measured = time_bcrypt_hash(min_rounds)
+    if measured <= 0 or target_ms <= measured:
+        return min_rounds
+    return min(max_rounds, min_rounds + int(math.log2(target_ms / measured)))
+
+
+def configured_bcrypt_rounds() -> int:
+    # Never calibrated here: every worker must agree on the cost, so a target
+    # time is turned into PASSWORD_HASH_ROUNDS once, before workers start
+    rounds = os.getenv("PASSWORD_HASH_ROUNDS")
+    if rounds:
+        return int(rounds)
+    return DEFAULT_BCRYPT_ROUNDS
+
+
+def bcrypt_rounds_of(password_hash: str) -> int | None:
+    # Modular crypt format: $2b$<rounds>$<salt+digest>
+    parts = password_hash.split("$")
+    if len(parts) != 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
 
 
 class BcryptPasswordHasher(PasswordHasher):
-    def hash(self, raw_password: str) -> str:
+    def __init__(self, pool: BoundedWorkerPool | None = None, rounds: int | None = None) -> None:
+        self._pool = pool or get_hashing_pool()
+        self._rounds = rounds or configured_bcrypt_rounds()
+        if not 4 <= self._rounds <= 31:
+            raise ValueError("bcrypt rounds must be between 4 and 31")
+
+    @property
+    def rounds(self) -> int:
+        return self._rounds
+
+    async def hash(self, raw_password: str) -> str:
         if not raw_password:
             raise ValueError("Password cannot be empty")
-        hashed = bcrypt.hashpw(raw_password.encode("utf-8"), bcrypt.gensalt())
-        return hashed.decode("utf-8")
+        return await self._pool.run(self._hash_sync, raw_password, self._rounds)
+
+    async def verify(self, raw_password: str, password_hash: str) -> bool:
+        if not password_hash or password_hash.startswith(UNUSABLE_PASSWORD_PREFIX):
+            return False
+        return await self._pool.run(self._verify_sync, raw_password, password_hash)
 
-    def verify(self, raw_password: str, password_hash: str) -> bool:
-        if not password_hash:
+    def needs_rehash(self, password_hash: str) -> bool:
+        if not password_hash or password_hash.startswith(UNUSABLE_PASSWORD_PREFIX):
             return False
+        # Only upgrade: hosts that disagree on the cost must not rehash the
+        # same password back and forth on every login
+        rounds = bcrypt_rounds_of(password_hash)
+        return rounds is None or rounds < self._rounds
+
+    @staticmethod
+    def _hash_sync(raw_password: str, rounds: int) -> str:
+        hashed = bcrypt.hashpw(raw_password.encode("utf-8"), bcrypt.gensalt(rounds=rounds))
+        return hashed.decode("utf-8")
+
+    @staticmethod
+    def _verify_sync(raw_password: str, password_hash: str) -> bool:
         try:
             return bcrypt.checkpw(raw_password.encode("utf-8"), password_hash.encode("utf-8"))
         except ValueError:
@@ -31,16 +133,24 @@ class JwtTokenService(TokenService):
         self,
         secret_key: str,
         algorithm: str = "HS256",
-        access_token_expires_minutes: int = 60,
+        access_token_expires_minutes: int = 15,
+        refresh_token_expires_days: int = 30,
     ) -> None:
         self._secret_key = secret_key
         self._algorithm = algorithm
         self._access_token_expires_minutes = access_token_expires_minutes
+        self._refresh_token_expires_days = refresh_token_expires_days
 
     def _encode(self, payload: Dict[str, Any]) -> str:
         return jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
 
-    def create_access_token(self, user_id: UserId, expires_delta: timedelta | None = None) -> AuthToken:
+    def create_access_token(
+        self,
+        user_id: UserId,
+        expires_delta: timedelta | None = None,
+        profile: TokenProfileClaims | None = None,
+        session_id: UUID | None = None,
+    ) -> AuthToken:
         now = datetime.now(timezone.utc)
         if expires_delta is None:
             expires_delta = timedelta(minutes=self._access_token_expires_minutes)
@@ -50,6 +160,22 @@ class JwtTokenService(TokenService):
             "sub": str(user_id.value),
             "exp": expires_at,
         }
+        if session_id is not None:
+            payload["sid"] = str(session_id)
+        if profile is not None:
+            # Standard OIDC claim names; present (even if null) only when the
+            # token was issued with a profile, so readers can tell old tokens apart
+            payload["name"] = profile.name
+            payload["picture"] = profile.photo_url
 
         token_str = self._encode(payload)
         return AuthToken(access_token=token_str, expires_at=expires_at)
+
+    def issue_refresh_token(self) -> IssuedRefreshToken:
+        token = secrets.token_urlsafe(32)
+        expires_at = datetime.now(timezone.utc) + timedelta(days=self._refresh_token_expires_days)
+        return IssuedRefreshToken(token=token, token_hash=self.hash_refresh_token(token), expires_at=expires_at)
+
+    def hash_refresh_token(self, token: str) -> str:
+        # 256 random bits need no slow hash; a plain digest keeps lookups indexable
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
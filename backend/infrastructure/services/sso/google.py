@@ -1,14 +1,116 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import re
+import time
 from dataclasses import dataclass
+from typing import Any
 
 import httpx
+import jwt
+from jwt.algorithms import has_crypto
 
+try:
+    import h2  # noqa: F401
 
-_GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
-_GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
-_GOOGLE_USERINFO_URL = "https://openidconnect.googleapis.com/v1/userinfo"
+    _HTTP2 = True
+except Exception:  # pragma: no cover
+    _HTTP2 = False
+
+
+_GOOGLE_ISSUER = "https://accounts.google.com"
+_DISCOVERY_PATH = "/.well-known/openid-configuration"
+_DEFAULT_CACHE_SECONDS = 3600
+# An unknown kid may mean the provider rotated keys; refetch, but not on every bad token
+_MIN_REFETCH_SECONDS = 60
+_CLOCK_SKEW_SECONDS = 60
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    # One pooled client per process keeps TLS sessions to the provider warm
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=_HTTP2,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=120.0),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+class _CachedDocument:
+    """A JSON document refreshed after its Cache-Control max-age."""
+
+    def __init__(self) -> None:
+        self._value: dict[str, Any] | None = None
+        self._expires_at = 0.0
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self, url: str, force: bool = False) -> dict[str, Any]:
+        if not force and self._value is not None and time.monotonic() < self._expires_at:
+            return self._value
+        async with self._lock:
+            now = time.monotonic()
+            # Another waiter may have refreshed it while we queued; forced
+            # refetches are throttled so bogus tokens cannot hammer the provider
+            fresh = self._value is not None and now < self._expires_at
+            if fresh and (not force or now - self._fetched_at < _MIN_REFETCH_SECONDS):
+                return self._value
+            res = await get_http_client().get(url)
+            res.raise_for_status()
+            self._value = res.json()
+            match = _MAX_AGE.search(res.headers.get("cache-control", ""))
+            self._expires_at = now + (int(match.group(1)) if match else _DEFAULT_CACHE_SECONDS)
+            self._fetched_at = now
+            return self._value
+
+
+class _OidcProvider:
+    def __init__(self, issuer: str) -> None:
+        self.issuer = issuer
+        self._discovery = _CachedDocument()
+        self._jwks = _CachedDocument()
+
+    async def metadata(self) -> dict[str, Any]:
+        return await self._discovery.get(self.issuer + _DISCOVERY_PATH)
+
+    async def endpoint(self, name: str) -> str:
+        value = (await self.metadata()).get(name)
+        if not isinstance(value, str) or not value:
+            raise ValueError(f"Provider metadata has no {name}")
+        return value
+
+    async def signing_key(self, kid: str | None) -> jwt.PyJWK:
+        jwks_uri = await self.endpoint("jwks_uri")
+        for force in (False, True):
+            jwks = await self._jwks.get(jwks_uri, force=force)
+            for key in jwks.get("keys", []):
+                if key.get("kid") == kid:
+                    return jwt.PyJWK(key)
+        raise ValueError("Unknown id_token signing key")
+
+
+_providers: dict[str, _OidcProvider] = {}
+
+
+def _provider(issuer: str) -> _OidcProvider:
+    provider = _providers.get(issuer)
+    if provider is None:
+        provider = _providers[issuer] = _OidcProvider(issuer)
+    return provider
 
 
 @dataclass(slots=True)
@@ -19,22 +121,41 @@ class GoogleUserInfo:
     picture: str | None = None
 
 
+def _userinfo_from_claims(claims: dict[str, Any]) -> GoogleUserInfo:
+    email = claims.get("email")
+    email_verified = claims.get("email_verified")
+    name = claims.get("name")
+    picture = claims.get("picture")
+
+    if not isinstance(email, str) or not email:
+        raise ValueError("Missing email")
+
+    return GoogleUserInfo(
+        email=email,
+        email_verified=email_verified is True,
+        name=name if isinstance(name, str) else None,
+        picture=picture if isinstance(picture, str) else None,
+    )
+
+
 class GoogleOAuthClient:
     def __init__(
         self,
         client_id: str | None = None,
         client_secret: str | None = None,
         redirect_uri: str | None = None,
+        issuer: str | None = None,
     ) -> None:
         self._client_id = client_id or os.getenv("GOOGLE_OAUTH_CLIENT_ID")
         self._client_secret = client_secret or os.getenv("GOOGLE_OAUTH_CLIENT_SECRET")
         self._redirect_uri = redirect_uri or os.getenv(
             "GOOGLE_OAUTH_REDIRECT_URI", "http://localhost:8000/api/auth/sso/google/callback"
         )
+        # Overridable so a local stand-in provider can replace Google in development
+        self._provider = _provider((issuer or os.getenv("GOOGLE_OAUTH_ISSUER") or _GOOGLE_ISSUER).rstrip("/"))
 
-    @property
-    def auth_url(self) -> str:
-        return _GOOGLE_AUTH_URL
+    async def auth_url(self) -> str:
+        return await self._provider.endpoint("authorization_endpoint")
 
     @property
     def redirect_uri(self) -> str:
@@ -62,40 +183,57 @@ class GoogleOAuthClient:
         }
 
     async def fetch_userinfo(self, *, code: str) -> GoogleUserInfo:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            token_res = await client.post(
-                _GOOGLE_TOKEN_URL,
-                data={
-                    "client_id": self._require_client_id(),
-                    "client_secret": self._require_client_secret(),
-                    "code": code,
-                    "grant_type": "authorization_code",
-                    "redirect_uri": self.redirect_uri,
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-
-            token_res.raise_for_status()
-            token_json = token_res.json()
-            access_token = token_json.get("access_token")
-            if not access_token:
-                raise ValueError("Missing access_token")
-
-            userinfo_res = await client.get(_GOOGLE_USERINFO_URL, headers={"Authorization": f"Bearer {access_token}"})
-            userinfo_res.raise_for_status()
-            userinfo = userinfo_res.json()
-
-        email = userinfo.get("email")
-        email_verified = userinfo.get("email_verified")
-        name = userinfo.get("name")
-        picture = userinfo.get("picture")
-
-        if not isinstance(email, str) or not email:
-            raise ValueError("Missing email")
-
-        return GoogleUserInfo(
-            email=email,
-            email_verified=email_verified is True,
-            name=name if isinstance(name, str) else None,
-            picture=picture if isinstance(picture, str) else None,
+        client = get_http_client()
+        token_res = await client.post(
+            await self._provider.endpoint("token_endpoint"),
+            data={
+                "client_id": self._require_client_id(),
+                "client_secret": self._require_client_secret(),
+                "code": code,
+                "grant_type": "authorization_code",
+                "redirect_uri": self.redirect_uri,
+            },
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        token_res.raise_for_status()
+        token_json = token_res.json()
+
+        # The id_token already carries the profile claims; verifying it here
+        # saves the userinfo round trip
+        id_token = token_json.get("id_token")
+        if isinstance(id_token, str) and id_token and has_crypto:
+            return _userinfo_from_claims(await self._verify_id_token(id_token))
+
+        access_token = token_json.get("access_token")
+        if not access_token:
+            raise ValueError("Missing access_token")
+
+        userinfo_res = await client.get(
+            await self._provider.endpoint("userinfo_endpoint"),
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        userinfo_res.raise_for_status()
+        return _userinfo_from_claims(userinfo_res.json())
+
+    async def _verify_id_token(self, id_token: str) -> dict[str, Any]:
+        metadata = await self._provider.metadata()
+        algorithms = metadata.get("id_token_signing_alg_values_supported") or ["RS256"]
+        header = jwt.get_unverified_header(id_token)
+        if header.get("alg") not in algorithms:
+            raise ValueError("Unexpected id_token algorithm")
+
+        issuers = [metadata.get("issuer", self._provider.issuer)]
+        if self._provider.issuer == _GOOGLE_ISSUER:
+            # Google documents both forms of its issuer
+            issuers.append("accounts.google.com")
+
+        key = await self._provider.signing_key(header.get("kid"))
+        return jwt.decode(
+            id_token,
+            key.key,
+            algorithms=[header["alg"]],
+            audience=self._require_client_id(),
+            issuer=issuers,
+            leeway=_CLOCK_SKEW_SECONDS,
+            options={"require": ["exp", "iat", "iss", "aud", "sub"]},
         )
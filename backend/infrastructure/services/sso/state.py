@@ -1,16 +1,87 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import jwt
 
+try:
+    import redis.asyncio as redis
+except Exception:  # pragma: no cover
+    redis = None
+
+
+class NonceStore:
+    """Remembers consumed OAuth state nonces until their state expires.
+
+    ``consume`` is a single ``SET NX EXAT`` against Redis when ``REDIS_URL`` is
+    set, so a state is accepted at most once across all workers. Without Redis
+    (or while it is unreachable or slower than ``timeout``) an in-process map
+    takes over, evicted by expiry as it goes.
+    """
+
+    _KEY_PREFIX = "sso:nonce:"
+
+    def __init__(self, redis_url: str | None = None, timeout: float = 0.5) -> None:
+        self._timeout = timeout
+        self._client = None
+        if redis is not None and redis_url:
+            self._client = redis.from_url(
+                redis_url,
+                decode_responses=True,
+                socket_timeout=timeout,
+                socket_connect_timeout=timeout,
+            )
+        self._seen: OrderedDict[str, float] = OrderedDict()
+
+    async def consume(self, nonce: str, expires_at: float) -> bool:
+        """Return True the first time ``nonce`` is seen, False on any replay."""
+        if self._client is not None:
+            try:
+                return bool(
+                    await asyncio.wait_for(
+                        self._client.set(self._KEY_PREFIX + nonce, 1, nx=True, exat=int(expires_at) + 1),
+                        timeout=self._timeout,
+                    )
+                )
+            except (redis.RedisError, asyncio.TimeoutError):
+                pass
+        return self._consume_local(nonce, expires_at)
+
+    def _consume_local(self, nonce: str, expires_at: float) -> bool:
+        now = time.time()
+        # States share one lifetime, so insertion order is close to expiry order
+        while self._seen:
+            oldest, oldest_expiry = next(iter(self._seen.items()))
+            if oldest_expiry > now:
+                break
+            del self._seen[oldest]
+
+        if nonce in self._seen:
+            return False
+        self._seen[nonce] = expires_at
+        return True
+
+
+_nonce_store: NonceStore | None = None
+
+
+def get_nonce_store() -> NonceStore:
+    global _nonce_store
+    if _nonce_store is None:
+        _nonce_store = NonceStore(redis_url=os.getenv("REDIS_URL"))
+    return _nonce_store
+
 
 class OAuthStateService:
-    def __init__(self, secret: str | None = None) -> None:
+    def __init__(self, secret: str | None = None, nonce_store: NonceStore | None = None) -> None:
         self._secret = secret or os.getenv("SSO_STATE_SECRET") or os.getenv("JWT_SECRET", "change_me_in_production")
+        self._nonce_store = nonce_store or get_nonce_store()
 
     def create_state(self, *, frontend_callback_url: str, expires_minutes: int = 10) -> str:
         now = datetime.now(timezone.utc)
@@ -24,3 +95,11 @@ class OAuthStateService:
 
     def decode_state(self, state: str) -> dict[str, Any]:
         return jwt.decode(state, self._secret, algorithms=["HS256"])
+
+    async def consume_state(self, state: str) -> dict[str, Any]:
+        # Nothing is stored when a state is minted; the nonce is only recorded
+        # here, on first use, for as long as the state could still be valid
+        payload = jwt.decode(state, self._secret, algorithms=["HS256"], options={"require": ["exp", "nonce"]})
+        if not await self._nonce_store.consume(str(payload["nonce"]), float(payload["exp"])):
+            raise ValueError("OAuth state already used")
+        return payload
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class TokenCacheStats:
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+    expired: int
+    evictions: int
+    hit_rate: float
+
+
+class VerifiedTokenCache(Generic[T]):
+    """Bounded LRU of tokens whose signature was already verified.
+
+    Entries are keyed by the SHA-256 digest of the raw token, so the cache
+    never holds bearer tokens themselves, and each entry is dropped once the
+    token's own ``exp`` passes.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[T, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[T]:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self._expired += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, token: str, value: T, expires_at: float) -> None:
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def discard(self, token: str) -> None:
+        with self._lock:
+            self._entries.pop(self._key(token), None)
+
+    def stats(self) -> TokenCacheStats:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return TokenCacheStats(
+                size=len(self._entries),
+                max_entries=self._max_entries,
+                hits=self._hits,
+                misses=self._misses,
+                expired=self._expired,
+                evictions=self._evictions,
+                hit_rate=self._hits / lookups if lookups else 0.0,
+            )
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+
+T = TypeVar("T")
+
+
+class WorkerPoolFull(RuntimeError):
+    """The pool's queue is at its limit; the caller should shed the request."""
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerPoolStats:
+    max_workers: int
+    running: int
+    queued: int
+    peak_queued: int
+    max_queued: int
+    rejected: int
+    completed: int
+    total_wait_ms: float
+    max_wait_ms: float
+
+
+class BoundedWorkerPool:
+    """Runs blocking, GIL-releasing calls on a fixed number of threads.
+
+    At most ``max_workers`` calls run at once; the rest wait in the executor
+    queue, and the depth and wait time of that queue are tracked in ``stats``.
+    With ``max_queued`` set, calls beyond that many waiting raise
+    ``WorkerPoolFull`` instead of queueing.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "worker", max_queued: int = 0) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queued < 0:
+            raise ValueError("max_queued cannot be negative")
+        self._max_workers = max_workers
+        self._max_queued = max_queued
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queued = 0
+        self._peak_queued = 0
+        self._rejected = 0
+        self._completed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self._max_queued and self._queued >= self._max_queued:
+                self._rejected += 1
+                raise WorkerPoolFull(f"More than {self._max_queued} calls are waiting")
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        future = self._executor.submit(self._call, fn, time.perf_counter(), *args)
+        future.add_done_callback(self._forget_cancelled)
+        # Cancelling the awaiting task cancels the call too if it has not started
+        return await asyncio.wrap_future(future)
+
+    def _forget_cancelled(self, future: Future) -> None:
+        # A cancelled call never reached _call, which would have dequeued it
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def _call(self, fn: Callable[..., T], submitted_at: float, *args) -> T:
+        waited = time.perf_counter() - submitted_at
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    def stats(self) -> WorkerPoolStats:
+        with self._lock:
+            return WorkerPoolStats(
+                max_workers=self._max_workers,
+                running=self._running,
+                queued=self._queued,
+                peak_queued=self._peak_queued,
+                max_queued=self._max_queued,
+                rejected=self._rejected,
+                completed=self._completed,
+                total_wait_ms=self._total_wait * 1000,
+                max_wait_ms=self._max_wait * 1000,
+            )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
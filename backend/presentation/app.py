@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Annotated
 from uuid import UUID
 
 import jwt
-from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
@@ -16,12 +21,18 @@ from backend.domain.users.entities import UserId
 from backend.infrastructure.db.models import Base
 from backend.infrastructure.repositories.users import SqlAlchemyUsersUnitOfWork
 from backend.infrastructure.repositories.wishlists import SqlAlchemyWishlistsUnitOfWork
-from backend.infrastructure.services.security import BcryptPasswordHasher, JwtTokenService
+from backend.infrastructure.services.metrics import register_metrics
+from backend.infrastructure.services.security import JwtTokenService
+from backend.infrastructure.services.sso.google import close_http_client
+from backend.infrastructure.services.worker_pool import WorkerPoolFull
 from backend.presentation import routes_auth
 from backend.presentation import routes_sso
 from backend.presentation import routes_users
 from backend.presentation import routes_wishlists
 from backend.presentation import routes_public
+from backend.presentation import routes_metrics
+from backend.presentation.compression import CompressedBodyCache, CompressionMiddleware
+from backend.presentation.dependencies import get_session_revocations
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
@@ -31,7 +42,7 @@ def create_app() -> FastAPI:
     database_url = os.getenv("DATABASE_URL", "postgresql+asyncpg://postgres:postgres@db:5432/postgres")
     jwt_secret = os.getenv("JWT_SECRET", "CHANGE_ME")
     jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256")
-    access_token_minutes = int(os.getenv("ACCESS_TOKEN_EXPIRES_MIN", "60"))
+    access_token_minutes = int(os.getenv("ACCESS_TOKEN_EXPIRES_MIN", "15"))
 
     engine = create_async_engine(database_url, echo=False, future=True)
     session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
@@ -42,10 +53,20 @@ def create_app() -> FastAPI:
         access_token_expires_minutes=access_token_minutes,
     )
 
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        revocation_sync = asyncio.create_task(get_session_revocations().run_sync_loop())
+        yield
+        revocation_sync.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await revocation_sync
+        await close_http_client()
+
     app = FastAPI(
         title="NextIWant API",
         version="1.0.0",
         description="Backend API for nextiwant.com wishlist PWA",
+        lifespan=lifespan,
     )
 
     allowed_origins_env = os.getenv("CORS_ALLOW_ORIGINS", "http://localhost:3000,like.chineshyar.com")
@@ -59,6 +80,25 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    compression_cache = CompressedBodyCache(max_bytes=int(os.getenv("COMPRESSION_CACHE_MB", "32")) * 1024 * 1024)
+    register_metrics("compression_cache", compression_cache.stats)
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=int(os.getenv("COMPRESSION_MIN_SIZE", "1024")),
+        gzip_level=int(os.getenv("COMPRESSION_GZIP_LEVEL", "5")),
+        brotli_quality=int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4")),
+        cache=compression_cache,
+    )
+
+    @app.exception_handler(WorkerPoolFull)
+    async def worker_pool_full(_: Request, exc: WorkerPoolFull) -> JSONResponse:
+        # Shed the request rather than queue it behind a saturated pool
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Server is busy, please retry"},
+            headers={"Retry-After": "1"},
+        )
+
     async def get_session() -> AsyncSession:
         async with session_factory() as session:
             yield session
@@ -69,9 +109,6 @@ def create_app() -> FastAPI:
     async def get_wishlists_uow(session: Annotated[AsyncSession, Depends(get_session)]) -> SqlAlchemyWishlistsUnitOfWork:
         return SqlAlchemyWishlistsUnitOfWork(session=session)
 
-    def get_password_hasher() -> BcryptPasswordHasher:
-        return BcryptPasswordHasher()
-
     def get_token_service() -> TokenService:
         return token_service
 
@@ -97,7 +134,6 @@ def create_app() -> FastAPI:
     app.dependency_overrides[AsyncSession] = get_session
     app.dependency_overrides[SqlAlchemyUsersUnitOfWork] = get_users_uow
     app.dependency_overrides[SqlAlchemyWishlistsUnitOfWork] = get_wishlists_uow
-    app.dependency_overrides[BcryptPasswordHasher] = get_password_hasher
     app.dependency_overrides[TokenService] = get_token_service
     app.dependency_overrides[UserId] = get_current_user_id
 
@@ -106,6 +142,7 @@ def create_app() -> FastAPI:
     app.include_router(routes_users.router)
     app.include_router(routes_wishlists.router)
     app.include_router(routes_public.router)
+    app.include_router(routes_metrics.router)
 
     return app
 
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except Exception:  # pragma: no cover
+    brotli = None
+
+
+_COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "text/",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CompressedBodyCacheStats:
+    entries: int
+    bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class CompressedBodyCache:
+    """Compressed bodies keyed by a digest of the uncompressed bytes.
+
+    Hot responses (a popular public wishlist) render to the same bytes on every
+    hit; hashing them is an order of magnitude cheaper than compressing them
+    again. Bounded by the total size of the stored compressed bodies.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[bytes, str], bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(body: bytes, encoding: str) -> tuple[bytes, str]:
+        return hashlib.blake2b(body, digest_size=16).digest(), encoding
+
+    def get(self, key: tuple[bytes, str]) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: tuple[bytes, str], value: bytes) -> None:
+        if len(value) > self._max_bytes // 8:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = value
+            self._bytes += len(value)
+            while self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._evictions += 1
+
+    def stats(self) -> CompressedBodyCacheStats:
+        with self._lock:
+            return CompressedBodyCacheStats(
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self._max_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    # Brotli compresses JSON noticeably better at the same CPU cost
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def _is_public_request(scope: Scope, headers: Headers) -> bool:
+    # Writes such as login return one-off bodies (tokens among them)
+    return scope["method"] in ("GET", "HEAD") and "authorization" not in headers
+
+
+class CompressionMiddleware:
+    """gzip/brotli response compression negotiated from Accept-Encoding.
+
+    Whole bodies under ``minimum_size`` go out as is, since the headers and
+    CPU would cost more than the bytes saved. Single-message bodies of public
+    reads (GET without Authorization, response not marked private or
+    no-store) are looked up in ``cache`` before compressing; per-user and
+    write bodies are never served twice and would only evict the hot ones.
+    Streamed bodies are compressed chunk by chunk with a sync flush so clients
+    still receive them incrementally.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 5,
+        brotli_quality: int = 4,
+        cache: Optional[CompressedBodyCache] = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        encoding = choose_encoding(headers.get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        sender = _CompressingSender(self, encoding, send, public_request=_is_public_request(scope, headers))
+        await self.app(scope, receive, sender.send)
+
+    def compress(self, body: bytes, encoding: str, cacheable: bool) -> bytes:
+        key = None
+        if cacheable and self.cache is not None:
+            key = self.cache.key(body, encoding)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        if encoding == "br":
+            data = brotli.compress(body, quality=self.brotli_quality)
+        else:
+            data = gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+        if key is not None:
+            self.cache.put(key, data)
+        return data
+
+    def stream_compressor(self, encoding: str) -> Any:
+        if encoding == "br":
+            return _BrotliStream(self.brotli_quality)
+        return _GzipStream(self.gzip_level)
+
+
+class _GzipStream:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+class _CompressingSender:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send, public_request: bool) -> None:
+        self._middleware = middleware
+        self._encoding = encoding
+        self._send = send
+        self._public_request = public_request
+        self._start: Optional[Message] = None
+        self._stream: Any = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._stream is not None:
+            data = self._stream.chunk(body) if more_body else self._stream.finish(body)
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+
+        start = self._start
+        headers = MutableHeaders(raw=start["headers"])
+        if not self._compressible(start, headers) or (not more_body and len(body) < self._middleware.minimum_size):
+            self._passthrough = True
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        headers["Content-Encoding"] = self._encoding
+        headers.add_vary_header("Accept-Encoding")
+        if not more_body:
+            data = self._middleware.compress(body, self._encoding, cacheable=self._cacheable(start, headers))
+            headers["Content-Length"] = str(len(data))
+            await self._flush_start()
+            await self._send({"type": "http.response.body", "body": data})
+            return
+
+        del headers["Content-Length"]
+        self._stream = self._middleware.stream_compressor(self._encoding)
+        await self._flush_start()
+        await self._send({"type": "http.response.body", "body": self._stream.chunk(body), "more_body": True})
+
+    async def _flush_start(self) -> None:
+        if self._start is not None:
+            start, self._start = self._start, None
+            await self._send(start)
+
+    def _cacheable(self, start: Message, headers: MutableHeaders) -> bool:
+        if not self._public_request or start["status"] != 200:
+            return False
+        cache_control = headers.get("cache-control", "").lower()
+        return "private" not in cache_control and "no-store" not in cache_control
+
+    @staticmethod
+    def _compressible(start: Message, headers: MutableHeaders) -> bool:
+        if start["status"] in (204, 304) or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(_COMPRESSIBLE_TYPES)
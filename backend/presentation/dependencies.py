@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import os
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Optional
 from uuid import UUID
 
 import jwt
@@ -9,11 +11,14 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from backend.application.common.interfaces import TokenService
+from backend.application.common.interfaces import PasswordHasher, TokenRevocationList, TokenService
 from backend.domain.users.entities import UserId
 from backend.infrastructure.repositories.users import SqlAlchemyUsersUnitOfWork
 from backend.infrastructure.repositories.wishlists import SqlAlchemyWishlistsUnitOfWork
-from backend.infrastructure.services.security import JwtTokenService
+from backend.infrastructure.services.metrics import register_metrics
+from backend.infrastructure.services.revocation import SessionRevocationList
+from backend.infrastructure.services.security import BcryptPasswordHasher, JwtTokenService
+from backend.infrastructure.services.token_cache import VerifiedTokenCache
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
@@ -47,7 +52,38 @@ async def get_wishlists_uow(
     return SqlAlchemyWishlistsUnitOfWork(session=session)
 
 
-def extract_user_id_from_token(token: str) -> UserId:
+@dataclass(frozen=True, slots=True)
+class CurrentUser:
+    id: UserId
+    name: Optional[str] = None
+    photo_url: Optional[str] = None
+    # False for tokens issued before profile claims existed
+    has_profile_claims: bool = False
+    session_id: Optional[UUID] = None
+
+
+_token_cache: VerifiedTokenCache[CurrentUser] = VerifiedTokenCache(
+    max_entries=int(os.getenv("TOKEN_CACHE_SIZE", "4096")),
+)
+register_metrics("token_cache", _token_cache.stats)
+
+
+def _reject_revoked(current_user: CurrentUser) -> CurrentUser:
+    if current_user.session_id is not None and _revocations.is_revoked(current_user.session_id):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return current_user
+
+
+def extract_current_user_from_token(token: str) -> CurrentUser:
+    # Repeat requests with the same bearer token skip signature verification
+    cached = _token_cache.get(token)
+    if cached is not None:
+        return _reject_revoked(cached)
+
     try:
         payload = jwt.decode(token, _jwt_secret, algorithms=[_jwt_algorithm])
     except jwt.PyJWTError:
@@ -74,7 +110,36 @@ def extract_user_id_from_token(token: str) -> UserId:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return user_id
+    try:
+        session_id = UUID(payload["sid"]) if "sid" in payload else None
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid session identifier in token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    current_user = CurrentUser(
+        id=user_id,
+        name=payload.get("name"),
+        photo_url=payload.get("picture"),
+        has_profile_claims="name" in payload,
+        session_id=session_id,
+    )
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _token_cache.put(token, current_user, float(exp))
+    return _reject_revoked(current_user)
+
+
+def extract_user_id_from_token(token: str) -> UserId:
+    return extract_current_user_from_token(token).id
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+) -> CurrentUser:
+    return extract_current_user_from_token(token)
 
 
 async def get_current_user_id(
@@ -85,14 +150,40 @@ async def get_current_user_id(
 
 _jwt_secret = os.getenv("JWT_SECRET", "change_me_in_production")
 _jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256")
-_access_token_minutes = int(os.getenv("ACCESS_TOKEN_EXPIRES_MIN", "60"))
+_access_token_minutes = int(os.getenv("ACCESS_TOKEN_EXPIRES_MIN", "15"))
+_refresh_token_days = int(os.getenv("REFRESH_TOKEN_EXPIRES_DAYS", "30"))
 
 _token_service: TokenService = JwtTokenService(
     secret_key=_jwt_secret,
     algorithm=_jwt_algorithm,
     access_token_expires_minutes=_access_token_minutes,
+    refresh_token_expires_days=_refresh_token_days,
 )
 
 
 def get_token_service() -> TokenService:
     return _token_service
+
+
+# Revoked sessions only need remembering for as long as an access token lives;
+# the app lifespan keeps the list in sync with Redis
+_revocations = SessionRevocationList(
+    ttl_seconds=_access_token_minutes * 60,
+    redis_url=os.getenv("REDIS_URL"),
+)
+register_metrics("session_revocations", _revocations.stats)
+
+
+def get_revocation_list() -> TokenRevocationList:
+    return _revocations
+
+
+def get_session_revocations() -> SessionRevocationList:
+    return _revocations
+
+
+_password_hasher = BcryptPasswordHasher()
+
+
+def get_password_hasher() -> PasswordHasher:
+    return _password_hasher
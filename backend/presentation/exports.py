@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import AsyncIterator
+from typing import Any
+
+from backend.application.wishlists.use_cases import ExportRecord
+from backend.domain.wishlists.entities import Wishlist, WishlistItem, WishlistItemComment
+from backend.presentation.serialization import comment_to_dict, dumps, item_to_dict, wishlist_to_dict
+
+
+# Encoders for the account export. Records arrive one at a time from a
+# server-side cursor and leave in chunks of roughly CHUNK_BYTES, so neither
+# side ever holds more than one chunk of an account.
+CHUNK_BYTES = 64 * 1024
+
+# One row per item, with its wishlist's columns repeated; wishlists without
+# items get a row with empty item columns. The import accepts the same layout.
+CSV_COLUMNS = (
+    "wishlist_id",
+    "wishlist_name",
+    "wishlist_description",
+    "wishlist_visibility",
+    "item_id",
+    "title",
+    "description",
+    "link",
+    "priority",
+    "is_received",
+    "received_note",
+    "created_at",
+)
+
+
+def _ndjson_record(record: ExportRecord) -> dict[str, Any]:
+    if isinstance(record, Wishlist):
+        data = wishlist_to_dict(record)
+        del data["items"]
+        return {"type": "wishlist", **data}
+    if isinstance(record, WishlistItem):
+        return {"type": "item", **item_to_dict(record)}
+    data = comment_to_dict(record, None)
+    del data["user_name"]
+    return {"type": "comment", **data}
+
+
+async def ndjson_chunks(records: AsyncIterator[ExportRecord]) -> AsyncIterator[bytes]:
+    buffer: list[bytes] = []
+    size = 0
+    async for record in records:
+        line = dumps(_ndjson_record(record)) + b"\n"
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK_BYTES:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return getattr(value, "value", value)
+
+
+def _csv_row(wishlist: Wishlist, item: WishlistItem | None) -> list[Any]:
+    row = [wishlist.id.value, wishlist.name, wishlist.description, wishlist.visibility]
+    if item is None:
+        row += [None] * (len(CSV_COLUMNS) - len(row))
+    else:
+        row += [
+            item.id.value,
+            item.title,
+            item.description,
+            item.link,
+            item.priority,
+            item.is_received,
+            item.received_note,
+            item.created_at.isoformat(),
+        ]
+    return [_csv_value(value) for value in row]
+
+
+async def csv_chunks(records: AsyncIterator[ExportRecord]) -> AsyncIterator[bytes]:
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(CSV_COLUMNS)
+    # Wishlists come first and are few; items then stream against them
+    wishlists: dict[Any, Wishlist] = {}
+    without_items: dict[Any, Wishlist] = {}
+    async for record in records:
+        if isinstance(record, Wishlist):
+            wishlists[record.id] = without_items[record.id] = record
+            continue
+        if isinstance(record, WishlistItemComment):
+            continue
+        wishlist = wishlists.get(record.wishlist_id)
+        if wishlist is None:
+            # Only possible outside a snapshot; the row would have no wishlist columns
+            continue
+        without_items.pop(record.wishlist_id, None)
+        writer.writerow(_csv_row(wishlist, record))
+        if out.tell() >= CHUNK_BYTES:
+            yield out.getvalue().encode("utf-8")
+            out.seek(0)
+            out.truncate()
+    for wishlist in without_items.values():
+        writer.writerow(_csv_row(wishlist, None))
+    yield out.getvalue().encode("utf-8")
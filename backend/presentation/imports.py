@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import codecs
+import csv
+import os
+from collections.abc import AsyncIterator
+
+from backend.application.wishlists.use_cases import ImportRow
+from backend.presentation.exports import CSV_COLUMNS
+from backend.presentation.serialization import loads
+
+
+# Decoders for bulk import. The request body is read chunk by chunk and turned
+# into ImportRow objects one line (or quoted CSV record) at a time, so a body
+# is never held in full. Both accept what the export produces.
+MAX_ROWS = int(os.getenv("IMPORT_MAX_ROWS", "100000"))
+MAX_RECORD_CHARS = 1024 * 1024
+
+_ITEM_COLUMNS = CSV_COLUMNS[CSV_COLUMNS.index("item_id") + 1:]
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    # utf-8-sig drops the byte order mark spreadsheet tools like to write
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+            for line in lines:
+                yield line + "\n"
+            if len(pending) > MAX_RECORD_CHARS:
+                raise ValueError(f"Lines are limited to {MAX_RECORD_CHARS} characters")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise ValueError("Body is not valid UTF-8") from None
+    if pending:
+        yield pending
+
+
+async def csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRow]:
+    header: list[str] | None = None
+    record: list[str] = []
+    record_line = line_number = quotes = 0
+    async for line in _lines(chunks):
+        line_number += 1
+        if not record:
+            record_line = line_number
+        record.append(line)
+        # A quoted field can span lines; escaped quotes come in pairs
+        quotes += line.count('"')
+        if quotes % 2:
+            if sum(map(len, record)) > MAX_RECORD_CHARS:
+                raise ValueError(f"Records are limited to {MAX_RECORD_CHARS} characters")
+            continue
+        values = next(csv.reader(["".join(record)]), [])
+        record, quotes = [], 0
+        if not values or values == [""]:
+            continue
+
+        if header is None:
+            header = [value.strip().lower() for value in values]
+            missing = {"wishlist_name", "title"} - set(header)
+            if missing:
+                raise ValueError(f"CSV header is missing columns: {', '.join(sorted(missing))}")
+            continue
+        if len(values) != len(header):
+            yield ImportRow(
+                line=record_line,
+                wishlist_key="",
+                error=f"Expected {len(header)} columns, got {len(values)}",
+            )
+            continue
+
+        fields = dict(zip(header, values))
+        yield ImportRow(
+            line=record_line,
+            wishlist_key=fields.get("wishlist_id") or fields["wishlist_name"],
+            wishlist_name=fields["wishlist_name"],
+            wishlist_description=fields.get("wishlist_description"),
+            wishlist_visibility=fields.get("wishlist_visibility"),
+            # Rows for wishlists without items leave every item column empty
+            has_item=any(fields.get(column) for column in _ITEM_COLUMNS),
+            title=fields["title"],
+            description=fields.get("description"),
+            link=fields.get("link"),
+            priority=fields.get("priority"),
+            is_received=fields.get("is_received"),
+            received_note=fields.get("received_note"),
+        )
+
+    if record:
+        yield ImportRow(line=record_line, wishlist_key="", error="Unterminated quoted field")
+
+
+async def ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRow]:
+    line_number = 0
+    async for line in _lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            record = loads(line)
+        except ValueError:
+            yield ImportRow(line=line_number, wishlist_key="", error="Invalid JSON")
+            continue
+        if not isinstance(record, dict):
+            yield ImportRow(line=line_number, wishlist_key="", error="Expected a JSON object")
+            continue
+
+        kind = record.get("type")
+        if kind == "wishlist":
+            yield ImportRow(
+                line=line_number,
+                wishlist_key=str(record.get("id") or record.get("name") or ""),
+                wishlist_name=record.get("name"),
+                wishlist_description=record.get("description"),
+                wishlist_visibility=record.get("visibility"),
+                has_item=False,
+            )
+        elif kind == "item":
+            yield ImportRow(
+                line=line_number,
+                wishlist_key=str(record.get("wishlist_id") or ""),
+                title=record.get("title"),
+                description=record.get("description"),
+                link=record.get("link"),
+                priority=record.get("priority"),
+                is_received=record.get("is_received"),
+                received_note=record.get("received_note"),
+            )
+        elif kind != "comment":
+            # Comments were written by other users and are not imported
+            yield ImportRow(line=line_number, wishlist_key="", error=f"Unknown record type: {kind}")
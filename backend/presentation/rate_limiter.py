@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import logging
 import os
-import time
+import tempfile
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
 
-from fastapi import HTTPException, Request, status
+from fastapi import Depends, HTTPException, Request, status
+
+from backend.domain.users.entities import UserId
+from backend.infrastructure.services.metrics import register_metrics
+from backend.infrastructure.services.rate_limiting.base import RateLimiter
+from backend.infrastructure.services.rate_limiting.breaker import CircuitBreakerRateLimiter
+from backend.infrastructure.services.rate_limiting.leased import LeasedRateLimiter
+from backend.infrastructure.services.rate_limiting.memory import InMemoryRateLimiter
+from backend.infrastructure.services.rate_limiting.redis_gcra import RedisGcraRateLimiter
+from backend.infrastructure.services.rate_limiting.shared_memory import SharedMemoryRateLimiter
+from backend.presentation.dependencies import get_current_user_id
 
 try:
     import redis.asyncio as redis
@@ -13,93 +25,182 @@ except Exception:  # pragma: no cover
     redis = None
 
 
+logger = logging.getLogger(__name__)
+
+
 @dataclass(frozen=True, slots=True)
 class RateLimit:
     action: str
     limit: int
     window_seconds: int
+    cost: int = 1
 
 
-class _InMemoryRateLimiter:
-    def __init__(self) -> None:
-        self._store: dict[str, tuple[int, float]] = {}
+def _default_shm_path() -> str:
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "nextiwant-rate-limit")
 
-    async def hit(self, key: str, window_seconds: int) -> tuple[int, int]:
-        now = time.time()
-        count, reset_at = self._store.get(key, (0, now + window_seconds))
 
-        if now >= reset_at:
-            count = 0
-            reset_at = now + window_seconds
+def _create_local_limiter() -> RateLimiter:
+    # Workers on one host share a memory-mapped table so the limit holds across
+    # all of them; a private per-process limiter is the last resort
+    slots = int(os.getenv("RATE_LIMIT_SHM_SLOTS", "131072"))
+    if slots > 0:
+        try:
+            limiter = SharedMemoryRateLimiter(path=os.getenv("RATE_LIMIT_SHM_PATH") or _default_shm_path(), slots=slots)
+        except (OSError, RuntimeError):
+            pass
+        else:
+            register_metrics("rate_limiter_shared_memory", limiter.stats)
+            return limiter
 
-        count += 1
-        self._store[key] = (count, reset_at)
-        retry_after = max(0, int(reset_at - now))
-        return count, retry_after
+    limiter = InMemoryRateLimiter(max_keys=int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000")))
+    register_metrics("rate_limiter_memory", limiter.stats)
+    return limiter
 
 
-_memory_limiter = _InMemoryRateLimiter()
-_redis_client: "redis.Redis | None" = None
+def _create_limiter(local: RateLimiter) -> RateLimiter:
+    # Resolved once per process: the Redis client connects lazily, so nothing
+    # here touches the network
+    redis_url = os.getenv("REDIS_URL")
+    if redis is None or not redis_url:
+        return local
+
+    timeout = int(os.getenv("RATE_LIMIT_REDIS_TIMEOUT_MS", "50")) / 1000
+    client = redis.from_url(
+        redis_url,
+        encoding="utf-8",
+        decode_responses=True,
+        socket_connect_timeout=timeout,
+        socket_timeout=timeout,
+    )
+    breaker = CircuitBreakerRateLimiter(
+        RedisGcraRateLimiter(client),
+        fallback=local,
+        timeout=timeout,
+        failure_threshold=int(os.getenv("RATE_LIMIT_BREAKER_FAILURES", "5")),
+        reset_seconds=float(os.getenv("RATE_LIMIT_BREAKER_RESET_SECONDS", "10")),
+    )
+    register_metrics("rate_limiter_redis", breaker.stats)
+
+    lease_fraction = float(os.getenv("RATE_LIMIT_LEASE_FRACTION", "0.1"))
+    if lease_fraction <= 0:
+        return breaker
+    leased = LeasedRateLimiter(
+        breaker,
+        lease_fraction=lease_fraction,
+        max_keys=int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000")),
+    )
+    register_metrics("rate_limiter_leases", leased.stats)
+    return leased
+
+
+_limiter = _create_limiter(_create_local_limiter())
+
+
+def _parse_trusted_proxies(value: str) -> tuple[IPv4Network | IPv6Network, ...]:
+    return tuple(ip_network(part.strip(), strict=False) for part in value.split(",") if part.strip())
+
+
+# X-Forwarded-For is only believed when it was appended by one of these
+_trusted_proxies = _parse_trusted_proxies(os.getenv("RATE_LIMIT_TRUSTED_PROXIES", ""))
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in _trusted_proxies)
+
+
+_warned_untrusted_forwarding = False
+
+
+def _warn_untrusted_forwarding(peer: str, request: Request) -> None:
+    # A private peer sending X-Forwarded-For is almost always a reverse proxy
+    # nobody listed: every client then shares the proxy's rate limit budget
+    global _warned_untrusted_forwarding
+    if _warned_untrusted_forwarding or _trusted_proxies or "x-forwarded-for" not in request.headers:
+        return
+    try:
+        private = ip_address(peer).is_private
+    except ValueError:
+        return
+    if private:
+        _warned_untrusted_forwarding = True
+        logger.warning(
+            "Request from private address %s carries X-Forwarded-For but RATE_LIMIT_TRUSTED_PROXIES is empty; "
+            "per-IP rate limits apply to the proxy, not to clients",
+            peer,
+        )
 
 
 def _get_client_ip(request: Request) -> str:
-    forwarded_for = request.headers.get("x-forwarded-for")
-    if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
-
     if request.client is None:
         return "unknown"
 
-    return request.client.host
-
-
-async def _redis_hit(key: str, window_seconds: int) -> tuple[int, int]:
-    global _redis_client
-
-    if redis is None:
-        return await _memory_limiter.hit(key=key, window_seconds=window_seconds)
-
-    redis_url = os.getenv("REDIS_URL")
-    if not redis_url:
-        return await _memory_limiter.hit(key=key, window_seconds=window_seconds)
-
-    if _redis_client is None:
-        _redis_client = redis.from_url(redis_url, encoding="utf-8", decode_responses=True)
-
-    pipe = _redis_client.pipeline()
-    pipe.incr(key)
-    pipe.ttl(key)
-    count, ttl = await pipe.execute()
-
-    if ttl == -1:
-        await _redis_client.expire(key, window_seconds)
-        ttl = window_seconds
-    elif ttl == -2:
-        await _redis_client.expire(key, window_seconds)
-        ttl = window_seconds
-
-    retry_after = max(0, int(ttl))
-    return int(count), retry_after
-
-
-async def enforce_rate_limit(request: Request, rl: RateLimit) -> None:
-    ip = _get_client_ip(request)
-    key = f"rl:{rl.action}:{ip}"
-
-    count, retry_after = await _redis_hit(key=key, window_seconds=rl.window_seconds)
-
-    if count > rl.limit:
+    peer = request.client.host
+    if not _is_trusted_proxy(peer):
+        _warn_untrusted_forwarding(peer, request)
+        return peer
+
+    # Each trusted proxy appends the address it received from, so walk right
+    # to left; the first hop we do not trust is the client. Entries left of it
+    # are whatever the client chose to send.
+    client_ip = peer
+    for hop in reversed(request.headers.get("x-forwarded-for", "").split(",")):
+        hop = hop.strip()
+        if not hop:
+            continue
+        client_ip = hop
+        if not _is_trusted_proxy(hop):
+            break
+    return client_ip
+
+
+async def enforce_rate_limit(request: Request, rl: RateLimit, user_id: UserId | None = None) -> None:
+    if user_id is not None:
+        key = f"rl:{rl.action}:user:{user_id.value}"
+    else:
+        key = f"rl:{rl.action}:{_get_client_ip(request)}"
+
+    decision = await _limiter.hit(key=key, limit=rl.limit, window_seconds=rl.window_seconds, cost=rl.cost)
+
+    if not decision.allowed:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Too many requests",
-            headers={"Retry-After": str(retry_after)},
+            headers={"Retry-After": str(max(1, decision.retry_after))},
         )
 
 
-def rate_limit(action: str, limit: int, window_seconds: int) -> Callable[[Request], Awaitable[None]]:
-    rl = RateLimit(action=action, limit=limit, window_seconds=window_seconds)
+def rate_limit(
+    action: str,
+    limit: int,
+    window_seconds: int,
+    cost: int = 1,
+    per_user: bool = False,
+) -> Callable[..., Awaitable[None]]:
+    rl = RateLimit(action=action, limit=limit, window_seconds=window_seconds, cost=cost)
+
+    if per_user:
+
+        async def _user_dep(request: Request, current_user_id: UserId = Depends(get_current_user_id)) -> None:
+            await enforce_rate_limit(request=request, rl=rl, user_id=current_user_id)
+
+        return _user_dep
 
     async def _dep(request: Request) -> None:
         await enforce_rate_limit(request=request, rl=rl)
 
     return _dep
+
+
+# One budget per user shared by every write route; each route spends what its
+# writes roughly cost the database
+_user_writes_per_minute = int(os.getenv("RATE_LIMIT_USER_WRITES_PER_MINUTE", "120"))
+
+
+def user_write_limit(cost: int = 1) -> Callable[..., Awaitable[None]]:
+    return rate_limit(action="writes", limit=_user_writes_per_minute, window_seconds=60, cost=cost, per_user=True)
@@ -8,14 +8,26 @@ from backend.application.auth.use_cases import (
     SignUpCommand,
     SignUpUseCase,
 )
-from backend.application.common.interfaces import PasswordHasher, TokenService
+from backend.application.auth.sessions import (
+    LogoutCommand,
+    LogoutUseCase,
+    RefreshSessionCommand,
+    RefreshSessionUseCase,
+    RefreshTokenSuperseded,
+)
+from backend.application.common.interfaces import AuthToken, PasswordHasher, TokenRevocationList, TokenService
 from backend.domain.users.entities import UserId
 from backend.infrastructure.repositories.users import SqlAlchemyUsersUnitOfWork
-from backend.infrastructure.services.security import BcryptPasswordHasher
-from backend.presentation.dependencies import get_users_uow, get_token_service
+from backend.presentation.dependencies import (
+    get_password_hasher,
+    get_revocation_list,
+    get_token_service,
+    get_users_uow,
+)
 from backend.presentation.rate_limiter import rate_limit
 from backend.presentation.schemas import (
     LoginRequest,
+    RefreshTokenRequest,
     SignUpRequest,
     TokenResponse,
     UserResponse,
@@ -34,12 +46,21 @@ def _user_to_response(user) -> UserResponse:
     )
 
 
+def _token_to_response(token: AuthToken) -> TokenResponse:
+    return TokenResponse(
+        access_token=token.access_token,
+        expires_at=token.expires_at,
+        refresh_token=token.refresh_token,
+        refresh_expires_at=token.refresh_expires_at,
+    )
+
+
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def signup(
     payload: SignUpRequest,
     _: None = Depends(rate_limit(action="auth:signup", limit=5, window_seconds=60 * 10)),
     uow: SqlAlchemyUsersUnitOfWork = Depends(get_users_uow),
-    password_hasher: PasswordHasher = Depends(BcryptPasswordHasher),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
 ) -> UserResponse:
     use_case = SignUpUseCase(uow=uow, password_hasher=password_hasher)
     try:
@@ -54,7 +75,7 @@ async def login(
     payload: LoginRequest,
     _: None = Depends(rate_limit(action="auth:login", limit=10, window_seconds=60 * 5)),
     uow: SqlAlchemyUsersUnitOfWork = Depends(get_users_uow),
-    password_hasher: PasswordHasher = Depends(BcryptPasswordHasher),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
     token_service: TokenService = Depends(get_token_service),
 ) -> TokenResponse:
     use_case = LoginUseCase(uow=uow, password_hasher=password_hasher, token_service=token_service)
@@ -63,7 +84,38 @@ async def login(
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid credentials") from e
 
-    return TokenResponse(
-        access_token=result.token.access_token,
-        expires_at=result.token.expires_at,
-    )
+    return _token_to_response(result.token)
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(
+    payload: RefreshTokenRequest,
+    _: None = Depends(rate_limit(action="auth:refresh", limit=30, window_seconds=60)),
+    uow: SqlAlchemyUsersUnitOfWork = Depends(get_users_uow),
+    token_service: TokenService = Depends(get_token_service),
+    revocations: TokenRevocationList = Depends(get_revocation_list),
+) -> TokenResponse:
+    use_case = RefreshSessionUseCase(uow=uow, token_service=token_service, revocations=revocations)
+    try:
+        result = await use_case.execute(RefreshSessionCommand(refresh_token=payload.refresh_token))
+    except RefreshTokenSuperseded as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from e
+
+    return _token_to_response(result.token)
+
+
+@router.post("/logout", status_code=status.HTTP_200_OK)
+async def logout(
+    payload: RefreshTokenRequest,
+    uow: SqlAlchemyUsersUnitOfWork = Depends(get_users_uow),
+    token_service: TokenService = Depends(get_token_service),
+    revocations: TokenRevocationList = Depends(get_revocation_list),
+) -> None:
+    use_case = LogoutUseCase(uow=uow, token_service=token_service, revocations=revocations)
+    await use_case.execute(LogoutCommand(refresh_token=payload.refresh_token))
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import os
+import secrets
+from typing import Any
+
+from fastapi import APIRouter, Header, HTTPException, status
+
+from backend.infrastructure.services.metrics import collect_metrics
+
+router = APIRouter(prefix="/api/internal", tags=["internal"], include_in_schema=False)
+
+
+@router.get("/metrics")
+async def get_metrics(x_metrics_token: str | None = Header(default=None)) -> dict[str, Any]:
+    # Disabled unless METRICS_TOKEN is configured; then the caller must present it
+    expected = os.getenv("METRICS_TOKEN")
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_metrics_token is None or not secrets.compare_digest(x_metrics_token, expected):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    return collect_metrics()
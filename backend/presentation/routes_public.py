@@ -11,10 +11,23 @@ from backend.application.wishlists.use_cases import (
     GetPublicWishlistUseCase,
 )
 from backend.domain.users.entities import UserId
-from backend.domain.wishlists.entities import WishlistId, WishlistItemComment, WishlistItemCommentId, WishlistItemId
+from backend.domain.wishlists.entities import (
+    WishlistFields,
+    WishlistId,
+    WishlistItemComment,
+    WishlistItemCommentId,
+    WishlistItemId,
+)
 from backend.infrastructure.repositories.wishlists import SqlAlchemyWishlistsUnitOfWork
 from backend.infrastructure.repositories.users import SqlAlchemyUsersUnitOfWork
-from backend.presentation.dependencies import get_current_user_id, get_users_uow, get_wishlists_uow
+from backend.presentation.dependencies import (
+    CurrentUser,
+    get_current_user,
+    get_current_user_id,
+    get_users_uow,
+    get_wishlists_uow,
+)
+from backend.presentation.rate_limiter import user_write_limit
 from backend.presentation.schemas import (
     PublicShareCreateRequest,
     PublicShareResponse,
@@ -25,6 +38,13 @@ from backend.presentation.schemas import (
     WishlistItemCommentResponse,
     WishlistResponse,
 )
+from backend.presentation.serialization import (
+    FastJSONResponse,
+    comment_to_dict,
+    get_wishlist_fields,
+    share_to_dict,
+    wishlist_to_dict,
+)
 
 router = APIRouter(prefix="/api/public", tags=["public"])
 
@@ -35,11 +55,26 @@ def _wishlist_to_response(wishlist) -> WishlistResponse:
     return base_conv(wishlist)
 
 
+async def _author_name(current_user: CurrentUser, uow: SqlAlchemyWishlistsUnitOfWork) -> str | None:
+    if current_user.has_profile_claims:
+        return current_user.name
+
+    # Tokens issued before profile claims: resolve the profile name; ignore failures
+    try:
+        users_uow = SqlAlchemyUsersUnitOfWork(uow._session)  # type: ignore[attr-defined]
+        async with users_uow as uuow:
+            profile = await uuow.profiles.get_by_user_id(current_user.id)
+            return profile.name if profile is not None else None
+    except Exception:
+        return None
+
+
 @router.post("/wishlists/{wishlist_id}/share", response_model=PublicShareResponse)
 async def create_or_update_share(
     wishlist_id: str,
     payload: PublicShareCreateRequest,
     current_user_id: UserId = Depends(get_current_user_id),
+    _: None = Depends(user_write_limit()),
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow),
 ) -> PublicShareResponse:
     # Token is just the wishlist_id here for simplicity; could be random in infra
@@ -64,11 +99,12 @@ async def create_or_update_share(
 @router.get("/{token}", response_model=PublicWishlistResponse)
 async def get_public_wishlist(
     token: str,
+    wishlist_fields: WishlistFields | None = Depends(get_wishlist_fields),
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow),
     users_uow: SqlAlchemyUsersUnitOfWork = Depends(get_users_uow),
-) -> PublicWishlistResponse:
+) -> FastJSONResponse:
     use_case = GetPublicWishlistUseCase(uow=uow)
-    result = await use_case.execute(GetPublicWishlistQuery(token=token))
+    result = await use_case.execute(GetPublicWishlistQuery(token=token, fields=wishlist_fields))
     if result.wishlist is None or result.share is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Public wishlist not found")
 
@@ -84,16 +120,12 @@ async def get_public_wishlist(
     except Exception:
         owner_name = None
 
-    return PublicWishlistResponse(
-        wishlist=_wishlist_to_response(wishlist),
-        share=PublicShareResponse(
-            wishlist_id=result.share.wishlist_id.value,
-            token=result.share.token.value,
-            is_claimable=result.share.is_claimable,
-            created_at=result.share.created_at,
-            expires_at=result.share.expires_at,
-        ),
-        owner_name=owner_name,
+    return FastJSONResponse(
+        {
+            "wishlist": wishlist_to_dict(wishlist, wishlist_fields),
+            "share": share_to_dict(result.share),
+            "owner_name": owner_name,
+        }
     )
 
 
@@ -102,9 +134,12 @@ async def list_public_wishlist_comments(
     token: str,
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow),
     users_uow: SqlAlchemyUsersUnitOfWork = Depends(get_users_uow),
-) -> list[WishlistItemCommentResponse]:
+) -> FastJSONResponse:
     use_case = GetPublicWishlistUseCase(uow=uow)
-    result = await use_case.execute(GetPublicWishlistQuery(token=token))
+    # Only the item ids are needed here
+    result = await use_case.execute(
+        GetPublicWishlistQuery(token=token, fields=WishlistFields(wishlist=frozenset(), items=frozenset({"id"})))
+    )
     if result.wishlist is None or result.share is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Public wishlist not found")
 
@@ -127,28 +162,14 @@ async def list_public_wishlist_comments(
     except Exception:
         user_names = {}
 
-    responses: list[WishlistItemCommentResponse] = []
-    for c in comments:
-        uid = str(c.user_id.value)
-        responses.append(
-            WishlistItemCommentResponse(
-                id=c.id.value,
-                item_id=c.item_id.value,
-                user_id=c.user_id.value,
-                parent_id=c.parent_id.value if c.parent_id else None,
-                content=c.content,
-                created_at=c.created_at,
-                updated_at=c.updated_at,
-                user_name=user_names.get(uid),
-            )
-        )
-    return responses
+    return FastJSONResponse([comment_to_dict(c, user_names.get(str(c.user_id.value))) for c in comments])
 
 
 @router.post("/{token}/claim", response_model=WishlistResponse)
 async def claim_wishlist(
     token: str,
     current_user_id: UserId = Depends(get_current_user_id),
+    _: None = Depends(user_write_limit(cost=2)),
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow),
 ) -> WishlistResponse:
     use_case = ClaimWishlistUseCase(uow=uow)
@@ -167,7 +188,8 @@ async def claim_wishlist(
 async def create_public_item_comment(
     item_id: str,
     payload: WishlistItemCommentCreateRequest,
-    current_user_id: UserId = Depends(get_current_user_id),
+    current_user: CurrentUser = Depends(get_current_user),
+    _: None = Depends(user_write_limit()),
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow),
 ) -> WishlistItemCommentResponse:
     async with uow as wuow:
@@ -182,22 +204,14 @@ async def create_public_item_comment(
         comment = WishlistItemComment(
             id=WishlistItemCommentId.new(),
             item_id=item.id,
-            user_id=current_user_id,
+            user_id=current_user.id,
             parent_id=None,
             content=payload.content,
         )
         await wuow.comments.add(comment)
+        await wuow.wishlists.adjust_counters(item.wishlist_id, comments=1)
 
-    # Try to resolve current user's profile name; ignore failures
-    user_name: str | None = None
-    try:
-        users_uow = SqlAlchemyUsersUnitOfWork(uow._session)  # type: ignore[attr-defined]
-        async with users_uow as uuow:
-            profile = await uuow.profiles.get_by_user_id(current_user_id)
-            if profile is not None:
-                user_name = profile.name
-    except Exception:
-        user_name = None
+    user_name = await _author_name(current_user, uow)
 
     return WishlistItemCommentResponse(
         id=comment.id.value,
@@ -215,7 +229,8 @@ async def create_public_item_comment(
 async def create_public_comment_reply(
     comment_id: str,
     payload: WishlistItemCommentCreateRequest,
-    current_user_id: UserId = Depends(get_current_user_id),
+    current_user: CurrentUser = Depends(get_current_user),
+    _: None = Depends(user_write_limit()),
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow),
 ) -> WishlistItemCommentResponse:
     async with uow as wuow:
@@ -237,22 +252,14 @@ async def create_public_comment_reply(
         reply = WishlistItemComment(
             id=WishlistItemCommentId.new(),
             item_id=parent.item_id,
-            user_id=current_user_id,
+            user_id=current_user.id,
             parent_id=parent.id,
             content=payload.content,
         )
         await wuow.comments.add(reply)
+        await wuow.wishlists.adjust_counters(item.wishlist_id, comments=1)
 
-    # Try to resolve current user's profile name; ignore failures
-    user_name: str | None = None
-    try:
-        users_uow = SqlAlchemyUsersUnitOfWork(uow._session)  # type: ignore[attr-defined]
-        async with users_uow as uuow:
-            profile = await uuow.profiles.get_by_user_id(current_user_id)
-            if profile is not None:
-                user_name = profile.name
-    except Exception:
-        user_name = None
+    user_name = await _author_name(current_user, uow)
 
     return WishlistItemCommentResponse(
         id=reply.id.value,
@@ -1,23 +1,41 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import os
 
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from backend.application.common.interfaces import TokenService
 from backend.application.users.use_cases import (
     GetProfileQuery,
     GetProfileUseCase,
+    SearchPeopleQuery,
+    SearchPeopleUseCase,
     UpsertProfileCommand,
     UpsertProfileUseCase,
 )
 from backend.domain.users.entities import UserId
 from backend.infrastructure.repositories.users import SqlAlchemyUsersUnitOfWork
-from backend.presentation.dependencies import get_current_user_id, get_users_uow
+from backend.presentation.dependencies import (
+    CurrentUser,
+    get_current_user,
+    get_current_user_id,
+    get_token_service,
+    get_users_uow,
+)
+from backend.presentation.rate_limiter import rate_limit, user_write_limit
 from backend.presentation.schemas import (
+    PeopleSearchHitResponse,
+    PeopleSearchResponse,
+    TokenResponse,
     UserProfileResponse,
     UserProfileUpdateRequest,
+    UserProfileUpdateResponse,
 )
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
+_PEOPLE_SEARCH_TIMEOUT_MS = int(os.getenv("PEOPLE_SEARCH_TIMEOUT_MS", "150"))
+
 
 @router.get("/me/profile", response_model=UserProfileResponse)
 async def get_my_profile(
@@ -42,25 +60,28 @@ async def get_my_profile(
     )
 
 
-@router.put("/me/profile", response_model=UserProfileResponse)
+@router.put("/me/profile", response_model=UserProfileUpdateResponse)
 async def upsert_my_profile(
     payload: UserProfileUpdateRequest,
-    current_user_id: UserId = Depends(get_current_user_id),
+    current_user: CurrentUser = Depends(get_current_user),
+    _: None = Depends(user_write_limit()),
     uow: SqlAlchemyUsersUnitOfWork = Depends(get_users_uow),
-) -> UserProfileResponse:
-    use_case = UpsertProfileUseCase(uow=uow)
+    token_service: TokenService = Depends(get_token_service),
+) -> UserProfileUpdateResponse:
+    use_case = UpsertProfileUseCase(uow=uow, token_service=token_service)
     result = await use_case.execute(
         UpsertProfileCommand(
-            user_id=current_user_id,
+            user_id=current_user.id,
             username=payload.username,
             first_name=payload.first_name,
             last_name=payload.last_name,
             birthday=payload.birthday,
             photo_url=payload.photo_url,
+            session_id=current_user.session_id,
         )
     )
     profile = result.profile
-    return UserProfileResponse(
+    return UserProfileUpdateResponse(
         user_id=profile.user_id.value,
         name=profile.name,
         username=profile.username,
@@ -70,4 +91,38 @@ async def upsert_my_profile(
         photo_url=profile.photo_url,
         created_at=profile.created_at,
         updated_at=profile.updated_at,
+        token=(
+            TokenResponse(access_token=result.token.access_token, expires_at=result.token.expires_at)
+            if result.token is not None
+            else None
+        ),
+    )
+
+
+@router.get("/search", response_model=PeopleSearchResponse)
+async def search_people(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(10, ge=1, le=25),
+    _: None = Depends(rate_limit(action="users:search", limit=120, window_seconds=60)),
+    current_user_id: UserId = Depends(get_current_user_id),
+    uow: SqlAlchemyUsersUnitOfWork = Depends(get_users_uow),
+) -> PeopleSearchResponse:
+    use_case = SearchPeopleUseCase(uow=uow)
+    try:
+        result = await use_case.execute(SearchPeopleQuery(text=q, limit=limit, timeout_ms=_PEOPLE_SEARCH_TIMEOUT_MS))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    return PeopleSearchResponse(
+        results=[
+            PeopleSearchHitResponse(
+                user_id=profile.user_id.value,
+                name=profile.name,
+                username=profile.username,
+                photo_url=profile.photo_url,
+                profile_url=f"/api/public/users/{profile.user_id.value}",
+            )
+            for profile in result.profiles
+        ],
+        timed_out=result.timed_out,
     )
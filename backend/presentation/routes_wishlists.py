@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 
 from backend.application.wishlists.use_cases import (
     AddWishlistItemCommand,
@@ -13,30 +15,65 @@ from backend.application.wishlists.use_cases import (
     DeleteWishlistItemCommand,
     DeleteWishlistItemUseCase,
     DeleteWishlistUseCase,
+    ExportWishlistsQuery,
+    ExportWishlistsUseCase,
     GetWishlistQuery,
     GetWishlistUseCase,
+    ImportWishlistsCommand,
+    ImportWishlistsUseCase,
     ListUserWishlistsQuery,
     ListUserWishlistsUseCase,
+    MoveWishlistItemCommand,
+    MoveWishlistItemUseCase,
+    RebalanceWishlistItemsCommand,
+    RebalanceWishlistItemsUseCase,
+    SearchWishlistsQuery,
+    SearchWishlistsUseCase,
     UpdateWishlistCommand,
     UpdateWishlistItemCommand,
     UpdateWishlistItemUseCase,
     UpdateWishlistUseCase,
 )
 from backend.domain.users.entities import UserId
-from backend.domain.wishlists.entities import WishlistId, WishlistItemId
+from backend.domain.wishlists.entities import WishlistFields, WishlistId, WishlistItemId, WishlistSearchScope
 from backend.infrastructure.repositories.wishlists import SqlAlchemyWishlistsUnitOfWork
-from backend.presentation.dependencies import  get_current_user_id,get_wishlists_uow
+from backend.presentation.dependencies import  get_current_user_id,get_wishlists_uow, session_factory
+from backend.presentation.exports import csv_chunks, ndjson_chunks
+from backend.presentation.imports import MAX_ROWS, csv_rows, ndjson_rows
+from backend.presentation.rate_limiter import rate_limit, user_write_limit
 from backend.presentation.schemas import (
     WishlistCreateRequest,
+    WishlistImportErrorResponse,
+    WishlistImportResponse,
+    WishlistItemMoveRequest,
     WishlistItemRequest,
     WishlistItemResponse,
     WishlistResponse,
+    WishlistSearchHitResponse,
+    WishlistSearchResponse,
     WishlistUpdateRequest,
 )
+from backend.presentation.serialization import FastJSONResponse, get_wishlist_fields, wishlist_to_dict
 
 router = APIRouter(prefix="/api/wishlists", tags=["wishlists"])
 
 
+def _item_to_response(item) -> WishlistItemResponse:
+    return WishlistItemResponse(
+        id=item.id.value,
+        wishlist_id=item.wishlist_id.value,
+        title=item.title,
+        description=item.description,
+        link=item.link,
+        priority=item.priority,
+        is_received=item.is_received,
+        received_note=item.received_note,
+        position=item.position,
+        created_at=item.created_at,
+        updated_at=item.updated_at,
+    )
+
+
 def _wishlist_to_response(wishlist) -> WishlistResponse:
     return WishlistResponse(
         id=wishlist.id.value,
@@ -45,22 +82,15 @@ def _wishlist_to_response(wishlist) -> WishlistResponse:
         description=wishlist.description,
         visibility=wishlist.visibility,
         items=[
-            WishlistItemResponse(
-                id=item.id.value,
-                wishlist_id=item.wishlist_id.value,
-                title=item.title,
-                description=item.description,
-                link=item.link,
-                priority=item.priority,
-                is_received=item.is_received,
-                received_note=item.received_note,
-                created_at=item.created_at,
-                updated_at=item.updated_at,
-            )
+            _item_to_response(item)
             for item in wishlist.items
         ],
         created_at=wishlist.created_at,
         updated_at=wishlist.updated_at,
+        item_count=wishlist.item_count,
+        received_count=wishlist.received_count,
+        comment_count=wishlist.comment_count,
+        last_activity_at=wishlist.last_activity_at,
     )
 
 
@@ -68,6 +98,7 @@ def _wishlist_to_response(wishlist) -> WishlistResponse:
 async def create_wishlist(
     payload: WishlistCreateRequest,
     current_user_id: UserId = Depends(get_current_user_id),
+    _: None = Depends(user_write_limit(cost=2)),
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow)
 ) -> WishlistResponse:
     use_case = CreateWishlistUseCase(uow=uow)
@@ -84,27 +115,127 @@ async def create_wishlist(
 
 @router.get("", response_model=list[WishlistResponse])
 async def list_my_wishlists(
+    include_items: bool = True,
+    sort: Literal["created", "activity"] = "created",
+    wishlist_fields: WishlistFields | None = Depends(get_wishlist_fields),
     current_user_id: UserId = Depends(get_current_user_id),
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow)
-) -> list[WishlistResponse]:
+) -> FastJSONResponse:
     use_case = ListUserWishlistsUseCase(uow=uow)
-    result = await use_case.execute(ListUserWishlistsQuery(owner_id=current_user_id))
-    return [_wishlist_to_response(w) for w in result.wishlists]
+    result = await use_case.execute(
+        ListUserWishlistsQuery(
+            owner_id=current_user_id,
+            include_items=include_items,
+            order_by_activity=sort == "activity",
+            fields=wishlist_fields,
+        )
+    )
+    return FastJSONResponse([wishlist_to_dict(w, wishlist_fields) for w in result.wishlists])
+
+
+@router.get("/search", response_model=WishlistSearchResponse)
+async def search_wishlists(
+    q: str = Query(..., min_length=1, max_length=200),
+    scope: WishlistSearchScope = WishlistSearchScope.MINE,
+    limit: int = Query(20, ge=1, le=50),
+    offset: int = Query(0, ge=0, le=1000),
+    current_user_id: UserId = Depends(get_current_user_id),
+    uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow),
+) -> WishlistSearchResponse:
+    use_case = SearchWishlistsUseCase(uow=uow)
+    try:
+        result = await use_case.execute(
+            SearchWishlistsQuery(requester_id=current_user_id, text=q, scope=scope, limit=limit, offset=offset)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    return WishlistSearchResponse(
+        results=[
+            WishlistSearchHitResponse(
+                kind="item" if hit.item_id else "wishlist",
+                wishlist_id=hit.wishlist_id.value,
+                owner_id=hit.owner_id.value,
+                item_id=hit.item_id.value if hit.item_id else None,
+                title=hit.title,
+                rank=hit.rank,
+            )
+            for hit in result.hits
+        ],
+        limit=limit,
+        offset=offset,
+        has_more=result.has_more,
+    )
+
+
+async def _export_chunks(owner_id: UserId, export_format: str):
+    # Streamed after the route returns, once the request session is gone. The
+    # wishlist, item and comment cursors read one snapshot, so rows created
+    # mid-export cannot show up in a later cursor without their parents
+    async with session_factory() as session:
+        await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        use_case = ExportWishlistsUseCase(uow=SqlAlchemyWishlistsUnitOfWork(session=session))
+        records = use_case.execute(ExportWishlistsQuery(owner_id=owner_id, include_comments=export_format == "ndjson"))
+        encode = ndjson_chunks if export_format == "ndjson" else csv_chunks
+        async for chunk in encode(records):
+            yield chunk
+
+
+@router.get("/export")
+async def export_wishlists(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    current_user_id: UserId = Depends(get_current_user_id),
+    _: None = Depends(rate_limit(action="wishlists:export", limit=5, window_seconds=60 * 5, per_user=True)),
+) -> StreamingResponse:
+    media_type = "application/x-ndjson" if export_format == "ndjson" else "text/csv; charset=utf-8"
+    return StreamingResponse(
+        _export_chunks(current_user_id, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="wishlists.{export_format}"'},
+    )
+
+
+@router.post("/import", response_model=WishlistImportResponse)
+async def import_wishlists(
+    request: Request,
+    import_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    current_user_id: UserId = Depends(get_current_user_id),
+    _: None = Depends(rate_limit(action="wishlists:import", limit=5, window_seconds=60 * 10, per_user=True)),
+    uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow),
+) -> WishlistImportResponse:
+    decode = ndjson_rows if import_format == "ndjson" else csv_rows
+    use_case = ImportWishlistsUseCase(uow=uow)
+    try:
+        result = await use_case.execute(
+            ImportWishlistsCommand(owner_id=current_user_id, rows=decode(request.stream()), max_rows=MAX_ROWS)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    return WishlistImportResponse(
+        wishlists_created=result.wishlists_created,
+        items_created=result.items_created,
+        rows_failed=result.rows_failed,
+        errors=[WishlistImportErrorResponse(line=e.line, message=e.message) for e in result.errors],
+    )
 
 
 @router.get("/{wishlist_id}", response_model=WishlistResponse)
 async def get_wishlist(
     wishlist_id: UUID,
+    wishlist_fields: WishlistFields | None = Depends(get_wishlist_fields),
     current_user_id: UserId = Depends(get_current_user_id),
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow),
-) -> WishlistResponse:
+) -> FastJSONResponse:
     use_case = GetWishlistUseCase(uow=uow)
     wid = WishlistId(value=wishlist_id)
     try:
-        result = await use_case.execute(GetWishlistQuery(wishlist_id=wid, owner_id=current_user_id))
+        result = await use_case.execute(
+            GetWishlistQuery(wishlist_id=wid, owner_id=current_user_id, fields=wishlist_fields)
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
-    return _wishlist_to_response(result.wishlist)
+    return FastJSONResponse(wishlist_to_dict(result.wishlist, wishlist_fields))
 
 
 @router.put("/{wishlist_id}", response_model=WishlistResponse)
@@ -112,6 +243,7 @@ async def update_wishlist(
     wishlist_id: UUID,
     payload: WishlistUpdateRequest,
     current_user_id: UserId = Depends(get_current_user_id),
+    _: None = Depends(user_write_limit()),
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow)
 ) -> WishlistResponse:
     use_case = UpdateWishlistUseCase(uow=uow)
@@ -134,6 +266,7 @@ async def update_wishlist(
 async def delete_wishlist(
     wishlist_id: UUID,
     current_user_id: UserId = Depends(get_current_user_id),
+    _: None = Depends(user_write_limit(cost=5)),
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow)
 ) -> None:
     use_case = DeleteWishlistUseCase(uow=uow)
@@ -145,6 +278,7 @@ async def add_item(
     wishlist_id: UUID,
     payload: WishlistItemRequest,
     current_user_id: UserId = Depends(get_current_user_id),
+    _: None = Depends(user_write_limit()),
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow)
 ) -> WishlistItemResponse:
     use_case = AddWishlistItemUseCase(uow=uow)
@@ -163,19 +297,7 @@ async def add_item(
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
 
-    item = result.item
-    return WishlistItemResponse(
-        id=item.id.value,
-        wishlist_id=item.wishlist_id.value,
-        title=item.title,
-        description=item.description,
-        link=item.link,
-        priority=item.priority,
-        is_received=item.is_received,
-        received_note=item.received_note,
-        created_at=item.created_at,
-        updated_at=item.updated_at,
-    )
+    return _item_to_response(result.item)
 
 
 @router.put("/items/{item_id}", response_model=WishlistItemResponse)
@@ -183,6 +305,7 @@ async def update_item(
     item_id: UUID,
     payload: WishlistItemRequest,
     current_user_id: UserId = Depends(get_current_user_id),
+    _: None = Depends(user_write_limit()),
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow)
 ) -> WishlistItemResponse:
     use_case = UpdateWishlistItemUseCase(uow=uow)
@@ -201,25 +324,48 @@ async def update_item(
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
 
-    item = result.item
-    return WishlistItemResponse(
-        id=item.id.value,
-        wishlist_id=item.wishlist_id.value,
-        title=item.title,
-        description=item.description,
-        link=item.link,
-        priority=item.priority,
-        is_received=item.is_received,
-        received_note=item.received_note,
-        created_at=item.created_at,
-        updated_at=item.updated_at,
-    )
+    return _item_to_response(result.item)
+
+
+async def _rebalance_items(wishlist_id: WishlistId) -> None:
+    # Runs after the response, once the request session is gone
+    async with session_factory() as session:
+        use_case = RebalanceWishlistItemsUseCase(uow=SqlAlchemyWishlistsUnitOfWork(session=session))
+        await use_case.execute(RebalanceWishlistItemsCommand(wishlist_id=wishlist_id))
+
+
+@router.post("/items/{item_id}/move", response_model=WishlistItemResponse)
+async def move_item(
+    item_id: UUID,
+    payload: WishlistItemMoveRequest,
+    background_tasks: BackgroundTasks,
+    current_user_id: UserId = Depends(get_current_user_id),
+    _: None = Depends(user_write_limit()),
+    uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow)
+) -> WishlistItemResponse:
+    use_case = MoveWishlistItemUseCase(uow=uow)
+    try:
+        result = await use_case.execute(
+            MoveWishlistItemCommand(
+                item_id=WishlistItemId(value=item_id),
+                owner_id=current_user_id,
+                after_item_id=WishlistItemId(value=payload.after_item_id) if payload.after_item_id else None,
+                before_item_id=WishlistItemId(value=payload.before_item_id) if payload.before_item_id else None,
+            )
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    if result.needs_rebalance:
+        background_tasks.add_task(_rebalance_items, result.item.wishlist_id)
+    return _item_to_response(result.item)
 
 
 @router.delete("/items/{item_id}", status_code=status.HTTP_200_OK)
 async def delete_item(
     item_id: UUID,
     current_user_id: UserId = Depends(get_current_user_id),
+    _: None = Depends(user_write_limit()),
     uow: SqlAlchemyWishlistsUnitOfWork = Depends(get_wishlists_uow)
 ) -> None:
     use_case = DeleteWishlistItemUseCase(uow=uow)
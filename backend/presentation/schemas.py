@@ -13,6 +13,12 @@ class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
     expires_at: datetime
+    refresh_token: Optional[str] = None
+    refresh_expires_at: Optional[datetime] = None
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str = Field(min_length=1, max_length=512)
 
 
 class UserResponse(BaseModel):
@@ -50,6 +56,24 @@ class UserProfileResponse(BaseModel):
     updated_at: datetime
 
 
+class UserProfileUpdateResponse(UserProfileResponse):
+    # Fresh access token carrying the updated profile claims
+    token: Optional[TokenResponse] = None
+
+
+class PeopleSearchHitResponse(BaseModel):
+    user_id: UUID
+    name: str
+    username: Optional[str] = None
+    photo_url: Optional[str] = None
+    profile_url: str
+
+
+class PeopleSearchResponse(BaseModel):
+    results: list[PeopleSearchHitResponse]
+    timed_out: bool = False
+
+
 class UserProfileUpdateRequest(BaseModel):
     username: Optional[str] = None
     first_name: Optional[str] = None
@@ -86,10 +110,16 @@ class WishlistItemResponse(BaseModel):
     priority: Optional[int] = None
     is_received: bool = False
     received_note: Optional[str] = None
+    position: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
 
+class WishlistItemMoveRequest(BaseModel):
+    after_item_id: Optional[UUID] = None
+    before_item_id: Optional[UUID] = None
+
+
 class WishlistCreateRequest(BaseModel):
     name: str = Field(..., min_length=1)
     description: Optional[str] = None
@@ -111,6 +141,39 @@ class WishlistResponse(BaseModel):
     items: list[WishlistItemResponse] = []
     created_at: datetime
     updated_at: datetime
+    item_count: int = 0
+    received_count: int = 0
+    comment_count: int = 0
+    last_activity_at: Optional[datetime] = None
+
+
+class WishlistSearchHitResponse(BaseModel):
+    kind: str
+    wishlist_id: UUID
+    owner_id: UUID
+    item_id: Optional[UUID] = None
+    title: str
+    rank: float
+
+
+class WishlistSearchResponse(BaseModel):
+    results: list[WishlistSearchHitResponse]
+    limit: int
+    offset: int
+    has_more: bool
+
+
+class WishlistImportErrorResponse(BaseModel):
+    line: int
+    message: str
+
+
+class WishlistImportResponse(BaseModel):
+    wishlists_created: int
+    items_created: int
+    rows_failed: int
+    # Capped; rows_failed counts every skipped row
+    errors: list[WishlistImportErrorResponse]
 
 
 class PublicShareCreateRequest(BaseModel):
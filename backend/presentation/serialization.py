@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, FrozenSet, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, Query, status
+from fastapi.responses import JSONResponse
+
+from backend.domain.wishlists.entities import WishlistFields
+from backend.presentation.schemas import WishlistItemResponse, WishlistResponse
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
+
+# Fast path for large read responses. Routes keep their response_model, so the
+# OpenAPI schema is unchanged, but return a FastJSONResponse built straight from
+# domain entities: FastAPI passes Response objects through untouched, skipping
+# model construction, response_model re-validation and the stdlib encoder.
+# The dicts mirror the response models field for field and encode the same
+# way pydantic does (UTC datetimes end in "Z").
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+# Sparse fieldsets: ``fields=name,items.title`` keeps only the listed
+# attributes (ids are always sent) and tells the repository which columns to
+# select. ``items`` alone keeps whole items; naming no item field drops them.
+_WISHLIST_FIELDS = frozenset(WishlistResponse.model_fields) - {"id", "items"}
+_ITEM_FIELDS = frozenset(WishlistItemResponse.model_fields) - {"id"}
+
+
+def parse_fields(value: Optional[str]) -> Optional[WishlistFields]:
+    if value is None or not value.strip():
+        return None
+
+    wishlist: set[str] = set()
+    items: set[str] = set()
+    all_items = False
+    for part in value.split(","):
+        name = part.strip()
+        if not name or name == "id":
+            continue
+        if name == "items":
+            all_items = True
+        elif name.startswith("items."):
+            item_field = name[len("items."):]
+            if item_field != "id" and item_field not in _ITEM_FIELDS:
+                raise ValueError(f"Unknown field: {name}")
+            items.add(item_field)
+        elif name in _WISHLIST_FIELDS:
+            wishlist.add(name)
+        else:
+            raise ValueError(f"Unknown field: {name}")
+
+    return WishlistFields(wishlist=frozenset(wishlist), items=None if all_items else frozenset(items))
+
+
+def get_wishlist_fields(
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated wishlist fields to return, e.g. name,items.title; ids are always included",
+    ),
+) -> Optional[WishlistFields]:
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
+def _sparse(full: dict[str, Any], names: Optional[FrozenSet[str]]) -> dict[str, Any]:
+    if names is None:
+        return full
+    return {key: value for key, value in full.items() if key == "id" or key in names}
+
+
+def item_to_dict(item, fields: Optional[FrozenSet[str]] = None) -> dict[str, Any]:
+    full = {
+        "id": item.id.value,
+        "wishlist_id": item.wishlist_id.value,
+        "title": item.title,
+        "description": item.description,
+        "link": item.link,
+        "priority": item.priority,
+        "is_received": item.is_received,
+        "received_note": item.received_note,
+        "position": item.position,
+        "created_at": item.created_at,
+        "updated_at": item.updated_at,
+    }
+    return _sparse(full, fields)
+
+
+def wishlist_to_dict(wishlist, fields: Optional[WishlistFields] = None) -> dict[str, Any]:
+    item_fields = fields.items if fields is not None else None
+    items = [item_to_dict(item, item_fields) for item in wishlist.items]
+    full = {
+        "id": wishlist.id.value,
+        "owner_id": wishlist.owner_id.value,
+        "name": wishlist.name,
+        "description": wishlist.description,
+        "visibility": wishlist.visibility,
+        "items": items,
+        "created_at": wishlist.created_at,
+        "updated_at": wishlist.updated_at,
+        "item_count": wishlist.item_count,
+        "received_count": wishlist.received_count,
+        "comment_count": wishlist.comment_count,
+        "last_activity_at": wishlist.last_activity_at,
+    }
+    if fields is None:
+        return full
+    sparse = _sparse(full, fields.wishlist)
+    if fields.include_items:
+        sparse["items"] = items
+    return sparse
+
+
+def share_to_dict(share) -> dict[str, Any]:
+    return {
+        "wishlist_id": share.wishlist_id.value,
+        "token": share.token.value,
+        "is_claimable": share.is_claimable,
+        "created_at": share.created_at,
+        "expires_at": share.expires_at,
+    }
+
+
+def comment_to_dict(comment, user_name: str | None) -> dict[str, Any]:
+    return {
+        "id": comment.id.value,
+        "item_id": comment.item_id.value,
+        "user_id": comment.user_id.value,
+        "parent_id": comment.parent_id.value if comment.parent_id else None,
+        "content": comment.content,
+        "created_at": comment.created_at,
+        "updated_at": comment.updated_at,
+        "user_name": user_name,
+    }
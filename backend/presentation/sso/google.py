@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from urllib.parse import urlencode
 
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import RedirectResponse
 
@@ -36,10 +37,13 @@ async def start(
     try:
         state = state_service.create_state(frontend_callback_url=_frontend_callback_url())
         params = oauth.build_authorize_params(state=state)
+        auth_url = await oauth.auth_url()
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="OAuth provider unavailable") from e
 
-    return RedirectResponse(url=f"{oauth.auth_url}?{urlencode(params)}", status_code=status.HTTP_302_FOUND)
+    return RedirectResponse(url=f"{auth_url}?{urlencode(params)}", status_code=status.HTTP_302_FOUND)
 
 
 @router.get("/callback")
@@ -56,7 +60,7 @@ async def callback(
 
     state_service = OAuthStateService()
     try:
-        decoded_state = state_service.decode_state(state)
+        decoded_state = await state_service.consume_state(state)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid OAuth state") from e
 
@@ -92,5 +96,12 @@ async def callback(
     except ValueError as e:
         return RedirectResponse(url=f"{frontend_cb}#error={str(e).replace(' ', '_')}", status_code=status.HTTP_302_FOUND)
 
-    fragment = urlencode({"access_token": result.token.access_token, "expires_at": result.token.expires_at.isoformat()})
+    fragment = urlencode(
+        {
+            "access_token": result.token.access_token,
+            "expires_at": result.token.expires_at.isoformat(),
+            "refresh_token": result.token.refresh_token or "",
+            "refresh_expires_at": result.token.refresh_expires_at.isoformat() if result.token.refresh_expires_at else "",
+        }
+    )
     return RedirectResponse(url=f"{frontend_cb}#{fragment}", status_code=status.HTTP_302_FOUND)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+
+from backend.infrastructure.services.security import (
+    MAX_BCRYPT_ROUNDS,
+    MIN_BCRYPT_ROUNDS,
+    calibrate_bcrypt_rounds,
+    configured_bcrypt_rounds,
+    time_bcrypt_hash,
+)
+
+
+# Times bcrypt on this host at each cost factor and recommends the highest
+# cost whose single hash fits the target, to pin as PASSWORD_HASH_ROUNDS.
+#
+#   python -m backend.scripts.benchmark_password_hashing [--target-ms 250] [--samples 3]
+#
+# --print-rounds only prints the calibrated cost; the container entrypoint
+# uses it to pin PASSWORD_HASH_ROUNDS once for all workers.
+#
+# A login is one verify, which costs the same as one hash at the stored cost,
+# so logins/sec per core is simply 1000 / hash time.
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark bcrypt cost factors on this host")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="acceptable time for one hash")
+    parser.add_argument("--min-rounds", type=int, default=MIN_BCRYPT_ROUNDS)
+    parser.add_argument("--max-rounds", type=int, default=MAX_BCRYPT_ROUNDS)
+    parser.add_argument("--samples", type=int, default=3, help="hashes timed per cost")
+    parser.add_argument("--print-rounds", action="store_true", help="print only the calibrated cost")
+    args = parser.parse_args()
+    if not 4 <= args.min_rounds <= args.max_rounds <= 31:
+        parser.error("rounds must satisfy 4 <= min-rounds <= max-rounds <= 31")
+
+    if args.print_rounds:
+        print(calibrate_bcrypt_rounds(args.target_ms, args.min_rounds, args.max_rounds))
+        return
+
+    print(f"{'cost':>4}  {'ms/hash':>9}  {'logins/s/core':>13}")
+    recommended = args.min_rounds
+    for rounds in range(args.min_rounds, args.max_rounds + 1):
+        elapsed_ms = time_bcrypt_hash(rounds, samples=args.samples)
+        print(f"{rounds:>4}  {elapsed_ms:>9.1f}  {1000 / elapsed_ms:>13.1f}")
+        if elapsed_ms <= args.target_ms:
+            recommended = rounds
+        elif elapsed_ms > args.target_ms * 4:
+            # Every further cost only doubles this, no need to keep waiting
+            break
+
+    print(f"configured cost: {configured_bcrypt_rounds()}")
+    print(f"recommended for {args.target_ms:g} ms: PASSWORD_HASH_ROUNDS={recommended}")
+
+
+if __name__ == "__main__":
+    main()
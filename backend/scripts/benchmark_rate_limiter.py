@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from typing import Callable
+from uuid import uuid4
+
+import redis.asyncio as redis
+
+from backend.infrastructure.services.rate_limiting.base import RateLimitDecision, RateLimiter
+from backend.infrastructure.services.rate_limiting.leased import LeasedRateLimiter
+from backend.infrastructure.services.rate_limiting.redis_gcra import RedisGcraRateLimiter
+
+
+# Compares the Redis rate limiter implementations under concurrent load.
+#
+#   python -m backend.scripts.benchmark_rate_limiter [--requests 20000] [--concurrency 64] [--keys 1000]
+#
+# "fixed-window" is the previous INCR+TTL pipeline with a follow-up EXPIRE for
+# new keys; "gcra" is the EVALSHA script, and "gcra+leases" puts the per-worker
+# leased budgets in front of it as the API does, one per --workers process,
+# with hits spread over them round-robin. Use few --keys with a high --limit to
+# see leasing at work: it only saves round trips for repeat clients. --rate
+# paces the hits (per second, overall) to model clients well under their limit,
+# e.g. --keys 10 --limit 300 --rate 20 --requests 2000 --workers 4.
+
+
+class _CountingLimiter:
+    def __init__(self, inner: RateLimiter) -> None:
+        self.inner = inner
+        self.calls = 0
+
+    async def hit(self, key: str, limit: int, window_seconds: int, cost: int = 1) -> RateLimitDecision:
+        self.calls += 1
+        return await self.inner.hit(key, limit, window_seconds, cost)
+
+
+class _RoundRobin:
+    def __init__(self, workers: list[RateLimiter]) -> None:
+        self.workers = workers
+        self.turn = 0
+
+    async def hit(self, key: str, limit: int, window_seconds: int, cost: int = 1) -> RateLimitDecision:
+        self.turn += 1
+        return await self.workers[self.turn % len(self.workers)].hit(key, limit, window_seconds, cost)
+
+
+class _FixedWindowLimiter:
+    def __init__(self, client: redis.Redis) -> None:
+        self.client = client
+        self.calls = 0
+
+    async def hit(self, key: str, limit: int, window_seconds: int, cost: int = 1) -> RateLimitDecision:
+        pipe = self.client.pipeline()
+        pipe.incr(key, cost)
+        pipe.ttl(key)
+        count, ttl = await pipe.execute()
+        self.calls += 1
+        if ttl in (-1, -2):
+            await self.client.expire(key, window_seconds)
+            self.calls += 1
+        return RateLimitDecision(allowed=int(count) <= limit, remaining=max(0, limit - int(count)), retry_after=0)
+
+
+async def _run(
+    name: str,
+    client: redis.Redis,
+    limiter: RateLimiter,
+    round_trips: Callable[[], int],
+    args: argparse.Namespace,
+) -> None:
+    prefix = f"bench:{name}:{uuid4().hex}:"
+    latencies: list[float] = []
+    denied = 0
+    remaining = args.requests
+    trips_before = round_trips()
+
+    async def worker() -> None:
+        nonlocal denied, remaining
+        while remaining > 0:
+            remaining -= 1
+            key = f"{prefix}{random.randrange(args.keys)}"
+            started = time.perf_counter()
+            decision = await limiter.hit(key, args.limit, args.window)
+            latencies.append(time.perf_counter() - started)
+            denied += not decision.allowed
+            if args.rate:
+                await asyncio.sleep(args.concurrency / args.rate)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    trips = round_trips() - trips_before
+    async for key in client.scan_iter(match=prefix + "*", count=1000):
+        await client.delete(key)
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(
+        f"{name:>12}  {args.requests / elapsed:>9.0f} hits/s  p50 {p50:6.2f} ms  p99 {p99:6.2f} ms"
+        f"  {trips / args.requests:4.2f} round trips/hit  denied {denied}"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    client = redis.from_url(args.redis_url, decode_responses=True)
+    fixed = _FixedWindowLimiter(client)
+    gcra = _CountingLimiter(RedisGcraRateLimiter(client))
+    leased = _RoundRobin(
+        [
+            LeasedRateLimiter(gcra, lease_fraction=args.lease_fraction, max_keys=args.keys * 2)
+            for _ in range(args.workers)
+        ]
+    )
+
+    # Warm the script cache so the first EVALSHA miss is not measured
+    await gcra.hit("bench:warmup", args.limit, args.window)
+    await client.delete("bench:warmup")
+    await _run("fixed-window", client, fixed, lambda: fixed.calls, args)
+    await _run("gcra", client, gcra, lambda: gcra.calls, args)
+    await _run("gcra+leases", client, leased, lambda: gcra.calls, args)
+    await client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Redis rate limiter implementations")
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL"))
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--keys", type=int, default=1000, help="distinct clients to spread hits over")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--window", type=int, default=60)
+    parser.add_argument("--lease-fraction", type=float, default=0.1)
+    parser.add_argument("--workers", type=int, default=1, help="API processes, each with its own leases")
+    parser.add_argument("--rate", type=float, default=0.0, help="overall hits per second (0 = unpaced)")
+    args = parser.parse_args()
+    if not args.redis_url:
+        parser.error("REDIS_URL is not set")
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
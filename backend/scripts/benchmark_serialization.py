@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import httpx
+from fastapi import FastAPI
+
+from backend.domain.users.entities import UserId
+from backend.domain.wishlists.entities import Wishlist, WishlistId, WishlistItem, WishlistItemId, WishlistVisibility
+from backend.presentation.routes_wishlists import _wishlist_to_response
+from backend.presentation.schemas import WishlistResponse
+from backend.presentation.serialization import FastJSONResponse, wishlist_to_dict
+
+
+# Measures CPU per request for a wishlist response, before and after the fast
+# serialization path.
+#
+#   python -m backend.scripts.benchmark_serialization [--items 500] [--requests 200]
+#
+# Both routes serve the same in-memory wishlist through an in-process ASGI
+# client, so only routing, serialization and encoding are measured. "models"
+# builds response models and lets FastAPI validate them against response_model;
+# "fast" returns a FastJSONResponse built from the domain entity.
+
+
+def _wishlist(items: int) -> Wishlist:
+    now = datetime.now(timezone.utc)
+    wishlist_id = WishlistId(uuid4())
+    return Wishlist(
+        id=wishlist_id,
+        owner_id=UserId(uuid4()),
+        name="Birthday",
+        description="Things I would like this year",
+        visibility=WishlistVisibility.PUBLIC,
+        items=[
+            WishlistItem(
+                id=WishlistItemId(uuid4()),
+                wishlist_id=wishlist_id,
+                title=f"Item {index}",
+                description="A fairly ordinary description of the item " * 3,
+                link=f"https://example.com/items/{index}",
+                priority=index % 5 + 1,
+                received_note=None,
+                position=f"a{index:05d}",
+                created_at=now,
+                updated_at=now,
+            )
+            for index in range(items)
+        ],
+        created_at=now,
+        updated_at=now,
+        item_count=items,
+        last_activity_at=now,
+    )
+
+
+def _app(wishlist: Wishlist) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/models", response_model=WishlistResponse)
+    async def models() -> WishlistResponse:
+        return _wishlist_to_response(wishlist)
+
+    @app.get("/fast", response_model=WishlistResponse)
+    async def fast() -> FastJSONResponse:
+        return FastJSONResponse(wishlist_to_dict(wishlist))
+
+    return app
+
+
+async def run(items: int, requests: int) -> None:
+    app = _app(_wishlist(items))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        bodies = [(await client.get(path)).content for path in ("/models", "/fast")]
+        if json.loads(bodies[0]) != json.loads(bodies[1]):
+            raise SystemExit("fast path output differs from the response model")
+
+        baseline = None
+        for path in ("/models", "/fast"):
+            started = time.process_time()
+            for _ in range(requests):
+                res = await client.get(path)
+                res.raise_for_status()
+            cpu_ms = (time.process_time() - started) / requests * 1000
+            speedup = f"  {baseline / cpu_ms:4.1f}x" if baseline else ""
+            baseline = baseline or cpu_ms
+            print(f"{path[1:]:>7}  {cpu_ms:7.2f} ms CPU/request  {len(res.content):>8} bytes{speedup}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark response serialization for large wishlists")
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.items, args.requests))
+
+
+if __name__ == "__main__":
+    main()
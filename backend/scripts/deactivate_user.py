@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.application.auth.sessions import DeactivateUserCommand, DeactivateUserUseCase
+from backend.infrastructure.repositories.users import SqlAlchemyUsersUnitOfWork
+from backend.infrastructure.services.revocation import SessionRevocationList
+
+
+# Deactivates an account and ends all of its sessions.
+#
+#   python -m backend.scripts.deactivate_user --email someone@example.com
+#
+# Refresh tokens are revoked in the database. Access tokens already issued are
+# pushed to the shared denylist in Redis, which running backends pick up within
+# a few seconds; without REDIS_URL they stay valid until ACCESS_TOKEN_EXPIRES_MIN.
+
+
+async def run(database_url: str, email: str) -> None:
+    engine = create_async_engine(database_url, echo=False, future=True)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    revocations = SessionRevocationList(
+        ttl_seconds=int(os.getenv("ACCESS_TOKEN_EXPIRES_MIN", "15")) * 60,
+        redis_url=os.getenv("REDIS_URL"),
+    )
+
+    async with session_factory() as session:
+        uow = SqlAlchemyUsersUnitOfWork(session)
+        user = await uow.users.get_by_email(email)
+        if user is None:
+            raise SystemExit(f"no user with email {email}")
+        result = await DeactivateUserUseCase(uow=uow, revocations=revocations).execute(
+            DeactivateUserCommand(user_id=user.id)
+        )
+
+    await engine.dispose()
+    print(f"deactivated {result.user.id.value} revoked_sessions={result.revoked_sessions}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Deactivate a user and revoke their sessions")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--email", required=True)
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("DATABASE_URL is not set")
+    asyncio.run(run(args.database_url, args.email))
+
+
+if __name__ == "__main__":
+    main()
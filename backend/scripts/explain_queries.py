@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+
+from backend.domain.users.entities import UserId
+from backend.domain.wishlists.entities import PublicShareToken, WishlistId, WishlistItemId
+from backend.infrastructure.db.models import (
+    PublicWishlistShareModel,
+    UserModel,
+    WishlistItemCommentModel,
+    WishlistItemModel,
+    WishlistModel,
+)
+from backend.infrastructure.repositories.users import SqlAlchemyUsersUnitOfWork
+from backend.infrastructure.repositories.wishlists import SqlAlchemyWishlistsUnitOfWork
+
+
+# Runs every read query issued by the SQLAlchemy repositories against a live
+# database and prints its EXPLAIN (ANALYZE, BUFFERS) plan.
+#
+#   python -m backend.scripts.explain_queries [--database-url URL]
+#
+# Sample keys are picked from the busiest rows so the plans reflect real
+# cardinalities. Everything runs in a transaction that is rolled back.
+
+
+_Probe = Callable[[], Awaitable[Any]]
+
+
+class _StatementRecorder:
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, Any]] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.statements.append((statement, parameters))
+
+
+async def _scalar(session: AsyncSession, stmt) -> Any:
+    result = await session.execute(stmt.limit(1))
+    return result.scalar_one_or_none()
+
+
+async def _sample_keys(session: AsyncSession) -> dict[str, Any]:
+    owner_id = await _scalar(
+        session,
+        select(WishlistModel.owner_id).group_by(WishlistModel.owner_id).order_by(text("count(*) DESC")),
+    )
+    wishlist_id = await _scalar(
+        session,
+        select(WishlistItemModel.wishlist_id).group_by(WishlistItemModel.wishlist_id).order_by(text("count(*) DESC")),
+    )
+    item_id = await _scalar(
+        session,
+        select(WishlistItemCommentModel.wishlist_item_id)
+        .group_by(WishlistItemCommentModel.wishlist_item_id)
+        .order_by(text("count(*) DESC")),
+    )
+    share = (await session.execute(select(PublicWishlistShareModel).limit(1))).scalar_one_or_none()
+    user = (await session.execute(select(UserModel).limit(1))).scalar_one_or_none()
+    return {
+        "owner_id": owner_id,
+        "wishlist_id": wishlist_id,
+        "item_id": item_id,
+        "share_token": share.token if share else None,
+        "share_wishlist_id": share.wishlist_id if share else None,
+        "user_id": user.id if user else None,
+        "email": user.email if user else None,
+    }
+
+
+def _build_probes(session: AsyncSession, keys: dict[str, Any]) -> list[tuple[str, _Probe]]:
+    users = SqlAlchemyUsersUnitOfWork(session)
+    wishlists = SqlAlchemyWishlistsUnitOfWork(session)
+    probes: list[tuple[str, _Probe]] = []
+
+    if keys["user_id"] is not None:
+        uid = UserId(value=keys["user_id"])
+        probes.append(("users.get_by_id", lambda: users.users.get_by_id(uid)))
+        probes.append(("users.get_by_email", lambda: users.users.get_by_email(keys["email"])))
+        probes.append(("profiles.get_by_user_id", lambda: users.profiles.get_by_user_id(uid)))
+    if keys["owner_id"] is not None:
+        owner = UserId(value=keys["owner_id"])
+        probes.append(("wishlists.list_by_owner", lambda: wishlists.wishlists.list_by_owner(owner)))
+    if keys["wishlist_id"] is not None:
+        wid = WishlistId(value=keys["wishlist_id"])
+        probes.append(("wishlists.get_by_id", lambda: wishlists.wishlists.get_by_id(wid)))
+        probes.append(("items.list_by_wishlist", lambda: wishlists.items.list_by_wishlist(wid)))
+    if keys["item_id"] is not None:
+        iid = WishlistItemId(value=keys["item_id"])
+        probes.append(("items.get_by_id", lambda: wishlists.items.get_by_id(iid)))
+        probes.append(("comments.list_by_item_ids", lambda: wishlists.comments.list_by_item_ids([iid])))
+    if keys["share_token"] is not None:
+        token = PublicShareToken(keys["share_token"])
+        share_wid = WishlistId(value=keys["share_wishlist_id"])
+        probes.append(("shares.get_by_token", lambda: wishlists.shares.get_by_token(token)))
+        probes.append(("shares.get_by_wishlist_id", lambda: wishlists.shares.get_by_wishlist_id(share_wid)))
+    return probes
+
+
+async def _explain(conn: AsyncConnection, statement: str, parameters: Any) -> list[str]:
+    result = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+    return [row[0] for row in result]
+
+
+async def run(database_url: str) -> None:
+    engine = create_async_engine(database_url, echo=False, future=True)
+    recorder = _StatementRecorder()
+
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False)
+        try:
+            keys = await _sample_keys(session)
+            probes = _build_probes(session, keys)
+            if not probes:
+                print("No data to sample; seed the database first.")
+                return
+
+            captured: list[tuple[str, list[tuple[str, Any]]]] = []
+            event.listen(engine.sync_engine, "before_cursor_execute", recorder)
+            try:
+                for label, probe in probes:
+                    recorder.statements = []
+                    await probe()
+                    captured.append((label, recorder.statements))
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", recorder)
+
+            for label, statements in captured:
+                for statement, parameters in statements:
+                    print(f"=== {label} ===")
+                    print(statement.strip())
+                    for line in await _explain(conn, statement, parameters):
+                        print(f"  {line}")
+                    print()
+        finally:
+            await session.close()
+            await trans.rollback()
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Print EXPLAIN ANALYZE plans for repository queries")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("DATABASE_URL is not set")
+    asyncio.run(run(args.database_url))
+
+
+if __name__ == "__main__":
+    main()
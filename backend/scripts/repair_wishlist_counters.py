@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func, or_, select, true, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.infrastructure.db.models import WishlistItemCommentModel, WishlistItemModel, WishlistModel
+
+
+# Re-derives the denormalized wishlist counters from the item and comment rows
+# and fixes any that drifted, one keyset-paginated batch per transaction.
+#
+#   python -m backend.scripts.repair_wishlist_counters [--batch-size 500] [--dry-run]
+#
+# Each batch locks its wishlist rows first, so concurrent adjust_counters()
+# calls wait for the repair instead of racing it.
+
+
+async def _lock_batch(session: AsyncSession, after: Optional[UUID], batch_size: int) -> list[UUID]:
+    stmt = (
+        select(WishlistModel.id)
+        .where(WishlistModel.id > after if after is not None else true())
+        .order_by(WishlistModel.id)
+        .limit(batch_size)
+        .with_for_update()
+    )
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def _repair_batch(session: AsyncSession, ids: list[UUID]) -> list[UUID]:
+    items = (
+        select(
+            WishlistItemModel.wishlist_id,
+            func.count().label("item_count"),
+            func.count().filter(WishlistItemModel.is_received).label("received_count"),
+        )
+        .where(WishlistItemModel.wishlist_id.in_(ids))
+        .group_by(WishlistItemModel.wishlist_id)
+        .subquery()
+    )
+    comments = (
+        select(WishlistItemModel.wishlist_id, func.count().label("comment_count"))
+        .join(WishlistItemCommentModel, WishlistItemCommentModel.wishlist_item_id == WishlistItemModel.id)
+        .where(WishlistItemModel.wishlist_id.in_(ids))
+        .group_by(WishlistItemModel.wishlist_id)
+        .subquery()
+    )
+    actual = (
+        select(
+            WishlistModel.id,
+            func.coalesce(items.c.item_count, 0).label("item_count"),
+            func.coalesce(items.c.received_count, 0).label("received_count"),
+            func.coalesce(comments.c.comment_count, 0).label("comment_count"),
+        )
+        .outerjoin(items, items.c.wishlist_id == WishlistModel.id)
+        .outerjoin(comments, comments.c.wishlist_id == WishlistModel.id)
+        .where(WishlistModel.id.in_(ids))
+        .subquery()
+    )
+
+    table = WishlistModel.__table__
+    stmt = (
+        update(table)
+        .where(
+            table.c.id == actual.c.id,
+            or_(
+                table.c.item_count != actual.c.item_count,
+                table.c.received_count != actual.c.received_count,
+                table.c.comment_count != actual.c.comment_count,
+                table.c.last_activity_at.is_(None),
+            ),
+        )
+        .values(
+            item_count=actual.c.item_count,
+            received_count=actual.c.received_count,
+            comment_count=actual.c.comment_count,
+            last_activity_at=func.coalesce(table.c.last_activity_at, table.c.updated_at),
+        )
+        .returning(table.c.id)
+    )
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def run(database_url: str, batch_size: int, dry_run: bool) -> None:
+    engine = create_async_engine(database_url, echo=False, future=True)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    after: Optional[UUID] = None
+    scanned = repaired = 0
+    while True:
+        async with session_factory() as session:
+            ids = await _lock_batch(session, after, batch_size)
+            if not ids:
+                break
+            drifted = await _repair_batch(session, ids)
+            if dry_run:
+                await session.rollback()
+            else:
+                await session.commit()
+
+        for wishlist_id in drifted:
+            print(f"{'would repair' if dry_run else 'repaired'} {wishlist_id}")
+        scanned += len(ids)
+        repaired += len(drifted)
+        after = ids[-1]
+
+    await engine.dispose()
+    print(f"scanned={scanned} {'drifted' if dry_run else 'repaired'}={repaired}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Verify and repair denormalized wishlist counters")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true", help="report drift without writing")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("DATABASE_URL is not set")
+    asyncio.run(run(args.database_url, args.batch_size, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
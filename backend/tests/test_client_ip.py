@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+from starlette.requests import Request
+
+from backend.presentation import rate_limiter
+from backend.presentation.rate_limiter import _get_client_ip, _parse_trusted_proxies
+
+
+def _request(peer: str, forwarded_for: str | None = None) -> Request:
+    headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers, "client": (peer, 1234)})
+
+
+@pytest.fixture
+def trust(monkeypatch: pytest.MonkeyPatch):
+    def set_trusted(value: str) -> None:
+        monkeypatch.setattr(rate_limiter, "_trusted_proxies", _parse_trusted_proxies(value))
+        monkeypatch.setattr(rate_limiter, "_warned_untrusted_forwarding", False)
+
+    return set_trusted
+
+
+def test_spoofed_leftmost_hop_is_ignored(trust) -> None:
+    trust("172.16.0.0/12")
+    # The client sent "1.1.1.1" itself; Traefik appended the real address
+    assert _get_client_ip(_request("172.18.0.2", "1.1.1.1, 203.0.113.7")) == "203.0.113.7"
+
+
+def test_trusted_chain_is_walked_to_the_first_untrusted_hop(trust) -> None:
+    trust("172.16.0.0/12, 10.0.0.0/8")
+    assert _get_client_ip(_request("172.18.0.2", "203.0.113.7, 10.1.2.3")) == "203.0.113.7"
+
+
+def test_untrusted_peer_cannot_forward(trust) -> None:
+    trust("172.16.0.0/12")
+    assert _get_client_ip(_request("198.51.100.4", "203.0.113.7")) == "198.51.100.4"
+
+
+def test_empty_allowlist_uses_the_peer_and_warns_once(trust, caplog: pytest.LogCaptureFixture) -> None:
+    trust("")
+    with caplog.at_level(logging.WARNING, logger=rate_limiter.__name__):
+        assert _get_client_ip(_request("172.18.0.2", "203.0.113.7")) == "172.18.0.2"
+        assert _get_client_ip(_request("172.18.0.2", "203.0.113.8")) == "172.18.0.2"
+    assert len(caplog.records) == 1
+    assert "RATE_LIMIT_TRUSTED_PROXIES" in caplog.records[0].getMessage()
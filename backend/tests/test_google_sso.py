@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from typing import Any
+from uuid import uuid4
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from backend.infrastructure.services.sso import google
+from backend.infrastructure.services.sso.google import GoogleOAuthClient
+
+CLIENT_ID = "client-id"
+
+
+def _rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+class StubIssuer:
+    """A stand-in OpenID provider serving discovery, JWKS, token and userinfo."""
+
+    def __init__(self) -> None:
+        self.issuer = f"http://issuer-{uuid4().hex}.test"
+        self.key = _rsa_key()
+        self.kid = "stub-key"
+        self.id_token = ""
+        self.calls: Counter[str] = Counter()
+        self.app = Starlette(
+            routes=[
+                Route("/.well-known/openid-configuration", self._discovery),
+                Route("/jwks", self._jwks),
+                Route("/token", self._token, methods=["POST"]),
+                Route("/userinfo", self._userinfo),
+            ]
+        )
+
+    def sign(self, key: Any = None, **overrides: Any) -> str:
+        now = int(time.time())
+        claims = {
+            "iss": self.issuer,
+            "aud": CLIENT_ID,
+            "sub": "1234",
+            "iat": now,
+            "exp": now + 300,
+            "email": "person@example.com",
+            "email_verified": True,
+            "name": "Person",
+            **overrides,
+        }
+        return jwt.encode(claims, key or self.key, algorithm="RS256", headers={"kid": self.kid})
+
+    async def _discovery(self, request: Request) -> JSONResponse:
+        self.calls["discovery"] += 1
+        return JSONResponse(
+            {
+                "issuer": self.issuer,
+                "authorization_endpoint": f"{self.issuer}/auth",
+                "token_endpoint": f"{self.issuer}/token",
+                "userinfo_endpoint": f"{self.issuer}/userinfo",
+                "jwks_uri": f"{self.issuer}/jwks",
+                "id_token_signing_alg_values_supported": ["RS256"],
+            },
+            headers={"Cache-Control": "public, max-age=3600"},
+        )
+
+    async def _jwks(self, request: Request) -> JSONResponse:
+        self.calls["jwks"] += 1
+        jwk = RSAAlgorithm.to_jwk(self.key.public_key(), as_dict=True)
+        return JSONResponse(
+            {"keys": [{**jwk, "kid": self.kid, "use": "sig", "alg": "RS256"}]},
+            headers={"Cache-Control": "public, max-age=3600"},
+        )
+
+    async def _token(self, request: Request) -> JSONResponse:
+        self.calls["token"] += 1
+        return JSONResponse({"access_token": "access", "id_token": self.id_token, "token_type": "Bearer"})
+
+    async def _userinfo(self, request: Request) -> JSONResponse:
+        self.calls["userinfo"] += 1
+        return JSONResponse({"email": "person@example.com", "email_verified": True})
+
+
+@pytest.fixture
+def stub(monkeypatch: pytest.MonkeyPatch) -> StubIssuer:
+    stub = StubIssuer()
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=stub.app))
+    monkeypatch.setattr(google, "_http_client", client)
+    return stub
+
+
+def _callback(stub: StubIssuer, id_token: str) -> google.GoogleUserInfo:
+    stub.id_token = id_token
+    oauth = GoogleOAuthClient(client_id=CLIENT_ID, client_secret="secret", issuer=stub.issuer)
+    return asyncio.run(oauth.fetch_userinfo(code="code"))
+
+
+def test_warm_callback_makes_one_remote_call(stub: StubIssuer) -> None:
+    first = _callback(stub, stub.sign())
+    assert first.email == "person@example.com"
+    assert first.email_verified is True
+    assert stub.calls == Counter(discovery=1, jwks=1, token=1)
+
+    stub.calls.clear()
+    _callback(stub, stub.sign())
+    assert stub.calls == Counter(token=1)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"key": _rsa_key()},
+        {"aud": "someone-else"},
+        {"iss": "http://other-issuer.test"},
+    ],
+    ids=["signature", "aud", "iss"],
+)
+def test_invalid_id_token_is_rejected(stub: StubIssuer, overrides: dict[str, Any]) -> None:
+    with pytest.raises(jwt.PyJWTError):
+        _callback(stub, stub.sign(**overrides))
+    assert stub.calls["userinfo"] == 0
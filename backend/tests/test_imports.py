@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from uuid import uuid4
+
+import pytest
+
+from backend.application.wishlists.use_cases import (
+    ImportRow,
+    ImportWishlistsCommand,
+    ImportWishlistsResult,
+    ImportWishlistsUseCase,
+)
+from backend.domain.users.entities import UserId
+from backend.domain.wishlists.entities import (
+    Wishlist,
+    WishlistId,
+    WishlistItem,
+    WishlistItemId,
+    WishlistVisibility,
+)
+from backend.presentation.exports import csv_chunks, ndjson_chunks
+from backend.presentation.imports import csv_rows, ndjson_rows
+
+Decoder = Callable[[AsyncIterator[bytes]], AsyncIterator[ImportRow]]
+
+
+class _FakeWishlists:
+    def __init__(self) -> None:
+        self.added: list[Wishlist] = []
+
+    async def add_many(self, wishlists: list[Wishlist]) -> None:
+        self.added.extend(wishlists)
+
+    async def adjust_counters(self, wishlist_id: WishlistId, items: int = 0, received: int = 0, comments: int = 0) -> None:
+        pass
+
+
+class _FakeItems:
+    def __init__(self) -> None:
+        self.added: list[WishlistItem] = []
+        self.batches: list[int] = []
+
+    async def add_many(self, items: list[WishlistItem]) -> None:
+        self.added.extend(items)
+        self.batches.append(len(items))
+
+
+class _FakeUnitOfWork:
+    def __init__(self) -> None:
+        self.wishlists = _FakeWishlists()
+        self.items = _FakeItems()
+
+    async def __aenter__(self) -> "_FakeUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+
+async def _chunked(data: bytes, size: int = 7) -> AsyncIterator[bytes]:
+    # Small chunks split lines, quoted records and multi-byte characters
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def _iterate(records: list) -> AsyncIterator:
+    for record in records:
+        yield record
+
+
+def _decode(decoder: Decoder, data: bytes) -> list[ImportRow]:
+    async def collect() -> list[ImportRow]:
+        return [row async for row in decoder(_chunked(data))]
+
+    return asyncio.run(collect())
+
+
+def _import(rows: list[ImportRow], **options) -> tuple[_FakeUnitOfWork, ImportWishlistsResult]:
+    uow = _FakeUnitOfWork()
+    cmd = ImportWishlistsCommand(owner_id=UserId(value=uuid4()), rows=_iterate(rows), **options)
+    return uow, asyncio.run(ImportWishlistsUseCase(uow=uow).execute(cmd))
+
+
+def test_csv_quoted_field_spans_lines() -> None:
+    data = 'wishlist_name,title,description\nBooks,Dune,"Two\nlines, and ""quotes"""\nBooks,Emma,\n'.encode()
+    rows = _decode(csv_rows, data)
+
+    assert [(row.line, row.title, row.description) for row in rows] == [
+        (2, "Dune", 'Two\nlines, and "quotes"'),
+        (4, "Emma", ""),
+    ]
+
+
+def test_csv_byte_order_mark_is_dropped() -> None:
+    rows = _decode(csv_rows, "\ufeffwishlist_name,title\nLivres,Éclair\n".encode())
+
+    assert [(row.wishlist_name, row.title) for row in rows] == [("Livres", "Éclair")]
+
+
+@pytest.mark.parametrize("decoder", [csv_rows, ndjson_rows])
+def test_invalid_utf8_is_rejected(decoder: Decoder) -> None:
+    with pytest.raises(ValueError, match="not valid UTF-8"):
+        _decode(decoder, b"wishlist_name,title\nBooks,\xff\xfe\n")
+
+
+def test_csv_column_count_mismatch_is_reported_per_row() -> None:
+    rows = _decode(csv_rows, b"wishlist_name,title\nBooks,Dune,extra\nBooks,Emma\n")
+
+    assert rows[0].error == "Expected 2 columns, got 3"
+    assert rows[0].line == 2
+    assert rows[1].error is None and rows[1].title == "Emma"
+
+
+def test_csv_unterminated_quote_is_reported() -> None:
+    rows = _decode(csv_rows, b'wishlist_name,title\nBooks,"Dune\n')
+
+    assert [(row.line, row.error) for row in rows] == [(2, "Unterminated quoted field")]
+
+
+def test_ndjson_reports_bad_lines_and_skips_comments() -> None:
+    data = b'{"type":"wishlist","id":"w","name":"Books"}\nnot json\n[1]\n{"type":"comment"}\n{"type":"gift"}\n'
+    rows = _decode(ndjson_rows, data)
+
+    assert [(row.line, row.error) for row in rows] == [
+        (1, None),
+        (2, "Invalid JSON"),
+        (3, "Expected a JSON object"),
+        (5, "Unknown record type: gift"),
+    ]
+
+
+def _account() -> list:
+    books = Wishlist(
+        id=WishlistId.new(),
+        owner_id=UserId(value=uuid4()),
+        name="Books, mostly",
+        description='Say "please"\nor not',
+        visibility=WishlistVisibility.PUBLIC,
+    )
+    empty = Wishlist(id=WishlistId.new(), owner_id=books.owner_id, name="Empty")
+    items = [
+        WishlistItem(
+            id=WishlistItemId.new(),
+            wishlist_id=books.id,
+            title="Dune",
+            description="Multi\nline",
+            link="https://example.com/dune",
+            priority=3,
+            is_received=True,
+            received_note="Thanks!",
+        ),
+        WishlistItem(id=WishlistItemId.new(), wishlist_id=books.id, title="Émile"),
+    ]
+    return [books, empty, *items]
+
+
+def _exported(chunks: Callable[[AsyncIterator], AsyncIterator[bytes]], records: list) -> bytes:
+    async def collect() -> bytes:
+        return b"".join([chunk async for chunk in chunks(_iterate(records))])
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize(("encoder", "decoder"), [(csv_chunks, csv_rows), (ndjson_chunks, ndjson_rows)])
+def test_export_import_round_trip(encoder, decoder: Decoder) -> None:
+    records = _account()
+    uow, result = _import(_decode(decoder, _exported(encoder, records)))
+
+    assert result.rows_failed == 0
+    assert sorted((w.name, w.description, w.visibility) for w in uow.wishlists.added) == sorted(
+        (w.name, w.description, w.visibility) for w in records[:2]
+    )
+    fields = ("title", "description", "link", "priority", "is_received", "received_note")
+    assert [tuple(getattr(item, f) for f in fields) for item in uow.items.added] == [
+        tuple(getattr(item, f) for f in fields) for item in records[2:]
+    ]
+    names = {w.id: w.name for w in uow.wishlists.added}
+    assert {names[item.wishlist_id] for item in uow.items.added} == {"Books, mostly"}
+
+
+def test_large_rows_flush_batches_early() -> None:
+    rows = [
+        ImportRow(line=n, wishlist_key="w", wishlist_name="Books", title=f"Item {n}", description="x" * 1000)
+        for n in range(1, 11)
+    ]
+    uow, result = _import(rows, batch_size=1000, batch_chars=3000)
+
+    assert result.items_created == 10
+    assert uow.items.batches == [3, 3, 3, 1]
+
+
+def test_csv_export_skips_items_without_their_wishlist() -> None:
+    books, empty, dune, emile = _account()
+    orphan = WishlistItem(id=WishlistItemId.new(), wishlist_id=WishlistId.new(), title="Orphan")
+    rows = _decode(csv_rows, _exported(csv_chunks, [books, empty, dune, orphan, emile]))
+
+    assert [row.title for row in rows] == ["Dune", "Émile", ""]
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+
+import pytest
+
+from backend.infrastructure.services.rate_limiting.leased import LeasedRateLimiter
+from backend.infrastructure.services.rate_limiting.memory import InMemoryRateLimiter
+
+LIMIT = 300
+WINDOW = 60
+FRACTION = 0.1
+WORKERS = 4
+BATCH = int(LIMIT * FRACTION)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    return clock
+
+
+def _workers(backend: InMemoryRateLimiter) -> list[LeasedRateLimiter]:
+    return [LeasedRateLimiter(backend, lease_fraction=FRACTION, max_keys=100) for _ in range(WORKERS)]
+
+
+def _drive(clock: _Clock, workers: list[LeasedRateLimiter], interval: float, duration: float) -> list[tuple[float, bool]]:
+    async def run() -> list[tuple[float, bool]]:
+        hits = []
+        end = clock.now + duration
+        turn = 0
+        while clock.now < end:
+            decision = await workers[turn % len(workers)].hit("client", LIMIT, WINDOW)
+            hits.append((clock.now, decision.allowed))
+            turn += 1
+            clock.now += interval
+        return hits
+
+    return asyncio.run(run())
+
+
+def _backend_calls(workers: list[LeasedRateLimiter]) -> int:
+    return sum(worker.stats().backend_calls for worker in workers)
+
+
+def test_low_rate_client_costs_one_backend_call_per_lease(clock: _Clock) -> None:
+    workers = _workers(InMemoryRateLimiter(max_keys=100))
+    # A tenth of the limit, round-robin over the workers, for ten windows
+    hits = _drive(clock, workers, interval=WINDOW / (LIMIT / 10), duration=10 * WINDOW)
+
+    assert all(allowed for _, allowed in hits)
+    # Each worker renews when its lease runs dry or its window passes
+    per_worker = len(hits) / WORKERS
+    assert _backend_calls(workers) <= WORKERS * (per_worker / BATCH + 10 + 1)
+    assert _backend_calls(workers) < len(hits) / 5
+
+
+def _busiest_window(hits: list[tuple[float, bool]]) -> int:
+    window: deque[float] = deque()
+    busiest = 0
+    for at, allowed in hits:
+        if not allowed:
+            continue
+        window.append(at)
+        while window[0] <= at - WINDOW:
+            window.popleft()
+        busiest = max(busiest, len(window))
+    return busiest
+
+
+def test_admissions_stay_within_one_lease_per_worker_of_exact(clock: _Clock) -> None:
+    start = clock.now
+    # Twice the limit for ten windows, once exact and once through leases
+    exact = _drive(clock, [InMemoryRateLimiter(max_keys=100)], interval=WINDOW / (2 * LIMIT), duration=10 * WINDOW)
+    clock.now = start + 100 * WINDOW
+    leased = _drive(clock, _workers(InMemoryRateLimiter(max_keys=100)), interval=WINDOW / (2 * LIMIT), duration=10 * WINDOW)
+
+    bound = WORKERS * BATCH
+    admitted_exact = sum(allowed for _, allowed in exact)
+    admitted_leased = sum(allowed for _, allowed in leased)
+    assert abs(admitted_leased - admitted_exact) <= bound
+    assert _busiest_window(leased) <= _busiest_window(exact) + bound
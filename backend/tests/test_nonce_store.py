@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from backend.infrastructure.services.sso.state import NonceStore, OAuthStateService
+
+
+class _HangingRedis:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def set(self, *args, **kwargs) -> bool:
+        self.calls += 1
+        await asyncio.sleep(3600)
+        return True
+
+
+def test_replayed_state_is_rejected() -> None:
+    service = OAuthStateService(secret="test-secret", nonce_store=NonceStore())
+    state = service.create_state(frontend_callback_url="http://localhost:3000/sso/google/callback")
+
+    async def consume_twice() -> None:
+        payload = await service.consume_state(state)
+        assert payload["cb"] == "http://localhost:3000/sso/google/callback"
+        with pytest.raises(ValueError, match="already used"):
+            await service.consume_state(state)
+
+    asyncio.run(consume_twice())
+
+
+def test_expired_nonces_are_evicted(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = NonceStore()
+    now = 1_000_000.0
+    monkeypatch.setattr(time, "time", lambda: now)
+
+    assert store._consume_local("a", now + 60)
+    assert store._consume_local("b", now + 120)
+    assert not store._consume_local("a", now + 60)
+
+    now += 90
+    assert store._consume_local("c", now + 60)
+    # "a" expired and was dropped; "b" is still remembered
+    assert list(store._seen) == ["b", "c"]
+    assert not store._consume_local("b", now + 30)
+
+
+def test_slow_redis_falls_back_to_local() -> None:
+    store = NonceStore(timeout=0.01)
+    client = _HangingRedis()
+    store._client = client
+    expires_at = time.time() + 60
+
+    async def consume_twice() -> tuple[bool, bool]:
+        return await store.consume("nonce", expires_at), await store.consume("nonce", expires_at)
+
+    assert asyncio.run(consume_twice()) == (True, False)
+    assert client.calls == 2
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+from backend.domain.users.entities import UserId
+from backend.domain.wishlists.entities import Wishlist, WishlistId, WishlistItem, WishlistItemId
+from backend.domain.wishlists.ranking import rank_after, rank_between
+
+
+def _append(wishlist: Wishlist, count: int) -> list[str]:
+    for index in range(count):
+        wishlist.add_item(WishlistItem(id=WishlistItemId.new(), wishlist_id=wishlist.id, title=f"Item {index}"))
+    return [item.position for item in wishlist.items]
+
+
+def test_appended_keys_stay_short_and_ordered() -> None:
+    wishlist = Wishlist(id=WishlistId.new(), owner_id=UserId(uuid4()), name="Birthday")
+    keys = _append(wishlist, 500)
+
+    assert keys == sorted(keys)
+    assert len(set(keys)) == len(keys)
+    # The position column is String(64)
+    assert max(map(len, keys)) <= 3
+
+
+def test_rank_after_widens_only_when_the_width_is_exhausted() -> None:
+    assert rank_after("zzz") == "zzz001"
+    assert rank_after("V0z") == "V1"
+    assert rank_after("V1") == "V11"
+
+
+def test_moves_still_fit_between_appended_keys() -> None:
+    lower = rank_after(None)
+    upper = rank_after(lower)
+    assert lower < rank_between(lower, upper) < upper
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from backend.application.auth.sessions import (
+    REFRESH_REUSE_GRACE_SECONDS,
+    RefreshSessionCommand,
+    RefreshSessionUseCase,
+    RefreshTokenSuperseded,
+    issue_session_tokens,
+)
+from backend.domain.users.entities import RefreshToken, User, UserId
+from backend.infrastructure.services.security import JwtTokenService
+
+
+class _Tokens:
+    def __init__(self) -> None:
+        self.by_hash: dict[str, RefreshToken] = {}
+
+    async def get_by_hash(self, token_hash: str, for_update: bool = False) -> RefreshToken | None:
+        token = self.by_hash.get(token_hash)
+        return replace(token) if token else None
+
+    async def add(self, token: RefreshToken) -> None:
+        self.by_hash[token.token_hash] = token
+
+    async def update(self, token: RefreshToken) -> None:
+        self.by_hash[token.token_hash] = token
+
+    async def has_active_token(self, session_id: UUID) -> bool:
+        now = datetime.now(timezone.utc)
+        return any(t.session_id == session_id and not t.is_revoked and t.expires_at > now for t in self.by_hash.values())
+
+    async def revoke_session(self, session_id: UUID) -> None:
+        for token in self.by_hash.values():
+            if token.session_id == session_id:
+                token.revoke()
+
+
+class _Users:
+    def __init__(self, user: User) -> None:
+        self.user = user
+
+    async def get_by_id(self, user_id: UserId) -> User | None:
+        return self.user if user_id == self.user.id else None
+
+
+class _Profiles:
+    async def get_by_user_id(self, user_id: UserId) -> None:
+        return None
+
+
+class _UoW:
+    def __init__(self, user: User) -> None:
+        self.users = _Users(user)
+        self.profiles = _Profiles()
+        self.refresh_tokens = _Tokens()
+
+    async def __aenter__(self) -> "_UoW":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+
+class _Revocations:
+    def __init__(self) -> None:
+        self.revoked: list[UUID] = []
+
+    async def revoke_sessions(self, session_ids) -> None:
+        self.revoked.extend(session_ids)
+
+
+@pytest.fixture
+def setup():
+    user = User(id=UserId(uuid4()), email="person@example.com", password_hash="x")
+    uow = _UoW(user)
+    tokens = JwtTokenService(secret_key="test")
+    revocations = _Revocations()
+    first = asyncio.run(issue_session_tokens(uow, tokens, user.id, None))
+    return uow, RefreshSessionUseCase(uow=uow, token_service=tokens, revocations=revocations), revocations, first
+
+
+def _refresh(use_case: RefreshSessionUseCase, token: str):
+    return asyncio.run(use_case.execute(RefreshSessionCommand(refresh_token=token)))
+
+
+def test_token_rotated_moments_ago_is_superseded_not_a_leak(setup) -> None:
+    uow, use_case, revocations, first = setup
+    second = _refresh(use_case, first.refresh_token).token
+
+    with pytest.raises(RefreshTokenSuperseded):
+        _refresh(use_case, first.refresh_token)
+    assert revocations.revoked == []
+    # The session lives on: the newest token still rotates
+    assert _refresh(use_case, second.refresh_token).token.refresh_token
+
+
+def test_reuse_after_the_grace_window_ends_the_session(setup) -> None:
+    uow, use_case, revocations, first = setup
+    _refresh(use_case, first.refresh_token)
+    for token in uow.refresh_tokens.by_hash.values():
+        if token.revoked_at is not None:
+            token.revoked_at -= timedelta(seconds=REFRESH_REUSE_GRACE_SECONDS + 1)
+
+    with pytest.raises(ValueError) as excinfo:
+        _refresh(use_case, first.refresh_token)
+    assert not isinstance(excinfo.value, RefreshTokenSuperseded)
+    assert len(revocations.revoked) == 1
+    assert not asyncio.run(uow.refresh_tokens.has_active_token(revocations.revoked[0]))
+
+
+def test_logged_out_session_gets_no_grace(setup) -> None:
+    uow, use_case, revocations, first = setup
+    second = _refresh(use_case, first.refresh_token).token
+    session_id = next(iter(uow.refresh_tokens.by_hash.values())).session_id
+    asyncio.run(uow.refresh_tokens.revoke_session(session_id))
+
+    with pytest.raises(ValueError) as excinfo:
+        _refresh(use_case, first.refresh_token)
+    assert not isinstance(excinfo.value, RefreshTokenSuperseded)
+    assert second.refresh_token
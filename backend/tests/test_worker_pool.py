@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.infrastructure.services.worker_pool import BoundedWorkerPool, WorkerPoolFull
+
+
+def test_full_queue_rejects_and_cancelled_calls_are_dequeued() -> None:
+    pool = BoundedWorkerPool(max_workers=1, max_queued=2)
+    release = threading.Event()
+
+    async def scenario() -> None:
+        running = asyncio.create_task(pool.run(release.wait))
+        waiting = [asyncio.create_task(pool.run(lambda: None)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        assert pool.stats().running == 1
+        assert pool.stats().queued == 2
+
+        with pytest.raises(WorkerPoolFull):
+            await pool.run(lambda: None)
+
+        waiting[0].cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting[0]
+        assert pool.stats().queued == 1
+
+        release.set()
+        await asyncio.gather(running, waiting[1])
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        release.set()
+        pool.shutdown()
+
+    stats = pool.stats()
+    assert (stats.queued, stats.running, stats.rejected, stats.peak_queued, stats.completed) == (0, 0, 1, 2, 2)
+
+
+def test_full_pool_maps_to_503() -> None:
+    from backend.presentation.app import app
+
+    probe = FastAPI()
+    probe.exception_handlers.update(app.exception_handlers)
+
+    @probe.get("/busy")
+    async def busy() -> None:
+        raise WorkerPoolFull("busy")
+
+    response = TestClient(probe).get("/busy")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
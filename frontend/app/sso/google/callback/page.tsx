@@ -22,7 +22,9 @@ export default function GoogleSsoCallbackPage() {
   useEffect(() => {
     if (typeof window === 'undefined') return;
 
-    const { access_token, expires_at, error: err } = parseFragment(window.location.hash);
+    const { access_token, expires_at, refresh_token, refresh_expires_at, error: err } = parseFragment(
+      window.location.hash,
+    );
 
     if (err) {
       clearToken();
@@ -40,6 +42,8 @@ export default function GoogleSsoCallbackPage() {
       access_token,
       token_type: 'bearer',
       expires_at,
+      refresh_token: refresh_token || null,
+      refresh_expires_at: refresh_expires_at || null,
     };
 
     saveToken(token, true);
@@ -5,7 +5,8 @@ import { useState, useEffect } from 'react';
 import { useRouter } from 'next/navigation';
 import { useTranslation } from 'react-i18next';
 import { AuthModal } from './AuthModal';
-import { clearToken, getToken } from '../lib/auth-storage';
+import { logout } from '../lib/api';
+import { getToken } from '../lib/auth-storage';
 
 export function Header() {
   const [authOpen, setAuthOpen] = useState(false);
@@ -18,7 +19,7 @@ export function Header() {
   }, []);
 
   const handleLogout = () => {
-    clearToken();
+    void logout();
     setIsAuthenticated(false);
     router.replace('/');
   };
@@ -1,5 +1,7 @@
 import axios from 'axios';
+import type { AxiosError, InternalAxiosRequestConfig } from 'axios';
 import type { TokenResponse, UserResponse } from '../../shared/types/api';
+import { clearToken, getRefreshToken, getToken, replaceToken } from './auth-storage';
 
 export const API_BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL ?? 'http://localhost:8000';
 
@@ -26,3 +28,72 @@ export async function signUp(payload: SignUpPayload): Promise<UserResponse> {
   const res = await api.post<UserResponse>('/api/auth/signup', payload);
   return res.data;
 }
+
+export async function logout(): Promise<void> {
+  const refreshToken = getRefreshToken();
+  clearToken();
+  if (!refreshToken) return;
+  try {
+    await api.post('/api/auth/logout', { refresh_token: refreshToken });
+  } catch {
+    // Tokens are already gone locally; the session just expires server-side
+  }
+}
+
+// Access tokens are short-lived: on a 401, rotate the refresh token once and
+// replay the request. Concurrent failures in a tab share a single refresh
+// call, and a Web Lock serializes refreshes across tabs, which share the
+// stored refresh token.
+const REFRESH_LOCK = 'nextiwant_refresh';
+let refreshing: Promise<string | null> | null = null;
+
+function withRefreshLock<T>(fn: () => Promise<T>): Promise<T> {
+  if (typeof navigator !== 'undefined' && navigator.locks) {
+    return navigator.locks.request(REFRESH_LOCK, fn);
+  }
+  return fn();
+}
+
+async function refreshAccessToken(failedAccessToken: string): Promise<string | null> {
+  return withRefreshLock(async () => {
+    // Another tab may have rotated the tokens while this one waited
+    const current = getToken();
+    if (current && current !== failedAccessToken) return current;
+
+    const refreshToken = getRefreshToken();
+    if (!refreshToken) return null;
+    try {
+      const res = await axios.post<TokenResponse>(`${API_BASE_URL}/api/auth/refresh`, {
+        refresh_token: refreshToken,
+      });
+      replaceToken(res.data);
+      return res.data.access_token;
+    } catch (error) {
+      // 409: rotated moments ago elsewhere; use the successor if it reached storage
+      const latest = getToken();
+      if (axios.isAxiosError(error) && error.response?.status === 409 && getRefreshToken() !== refreshToken && latest) {
+        return latest;
+      }
+      clearToken();
+      return null;
+    }
+  });
+}
+
+api.interceptors.response.use(undefined, async (error: AxiosError) => {
+  const config = error.config as (InternalAxiosRequestConfig & { _retried?: boolean }) | undefined;
+  if (error.response?.status !== 401 || !config || config._retried || !config.headers?.Authorization) {
+    throw error;
+  }
+
+  const failedAccessToken = String(config.headers.Authorization).replace(/^Bearer /, '');
+  refreshing = refreshing ?? refreshAccessToken(failedAccessToken).finally(() => {
+    refreshing = null;
+  });
+  const accessToken = await refreshing;
+  if (!accessToken) throw error;
+
+  config._retried = true;
+  config.headers.Authorization = `Bearer ${accessToken}`;
+  return api.request(config);
+});
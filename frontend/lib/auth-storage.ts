@@ -2,20 +2,33 @@ import type { TokenResponse } from '../../shared/types/api';
 
 const ACCESS_TOKEN_KEY = 'nextiwant_access_token';
 const EXPIRES_AT_KEY = 'nextiwant_expires_at';
+const REFRESH_TOKEN_KEY = 'nextiwant_refresh_token';
 
 export function saveToken(token: TokenResponse, remember: boolean): void {
   if (typeof window === 'undefined') return;
   const storage = remember ? window.localStorage : window.sessionStorage;
   storage.setItem(ACCESS_TOKEN_KEY, token.access_token);
   storage.setItem(EXPIRES_AT_KEY, token.expires_at);
+  if (token.refresh_token) {
+    storage.setItem(REFRESH_TOKEN_KEY, token.refresh_token);
+  }
+}
+
+// Swap in a re-issued token wherever the current one is kept
+export function replaceToken(token: TokenResponse): void {
+  if (typeof window === 'undefined') return;
+  const remember = window.localStorage.getItem(ACCESS_TOKEN_KEY) !== null;
+  if (!remember && window.sessionStorage.getItem(ACCESS_TOKEN_KEY) === null) return;
+  saveToken(token, remember);
 }
 
 export function clearToken(): void {
   if (typeof window === 'undefined') return;
-  window.localStorage.removeItem(ACCESS_TOKEN_KEY);
-  window.localStorage.removeItem(EXPIRES_AT_KEY);
-  window.sessionStorage.removeItem(ACCESS_TOKEN_KEY);
-  window.sessionStorage.removeItem(EXPIRES_AT_KEY);
+  for (const storage of [window.localStorage, window.sessionStorage]) {
+    storage.removeItem(ACCESS_TOKEN_KEY);
+    storage.removeItem(EXPIRES_AT_KEY);
+    storage.removeItem(REFRESH_TOKEN_KEY);
+  }
 }
 
 export function getToken(): string | null {
@@ -23,3 +36,8 @@ export function getToken(): string | null {
   const token = window.localStorage.getItem(ACCESS_TOKEN_KEY) ?? window.sessionStorage.getItem(ACCESS_TOKEN_KEY);
   return token;
 }
+
+export function getRefreshToken(): string | null {
+  if (typeof window === 'undefined') return null;
+  return window.localStorage.getItem(REFRESH_TOKEN_KEY) ?? window.sessionStorage.getItem(REFRESH_TOKEN_KEY);
+}
@@ -4,11 +4,12 @@ import type {
   PublicUserProfileResponse,
   UserProfileResponse,
   UserProfileUpdateRequest,
+  UserProfileUpdateResponse,
   WishlistItemResponse,
   WishlistResponse,
   WishlistItemCommentResponse,
 } from '../../shared/types/api';
-import { getToken } from './auth-storage';
+import { getToken, replaceToken } from './auth-storage';
 
 function authHeaders() {
   const token = getToken();
@@ -25,10 +26,12 @@ export async function fetchProfile(): Promise<UserProfileResponse | null> {
 }
 
 export async function upsertProfile(payload: UserProfileUpdateRequest): Promise<UserProfileResponse> {
-  const res = await api.put<UserProfileResponse>('/api/users/me/profile', payload, {
+  const res = await api.put<UserProfileUpdateResponse>('/api/users/me/profile', payload, {
     headers: authHeaders(),
   });
-  return res.data;
+  const { token, ...profile } = res.data;
+  if (token) replaceToken(token);
+  return profile;
 }
 
 export async function fetchMyWishlists(): Promise<WishlistResponse[]> {
@@ -4,6 +4,12 @@ export interface TokenResponse {
   access_token: string;
   token_type: string;
   expires_at: string; // ISO datetime
+  refresh_token?: string | null;
+  refresh_expires_at?: string | null;
+}
+
+export interface RefreshTokenRequest {
+  refresh_token: string;
 }
 
 export interface UserResponse {
@@ -37,6 +43,23 @@ export interface UserProfileResponse {
   updated_at: string;
 }
 
+export interface UserProfileUpdateResponse extends UserProfileResponse {
+  token?: TokenResponse | null; // re-issued with the updated profile claims
+}
+
+export interface PeopleSearchHitResponse {
+  user_id: UUID;
+  name: string;
+  username?: string | null;
+  photo_url?: string | null;
+  profile_url: string;
+}
+
+export interface PeopleSearchResponse {
+  results: PeopleSearchHitResponse[];
+  timed_out: boolean;
+}
+
 export interface UserProfileUpdateRequest {
   username?: string | null;
   first_name?: string | null;
@@ -56,10 +79,16 @@ export interface WishlistItemResponse {
   priority?: number | null;
   is_received?: boolean;
   received_note?: string | null;
+  position?: string | null;
   created_at: string;
   updated_at: string;
 }
 
+export interface WishlistItemMoveRequest {
+  after_item_id?: UUID | null;
+  before_item_id?: UUID | null;
+}
+
 export interface WishlistResponse {
   id: UUID;
   owner_id: UUID;
@@ -69,6 +98,28 @@ export interface WishlistResponse {
   items: WishlistItemResponse[];
   created_at: string;
   updated_at: string;
+  item_count: number;
+  received_count: number;
+  comment_count: number;
+  last_activity_at?: string | null;
+}
+
+export type WishlistSearchScope = 'mine' | 'public';
+
+export interface WishlistSearchHitResponse {
+  kind: 'wishlist' | 'item';
+  wishlist_id: UUID;
+  owner_id: UUID;
+  item_id?: UUID | null;
+  title: string;
+  rank: number;
+}
+
+export interface WishlistSearchResponse {
+  results: WishlistSearchHitResponse[];
+  limit: number;
+  offset: number;
+  has_more: boolean;
 }
 
 export interface PublicShareResponse {